@@ -0,0 +1,11 @@
+"""
+Pacote de benchmarks do dashboard.
+
+Os scripts deste pacote medem o custo dos coletores e das estruturas de dados usadas
+a cada atualização e são executados como módulos, p.ex.:
+    python -m benchmarks.process_snapshot_memory
+
+A suíte `benchmarks.collectors` mede todos os coletores do `system_info_service` sobre
+um /proc sintético (`benchmarks.synthetic_proc`) e grava o resultado em JSON para
+comparação entre commits.
+"""
@@ -0,0 +1,70 @@
+"""
+Benchmark do coletor assíncrono contra a varredura serial.
+
+Para cada quantidade de processos, gera uma árvore /proc sintética e mede o tempo de
+parede da varredura serial (`scan_processes`) e do coletor asyncio (`AsyncProcCollector`)
+com diferentes limites de concorrência. As duas leem os mesmos arquivos de cada processo
+(status e stat; io somente com a coleta de I/O ativa), e a varredura serial não é
+dividida entre processos (`sharded=False`), mesmo acima de `SHARDED_SCAN_THRESHOLD`.
+
+Uso:
+    python -m benchmarks.async_collector --processes 1000 10000 50000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.synthetic_proc import build_proc_tree
+from services.async_collector import AsyncProcCollector
+from services.proc_source import DirectoryProcSource, LiveProcSource
+from services.system_info_service import ProcessCpuTracker, scan_processes
+
+
+def measure(function, repeat):
+    """
+    Executa `function` `repeat` vezes e retorna a mediana do tempo de parede (s).
+    """
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--processes", type=int, nargs="+", default=[1000, 10000, 50000],
+                        help="Quantidades de processos sintéticos")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[16, 64, 256],
+                        help="Limites de concorrência do coletor assíncrono")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetições por medição (mediana)")
+    parser.add_argument("--live", action="store_true", help="Mede também o /proc real")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        targets = [(f"{count} PIDs sintéticos", count) for count in args.processes]
+        if args.live:
+            targets.append(("/proc real", None))
+        for label, count in targets:
+            if count is None:
+                source = LiveProcSource()
+            else:
+                source = DirectoryProcSource(build_proc_tree(os.path.join(directory, str(count)), count))
+
+            serial = measure(lambda: scan_processes(ProcessCpuTracker(), source, sharded=False), args.repeat)
+            print(f"{label}")
+            print(f"  serial:                 {serial * 1000:9.1f} ms")
+            for concurrency in args.concurrency:
+                collector = AsyncProcCollector(concurrency, tracker=ProcessCpuTracker(), source=source)
+                elapsed = measure(lambda: asyncio.run(collector.scan()), args.repeat)
+                collector.executor.shutdown()
+                print(f"  asyncio (limite {concurrency:4d}): {elapsed * 1000:9.1f} ms  ({serial / elapsed:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Suíte de benchmarks dos coletores do `system_info_service`.
+
+Gera uma árvore /proc sintética (quantidade configurável de PIDs, threads, descritores e
+pontos de montagem), redireciona os coletores para ela com `set_proc_source` (lida do
+diretório ou, com --in-memory, de uma cópia em memória) e mede, para cada coletor:
+    - latência: percentis p50/p90/p99 e máximo de várias execuções (ms);
+    - alocações: pico e saldo de memória de uma execução, via `tracemalloc` (KB);
+    - chamadas de sistema de uma execução: aberturas e listagens de diretório (audit hooks
+      do Python) e leituras/escritas (contadores syscr/syscw de /proc/self/io).
+
+O resultado pode ser gravado em JSON e comparado com o de outra execução (p.ex. de outro
+commit) com --compare.
+
+Uso:
+    python -m benchmarks.collectors --pids 5000 --threads 4 --fds 16 --mounts 8 --json saida.json
+    python -m benchmarks.collectors --compare antes.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic_proc import build_directory, build_proc_tree, build_system_files
+from models.system_info_model import SystemInfo
+from services.system_info_service import (
+    fetch_active_processes,
+    fetch_cpu_info,
+    fetch_directory_info,
+    fetch_entries_metadata,
+    fetch_filesystem_info,
+    fetch_io_rates,
+    fetch_memory_info,
+    fetch_process_resources,
+    fetch_process_tasks,
+    get_process_scan,
+    ProcessIoTracker,
+    set_proc_source,
+    store_process_scan,
+)
+from services.proc_source import DirectoryProcSource, FakeProcSource
+from services.fd_service import FdTracker
+
+AUDITED_EVENTS = {"open": "open", "os.listdir": "listdir", "os.scandir": "listdir"}
+SCREEN_ENTRIES = 100  # Entradas cujos metadados a aba de arquivos consulta ao abrir um diretório
+_audit_counts = None  # Contadores ativos do audit hook (None fora das medições)
+
+
+def audit_hook(event, args):
+    if _audit_counts is not None and event in AUDITED_EVENTS:
+        key = AUDITED_EVENTS[event]
+        _audit_counts[key] = _audit_counts.get(key, 0) + 1
+
+
+def read_io_counters():
+    """
+    Retorna (syscr, syscw) do próprio processo.
+    """
+    counters = {}
+    with open("/proc/self/io", "rb") as f:
+        for line in f:
+            key, _, value = line.partition(b":")
+            counters[key] = int(value)
+    return counters[b"syscr"], counters[b"syscw"]
+
+
+def measure_latency(function, setup, iterations):
+    """
+    Executa o coletor `iterations` vezes e retorna os percentis da latência (ms).
+    """
+    times = []
+    for _ in range(iterations):
+        setup()
+        started = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - started) * 1000)
+    quantiles = statistics.quantiles(times, n=100, method="inclusive") if len(times) > 1 else times * 99
+    return {
+        "p50": round(quantiles[49], 3),
+        "p90": round(quantiles[89], 3),
+        "p99": round(quantiles[98], 3),
+        "max": round(max(times), 3),
+        "mean": round(statistics.fmean(times), 3),
+    }
+
+
+def measure_allocations(function, setup):
+    """
+    Retorna o pico e o saldo de memória alocada (KB) por uma execução do coletor.
+    """
+    setup()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = function()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {"peak_kb": round((peak - before) / 1024, 1), "net_kb": round((current - before) / 1024, 1)}
+
+
+def measure_syscalls(function, setup):
+    """
+    Conta as chamadas de sistema de uma execução do coletor.
+
+    As leituras feitas pela própria medição (/proc/self/io) são descontadas.
+    """
+    global _audit_counts
+    setup()
+    baseline = read_io_counters()
+    reads, writes = read_io_counters()
+    overhead = reads - baseline[0]
+    _audit_counts = {}
+    function()
+    counts, _audit_counts = _audit_counts, None
+    after = read_io_counters()
+    return {
+        "open": counts.get("open", 0),
+        "listdir": counts.get("listdir", 0),
+        "read": after[0] - reads - overhead,
+        "write": after[1] - writes,
+    }
+
+
+def build_collectors(directory):
+    """
+    Retorna os coletores medidos: nome -> (função, preparação executada antes de cada medição).
+    """
+    dados = SystemInfo()
+    cycle_scan = get_process_scan(0)
+
+    def share_scan():
+        # fetch_cpu_info reaproveita a varredura do ciclo, como no dashboard
+        cycle_scan.timestamp = time.monotonic()
+        store_process_scan(cycle_scan)
+
+    screenful = sorted(os.listdir(directory))[:SCREEN_ENTRIES]
+    fd_tracker = FdTracker("1")  # Após a primeira varredura, mede só a diferença
+    io_tracker = ProcessIoTracker()
+    nothing = lambda: None
+    return {
+        "fetch_cpu_info": (lambda: fetch_cpu_info(dados), share_scan),
+        "fetch_memory_info": (lambda: fetch_memory_info(dados), nothing),
+        "fetch_active_processes": (lambda: fetch_active_processes(dados, None, 0), nothing),
+        "fetch_filesystem_info": (fetch_filesystem_info, nothing),
+        "fetch_directory_info": (lambda: fetch_directory_info(directory), nothing),
+        "fetch_entries_metadata": (lambda: fetch_entries_metadata(directory, screenful), nothing),
+        "fetch_process_tasks": (lambda: fetch_process_tasks("1", []), nothing),
+        "fetch_process_resources": (lambda: fetch_process_resources("1"), nothing),
+        "FdTracker.scan": (fd_tracker.scan, nothing),
+        "fetch_io_rates": (lambda: fetch_io_rates("1", io_tracker), nothing),
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, previous):
+    """
+    Imprime a variação do p50 e do pico de alocação em relação a um resultado anterior.
+    """
+    print(f"\nComparação com {previous['meta'].get('revision')}:")
+    for name, result in current["results"].items():
+        old = previous["results"].get(name)
+        if old is None:
+            continue
+        p50 = result["latency_ms"]["p50"] / old["latency_ms"]["p50"] if old["latency_ms"]["p50"] else 0
+        peak = result["allocations"]["peak_kb"] - old["allocations"]["peak_kb"]
+        print(f"  {name:<24} p50 {p50:5.2f}x   pico {peak:+9.1f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pids", type=int, default=2000, help="Processos sintéticos")
+    parser.add_argument("--threads", type=int, default=4, help="Threads (task/) do processo 1 e dos demais")
+    parser.add_argument("--fds", type=int, default=16, help="Descritores (fd/) de cada processo")
+    parser.add_argument("--mounts", type=int, default=8, help="Pontos de montagem")
+    parser.add_argument("--entries", type=int, default=2000, help="Entradas do diretório listado")
+    parser.add_argument("--cores", type=int, default=8, help="Núcleos do /proc/stat sintético")
+    parser.add_argument("--in-memory", action="store_true",
+                        help="Lê o /proc sintético de uma cópia em memória (FakeProcSource)")
+    parser.add_argument("--iterations", type=int, default=30, help="Execuções por coletor")
+    parser.add_argument("--json", help="Grava o resultado neste arquivo JSON")
+    parser.add_argument("--compare", help="Compara com um resultado JSON anterior")
+    args = parser.parse_args()
+
+    sys.addaudithook(audit_hook)
+    with tempfile.TemporaryDirectory() as directory:
+        proc = build_proc_tree(os.path.join(directory, "proc"), args.pids, args.fds, args.threads)
+        mounts = [os.path.join(directory, "mnt", str(i)) for i in range(args.mounts)]
+        for mount in mounts:
+            os.makedirs(mount)
+        build_system_files(proc, args.cores, mounts)
+        listing = build_directory(os.path.join(directory, "listing"), args.entries)
+
+        source = DirectoryProcSource(proc)
+        set_proc_source(FakeProcSource.capture(source) if args.in_memory else source)
+        try:
+            results = {}
+            for name, (function, setup) in build_collectors(listing).items():
+                function()  # Aquecimento (caches de nomes, leitura do cpuinfo, ...)
+                results[name] = {
+                    "latency_ms": measure_latency(function, setup, args.iterations),
+                    "allocations": measure_allocations(function, setup),
+                    "syscalls": measure_syscalls(function, setup),
+                }
+        finally:
+            set_proc_source(None)
+
+    output = {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+        },
+        "params": vars(args),
+        "results": results,
+    }
+    print(f"{'coletor':<24} {'p50':>8} {'p90':>8} {'p99':>8} {'pico KB':>9} {'open':>6} {'read':>6} {'listdir':>7}")
+    for name, result in results.items():
+        latency, syscalls = result["latency_ms"], result["syscalls"]
+        print(f"{name:<24} {latency['p50']:8.2f} {latency['p90']:8.2f} {latency['p99']:8.2f} "
+              f"{result['allocations']['peak_kb']:9.1f} {syscalls['open']:6d} {syscalls['read']:6d} "
+              f"{syscalls['listdir']:7d}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(output, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(output, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
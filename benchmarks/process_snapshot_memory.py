@@ -0,0 +1,79 @@
+"""
+Benchmark de memória por processo da lista de processos.
+
+Compara, para uma quantidade configurável de processos sintéticos, a memória alocada
+pela representação antiga (lista de tuplas com strings já formatadas) e pelo
+`ProcessSnapshot` colunar, medindo com `tracemalloc`.
+
+Uso:
+    python -m benchmarks.process_snapshot_memory --processes 20000
+"""
+
+import argparse
+import tracemalloc
+
+from models.process_snapshot_model import ProcessSnapshot
+from services.system_info_service import format_memory
+
+USERS = ("root", "daemon", "www-data", "postgres", "build")
+COMMANDS = ("bash", "python3", "postgres", "nginx", "kworker/0:1", "sshd", "make", "cc1")
+STATES = "SSSSRDIZ"
+
+
+def synthetic_processes(count):
+    """
+    Gera dados brutos e determinísticos para `count` processos.
+    """
+    for pid in range(1, count + 1):
+        yield (
+            pid, pid // 2, STATES[pid % len(STATES)], 1 + pid % 8,
+            10000 + pid * 37 % 900000, 1000 + pid * 13 % 90000,
+            USERS[pid % len(USERS)], COMMANDS[pid % len(COMMANDS)],
+        )
+
+
+def build_tuples(count):
+    """
+    Representação antiga: tuplas com pid, threads e memórias já convertidos em string.
+    """
+    return [
+        (user, str(pid), state, str(threads), format_memory(vsz), format_memory(rss), name)
+        for pid, _ppid, state, threads, vsz, rss, user, name in synthetic_processes(count)
+    ]
+
+
+def build_snapshot(count):
+    """
+    Representação colunar: arrays tipados e strings internadas.
+    """
+    snapshot = ProcessSnapshot()
+    for values in synthetic_processes(count):
+        snapshot.append(*values)
+    return snapshot
+
+
+def measure(builder, count):
+    """
+    Retorna os bytes alocados (e ainda vivos) pela estrutura construída por `builder`.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = builder(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--processes", type=int, default=20000, help="Quantidade de processos sintéticos")
+    args = parser.parse_args()
+
+    for label, builder in (("tuplas formatadas", build_tuples), ("ProcessSnapshot", build_snapshot)):
+        total = measure(builder, args.processes)
+        print(f"{label:>18}: {total / 1024:10.1f} KB  ({total / args.processes:6.1f} bytes/processo)")
+
+
+if __name__ == "__main__":
+    main()
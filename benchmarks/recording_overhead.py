@@ -0,0 +1,78 @@
+"""
+Benchmark do custo da gravação em disco dos snapshots.
+
+Grava repetidamente um `SystemInfo` com uma tabela de processos sintética e mede o tempo
+de CPU do processo gasto por registro (serialização e escrita). O custo é expresso em
+percentual de um núcleo para o intervalo de coleta informado; a meta é ficar abaixo de 2%
+com 10 mil processos a 1 s. Ao final, mede também o acesso aleatório aos registros pelo
+leitor mapeado em memória.
+
+Uso:
+    python -m benchmarks.recording_overhead --processes 10000 --records 300
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.process_snapshot_memory import build_snapshot
+from models.system_info_model import SystemInfo
+from services.recording_service import MetricsRecorder, RecordingReader, index_path
+
+TARGET_PERCENT = 2.0
+
+
+def build_system_info(processes):
+    """
+    Gera um `SystemInfo` com `processes` processos sintéticos.
+    """
+    dados = SystemInfo()
+    dados.cpu_name = "Synthetic CPU"
+    dados.infoSO = "Linux synthetic"
+    dados.cpu_per_core = [12.5] * 16
+    dados.mtotal, dados.mUsada = 16 * 1024 * 1024, 8 * 1024 * 1024
+    dados.processosAtivos = build_snapshot(processes)
+    dados.total_processos = processes
+    return dados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--processes", type=int, default=10000, help="Quantidade de processos sintéticos")
+    parser.add_argument("--records", type=int, default=300, help="Quantidade de registros gravados")
+    parser.add_argument("--interval", type=float, default=1.0, help="Intervalo de coleta simulado (s)")
+    args = parser.parse_args()
+
+    dados = build_system_info(args.processes)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "recording.bin")
+        recorder = MetricsRecorder(path)
+        started = time.process_time()
+        for i in range(args.records):
+            dados.cpu_usage = i % 100
+            recorder.append(dados, t=i * args.interval)
+        cpu_per_record = (time.process_time() - started) / args.records
+        recorder.close()
+
+        size = os.path.getsize(path) + os.path.getsize(index_path(path))
+        percent = cpu_per_record / args.interval * 100
+        status = "OK" if percent < TARGET_PERCENT else "ACIMA DA META"
+        print(f"{args.processes} processos, {args.records} registros")
+        print(f"  gravação: {cpu_per_record * 1000:8.3f} ms de CPU/registro "
+              f"= {percent:.3f}% de um núcleo a {args.interval}s ({status}, meta < {TARGET_PERCENT}%)")
+        print(f"  tamanho:  {size / args.records / 1024:8.1f} KB/registro")
+
+        reader = RecordingReader(path)
+        positions = [random.randrange(len(reader)) for _ in range(100)]
+        started = time.perf_counter()
+        for position in positions:
+            reader.snapshot(position)
+        elapsed = (time.perf_counter() - started) / len(positions)
+        print(f"  leitura:  {elapsed * 1000:8.3f} ms/registro (acesso aleatório via mmap)")
+        reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark da varredura dividida entre processos contra a varredura em uma thread.
+
+Para cada quantidade de processos, gera uma árvore /proc sintética e mede a mediana do
+tempo de parede das duas varreduras (o pool de processos é criado antes das medições).
+Ao final, indica a menor quantidade de PIDs em que a varredura dividida foi mais rápida,
+usada para ajustar `SHARDED_SCAN_THRESHOLD`.
+
+Uso:
+    python -m benchmarks.sharded_scan --processes 5000 10000 20000 50000 --workers 4
+"""
+
+import argparse
+import os
+import tempfile
+
+from benchmarks.async_collector import measure
+from benchmarks.synthetic_proc import build_proc_tree
+from services import sharded_scan
+from services.proc_source import DirectoryProcSource
+from services.system_info_service import ProcessCpuTracker, scan_processes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--processes", type=int, nargs="+", default=[5000, 10000, 20000, 50000],
+                        help="Quantidades de processos sintéticos")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Processos do pool")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetições por medição (mediana)")
+    args = parser.parse_args()
+
+    pool = sharded_scan.ProcessPoolExecutor(max_workers=args.workers)
+    pool.submit(os.getpid).result()  # Inicia os processos antes das medições
+    crossover = None
+    print(f"{args.workers} processos no pool, {os.cpu_count()} núcleos, limite atual: "
+          f"{sharded_scan.SHARDED_SCAN_THRESHOLD} PIDs")
+    with tempfile.TemporaryDirectory() as directory:
+        for count in args.processes:
+            source = DirectoryProcSource(build_proc_tree(os.path.join(directory, str(count)), count, fds=0))
+            pids = [pid for pid in source.listdir() if pid.isdigit()]
+            serial = measure(lambda: scan_processes(ProcessCpuTracker(), source, sharded=False), args.repeat)
+            sharded = measure(lambda: sharded_scan.sharded_scan(source, pids, ProcessCpuTracker(), pool),
+                              args.repeat)
+            if sharded < serial and crossover is None:
+                crossover = count
+            print(f"{count:7d} PIDs: serial {serial * 1000:9.1f} ms | dividida {sharded * 1000:9.1f} ms "
+                  f"({serial / sharded:4.2f}x)")
+    pool.shutdown()
+    print(f"Ponto de cruzamento: {crossover} PIDs" if crossover else "Ponto de cruzamento: não atingido")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Gerador de uma árvore /proc sintética para os benchmarks.
+
+Cria, em um diretório comum, `count` diretórios de processos com os arquivos lidos pelos
+coletores (`status`, `stat`, `io`, `task/` e `fd/`) e os arquivos globais (`stat`,
+`meminfo`, `cpuinfo`, `mounts`, ...) em um formato compatível com o do kernel. Os
+conteúdos são determinísticos, para que execuções diferentes sejam comparáveis.
+
+O diretório gerado é lido por meio de uma `DirectoryProcSource` (ver `services.proc_source`)
+no lugar do /proc.
+
+Observação: ler arquivos de um sistema de arquivos comum não tem o custo do kernel
+gerando o conteúdo do /proc a cada leitura; os números medem o custo do lado Python
+(chamadas de sistema, análise e montagem do snapshot).
+"""
+
+import os
+
+from benchmarks.process_snapshot_memory import COMMANDS, STATES
+
+STATUS_TEMPLATE = (
+    "Name:\t{name}\nUmask:\t0022\nState:\t{state} (sleeping)\nTgid:\t{pid}\nNgid:\t0\n"
+    "Pid:\t{pid}\nPPid:\t{ppid}\nTracerPid:\t0\nUid:\t{uid}\t{uid}\t{uid}\t{uid}\n"
+    "Gid:\t{uid}\t{uid}\t{uid}\t{uid}\nFDSize:\t64\nVmPeak:\t{vsz} kB\nVmSize:\t{vsz} kB\n"
+    "VmRSS:\t{rss} kB\nVmExe:\t128 kB\nThreads:\t{threads}\nvoluntary_ctxt_switches:\t{pid}\n"
+)
+IO_TEMPLATE = (
+    "rchar: {rchar}\nwchar: {wchar}\nsyscr: {syscr}\nsyscw: {syscw}\n"
+    "read_bytes: {read_bytes}\nwrite_bytes: {write_bytes}\ncancelled_write_bytes: 0\n"
+)
+
+
+def process_files(pid):
+    """
+    Retorna os conteúdos (status, stat, io) do processo sintético `pid`.
+    """
+    name = COMMANDS[pid % len(COMMANDS)]
+    state = STATES[pid % len(STATES)]
+    ppid = max(1, pid // 2)
+    threads = 1 + pid % 8
+    status = STATUS_TEMPLATE.format(
+        name=name, state=state, pid=pid, ppid=ppid, uid=pid % 3 * 1000,
+        vsz=10000 + pid * 37 % 900000, rss=1000 + pid * 13 % 90000, threads=threads,
+    )
+    fields = [state, ppid, pid, pid, 0, -1, 4194560, 100, 0, 0, 0, pid % 5000, pid % 700,
+              0, 0, 20, 0, threads, 0, 1000 + pid] + [0] * 32
+    stat = f"{pid} ({name}) " + " ".join(map(str, fields)) + "\n"
+    io = IO_TEMPLATE.format(
+        rchar=pid * 4096, wchar=pid * 1024, syscr=pid * 3, syscw=pid,
+        read_bytes=pid * 512, write_bytes=pid * 256,
+    )
+    return status, stat, io
+
+
+# Destinos dos descritores sintéticos, no formato do readlink de /proc/[pid]/fd
+FD_TARGETS = ("/dev/null", "socket:[{inode}]", "pipe:[{inode}]", "anon_inode:[eventfd]", "/var/log/syslog")
+
+
+def build_proc_tree(root, count, fds=4, threads=0):
+    """
+    Cria uma árvore /proc sintética em `root` com os PIDs 1..count.
+
+    Parâmetros:
+        root (str): Diretório de destino (criado se não existir).
+        count (int): Quantidade de processos.
+        fds (int): Quantidade de entradas em `fd/` de cada processo (links simbólicos).
+        threads (int): Quantidade de entradas em `task/` de cada processo.
+
+    Retorno:
+        str: O próprio `root`, para uso com `DirectoryProcSource`.
+    """
+    os.makedirs(root, exist_ok=True)
+    for pid in range(1, count + 1):
+        base = os.path.join(root, str(pid))
+        os.makedirs(os.path.join(base, "fd"), exist_ok=True)
+        status, stat, io = process_files(pid)
+        for name, content in (("status", status), ("stat", stat), ("io", io)):
+            with open(os.path.join(base, name), "w") as f:
+                f.write(content)
+        for fd in range(fds):
+            target = FD_TARGETS[fd % len(FD_TARGETS)].format(inode=pid * 1000 + fd)
+            os.symlink(target, os.path.join(base, "fd", str(fd)))
+        for tid in range(threads):
+            task = os.path.join(base, "task", str(pid * 1000 + tid))
+            os.makedirs(task, exist_ok=True)
+            with open(os.path.join(task, "status"), "w") as f:
+                f.write(status)
+    return root
+
+
+def build_system_files(root, cores=8, mounts=()):
+    """
+    Cria os arquivos globais do /proc sintético: stat, meminfo, cpuinfo, mounts, version e
+    sys/kernel/{hostname,osrelease}.
+
+    Parâmetros:
+        root (str): Diretório da árvore /proc sintética.
+        cores (int): Quantidade de núcleos (linhas cpuN e entradas do cpuinfo).
+        mounts (sequence): Pontos de montagem listados em `mounts` (devem existir, pois
+            `fetch_filesystem_info` chama `statvfs` em cada um).
+    """
+    os.makedirs(os.path.join(root, "sys", "kernel"), exist_ok=True)
+    lines = [f"cpu  {cores * 1000} 0 {cores * 500} {cores * 8000} 100 0 50 0 0 0"]
+    lines += [f"cpu{core} 1000 0 500 8000 12 0 6 0 0 0" for core in range(cores)]
+    lines += ["intr 0", "ctxt 123456", "btime 1700000000", "processes 1000", "procs_running 2", "procs_blocked 0"]
+    files = {
+        "stat": "\n".join(lines) + "\n",
+        "meminfo": (
+            "MemTotal:       16384000 kB\nMemFree:         4096000 kB\nMemAvailable:    8192000 kB\n"
+            "Buffers:          512000 kB\nCached:          2048000 kB\nSwapTotal:       2048000 kB\n"
+            "SwapFree:        1024000 kB\n"
+        ),
+        "cpuinfo": "".join(
+            f"processor\t: {core}\nmodel name\t: Synthetic CPU\ncpu MHz\t\t: 2400.000\n\n" for core in range(cores)
+        ),
+        "mounts": "".join(f"/dev/synthetic{i} {mount} ext4 rw 0 0\n" for i, mount in enumerate(mounts)),
+        "version": "Linux version 6.0.0-synthetic\n",
+        os.path.join("sys", "kernel", "hostname"): "synthetic\n",
+        os.path.join("sys", "kernel", "osrelease"): "6.0.0-synthetic\n",
+    }
+    for name, content in files.items():
+        with open(os.path.join(root, name), "w") as f:
+            f.write(content)
+    return root
+
+
+def build_directory(path, entries):
+    """
+    Cria um diretório com `entries` arquivos (um a cada dez é um subdiretório).
+    """
+    os.makedirs(path, exist_ok=True)
+    for i in range(entries):
+        entry = os.path.join(path, f"entry{i:06d}")
+        if i % 10 == 0:
+            os.makedirs(entry, exist_ok=True)
+        else:
+            with open(entry, "w") as f:
+                f.write("x" * (i % 4096))
+    return path
@@ -1,5 +1,69 @@
-from views import DashboardApp
+import argparse
+import signal
+import sys
+
+from services.async_collector import AsyncCollectorBridge
+from services.collector_daemon import CollectorDaemon, SnapshotClient, default_socket_path
+from services.proc_source import DirectoryProcSource
+from services.profiling_service import profiler
+from services.recording_service import MetricsRecorder, RecordingReader
+from services.system_info_service import set_proc_source
+
+
+def parse_args():
+    """
+    Lê as opções de linha de comando do dashboard.
+    """
+    parser = argparse.ArgumentParser(description="Dashboard do Sistema Operacional")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Executa apenas o coletor headless, publicando snapshots no socket Unix.")
+    parser.add_argument("--attach", action="store_true",
+                        help="Conecta o dashboard a um coletor headless em vez de varrer o /proc.")
+    parser.add_argument("--socket", default=default_socket_path(),
+                        help="Caminho do socket Unix do coletor (padrão: %(default)s).")
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="Intervalo entre coletas do modo --daemon, em segundos (padrão: %(default)s).")
+    parser.add_argument("--async-collector", action="store_true",
+                        help="Varre o /proc com o coletor assíncrono (asyncio) em vez do serial.")
+    parser.add_argument("--proc-root", metavar="DIRETÓRIO",
+                        help="Lê o /proc deste diretório (p.ex. /host/proc em um contêiner).")
+    parser.add_argument("--record", metavar="ARQUIVO",
+                        help="Grava cada snapshot coletado no arquivo (acrescentando, se já existir).")
+    parser.add_argument("--replay", metavar="ARQUIVO",
+                        help="Reproduz uma gravação feita com --record em vez de coletar dados.")
+    parser.add_argument("--cpu-budget", type=float, default=5.0, metavar="PERCENTUAL",
+                        help="Uso máximo de um núcleo pelas coletas periódicas do dashboard; acima "
+                             "dele os intervalos aumentam (padrão: %(default)s%%).")
+    parser.add_argument("--profile-overlay", action="store_true",
+                        help="Exibe o painel de desempenho ao iniciar (alternado com F12).")
+    parser.add_argument("--profile-ticks", type=int, metavar="N",
+                        help="Grava um perfil do cProfile das N primeiras atualizações. No Python "
+                             "3.12+, só uma thread é perfilada por vez (as demais são apenas medidas).")
+    parser.add_argument("--profile-output", default="dashboard.pstats", metavar="ARQUIVO",
+                        help="Arquivo pstats gravado por --profile-ticks (padrão: %(default)s).")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    app = DashboardApp()
-    app.mainloop()
+    args = parse_args()
+    if args.proc_root:
+        set_proc_source(DirectoryProcSource(args.proc_root))
+    recorder = MetricsRecorder(args.record) if args.record else None
+    if args.profile_ticks:
+        profiler.start_capture(args.profile_output, args.profile_ticks,
+                               source="daemon" if args.daemon else "dashboard")
+    if args.daemon:
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))  # Remove o socket ao encerrar
+        try:
+            CollectorDaemon(args.socket, args.interval, recorder=recorder).serve_forever()
+        except KeyboardInterrupt:
+            pass
+    else:
+        from views import DashboardApp  # Importa o Tk apenas no modo gráfico
+
+        client = SnapshotClient(args.socket) if args.attach else None
+        replay = RecordingReader(args.replay) if args.replay else None
+        bridge = AsyncCollectorBridge() if args.async_collector else None
+        app = DashboardApp(client=client, recorder=recorder, replay=replay, bridge=bridge,
+                           profile_overlay=args.profile_overlay, cpu_budget=args.cpu_budget / 100)
+        app.mainloop()
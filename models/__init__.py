@@ -10,7 +10,22 @@ Exporta:
       como CPU, memória, e processos ativos.
     - ProcessDetails: Classe que armazena informações detalhadas de um processo 
       específico, incluindo atributos como PID, estado, e uso de memória.
+    - ProcessScan: Classe que guarda o resultado de uma varredura única do /proc,
+      com a lista de processos e os totais de processos e threads.
+    - ProcessSnapshot: Classe que armazena a lista de processos em arrays tipados
+      (colunar), com strings internadas e formatação adiada para a exibição.
+    - ProcessQuery: Classe que descreve ordenação, filtro e limite (top-N) aplicados
+      pelo coletor à lista de processos.
+    - ColumnarStore: Classe que armazena linhas em colunas, com ordenação e
+      filtragem feitas sobre índices (usada pelas listas virtualizadas).
+    - FdScan: Classe que guarda a diferença entre duas varreduras dos descritores de um
+      processo (abertos, fechados e quantidade por tipo).
 """
 
 from .system_info_model import SystemInfo
-from .process_details_model import ProcessDetails
\ No newline at end of file
+from .process_details_model import ProcessDetails
+from .process_scan_model import ProcessScan
+from .columnar_store_model import ColumnarStore
+from .process_snapshot_model import ProcessSnapshot
+from .process_query_model import ProcessQuery
+from .fd_scan_model import FdScan, FD_TYPES
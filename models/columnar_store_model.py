@@ -0,0 +1,132 @@
+class ColumnarStore:
+    """
+    Classe que armazena um conjunto de linhas em colunas (uma lista por coluna).
+
+    Esta classe é usada pelas listas virtualizadas da interface: o conjunto completo de
+    dados fica no lado Python, e a ordenação e a filtragem são feitas sobre os índices
+    das linhas, sem criar itens de widget.
+
+    Atributos:
+        columns (tuple): Nomes das colunas.
+        keys (list): Chave única de cada linha (usada como iid na Treeview).
+        data (dict): Valores de cada coluna (list ou array), indexados pelo nome da coluna.
+        view (list): Índices das linhas visíveis, já filtradas e ordenadas.
+        sort_column (str): Coluna usada na ordenação atual (ou None).
+        sort_reverse (bool): Indica se a ordenação é decrescente.
+    """
+
+    def __init__(self, columns):
+        self.columns = tuple(columns)
+        self.keys = []
+        self.data = {column: [] for column in self.columns}
+        self.view = []
+        self.sort_column = None
+        self.sort_reverse = False
+        self._filter = None
+        self._positions = {}
+
+    def load(self, keys, rows):
+        """
+        Substitui todas as linhas do store e reaplica a filtragem e a ordenação atuais.
+
+        Parâmetros:
+            keys (list): Chave única de cada linha.
+            rows (list): Tuplas com os valores de cada linha, na ordem de `columns`.
+        """
+        self.keys = list(keys)
+        if rows:
+            for column, values in zip(self.columns, zip(*rows)):
+                self.data[column] = list(values)
+        else:
+            self.data = {column: [] for column in self.columns}
+        self.apply()
+
+    def load_columns(self, keys, data):
+        """
+        Substitui todas as linhas do store a partir de colunas já prontas, sem copiá-las.
+
+        Parâmetros:
+            keys (sequence): Chave única de cada linha.
+            data (dict): Sequência de valores (list ou array) de cada coluna, indexada pelo nome.
+        """
+        self.keys = keys
+        self.data = {column: data[column] for column in self.columns}
+        self.apply()
+
+    def set_sort(self, column, reverse=False):
+        """
+        Define a coluna de ordenação e reaplica a visão.
+
+        Parâmetros:
+            column (str): Nome da coluna (ou None para manter a ordem original).
+            reverse (bool): Ordenação decrescente se True.
+        """
+        self.sort_column = column
+        self.sort_reverse = reverse
+        self.apply()
+
+    def set_filter(self, predicate):
+        """
+        Define o filtro de linhas e reaplica a visão.
+
+        Parâmetros:
+            predicate (callable): Função que recebe a tupla de valores de uma linha e
+                retorna True se ela deve ser exibida (ou None para remover o filtro).
+        """
+        self._filter = predicate
+        self.apply()
+
+    def apply(self):
+        """
+        Recalcula os índices visíveis aplicando o filtro e a ordenação atuais.
+        """
+        indices = range(len(self.keys))
+        if self._filter is not None:
+            indices = [i for i in indices if self._filter(self.row_at(i))]
+        if self.sort_column is not None:
+            values = self.data[self.sort_column]
+            try:
+                indices = sorted(indices, key=values.__getitem__, reverse=self.sort_reverse)
+            except TypeError:
+                # Coluna com tipos misturados (ex: números e "N/A"): números antes do texto
+                indices = sorted(indices, key=lambda i: mixed_sort_key(values[i]), reverse=self.sort_reverse)
+        self.view = list(indices)
+        self._positions = {}
+
+    def row_at(self, index):
+        """
+        Retorna a tupla de valores da linha de índice `index` (sem considerar a visão).
+        """
+        return tuple(self.data[column][index] for column in self.columns)
+
+    def row(self, position):
+        """
+        Retorna a tupla de valores da linha na posição `position` da visão.
+        """
+        return self.row_at(self.view[position])
+
+    def key(self, position):
+        """
+        Retorna a chave da linha na posição `position` da visão.
+        """
+        return self.keys[self.view[position]]
+
+    def position_of(self, key):
+        """
+        Retorna a posição de uma chave na visão atual, ou None se ela não estiver visível.
+        """
+        if not self._positions and self.view:
+            self._positions = {str(self.keys[index]): position for position, index in enumerate(self.view)}
+        return self._positions.get(str(key))
+
+    def __len__(self):
+        return len(self.view)
+
+
+def mixed_sort_key(value):
+    """
+    Chave de ordenação para colunas com tipos misturados: números primeiro, depois texto.
+    """
+    if isinstance(value, (int, float)):
+        return (0, value, "")
+    return (1, 0, str(value))
@@ -0,0 +1,32 @@
+FD_TYPES = ("file", "socket", "pipe", "anon_inode", "device", "other")
+
+
+class FdScan:
+    """
+    Classe que armazena o resultado de uma varredura de `/proc/[pid]/fd` como diferença em
+    relação à varredura anterior do mesmo processo (ver `FdTracker`).
+
+    Atributos:
+        pid (int): ID do processo.
+        opened (dict): Descritores abertos desde a varredura anterior: fd -> (tipo, destino).
+        closed (list): Descritores fechados desde a varredura anterior.
+        counts (dict): Quantidade de descritores abertos por tipo (ver `FD_TYPES`).
+        total (int): Quantidade total de descritores abertos.
+        reset (bool): Primeira varredura do processo: `opened` contém todos os descritores.
+        error (str): Motivo pelo qual o diretório não pôde ser lido (ou None).
+    """
+
+    def __init__(self, pid, opened=None, closed=None, counts=None, total=0, reset=False, error=None):
+        self.pid = pid
+        self.opened = opened if opened is not None else {}
+        self.closed = closed if closed is not None else []
+        self.counts = counts if counts is not None else dict.fromkeys(FD_TYPES, 0)
+        self.total = total
+        self.reset = reset
+        self.error = error
+
+    def __bool__(self):
+        """
+        Indica se houve alguma alteração no conjunto de descritores.
+        """
+        return bool(self.opened or self.closed or self.reset)
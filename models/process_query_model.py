@@ -0,0 +1,51 @@
+class ProcessQuery:
+    """
+    Classe que descreve a ordenação, o filtro e o limite aplicados à lista de processos.
+
+    A consulta é montada pela interface e aplicada pelo coletor, em background, de modo
+    que apenas as linhas necessárias para a exibição sejam entregues à interface.
+
+    Atributos:
+        sort_key (str): Coluna do `ProcessSnapshot` usada na ordenação (ou None para a ordem do /proc).
+        reverse (bool): Ordenação decrescente se True.
+        user (str): Exibe apenas processos deste usuário (ou None).
+        state (str): Exibe apenas processos neste estado, p.ex. "R" (ou None).
+        command (str): Exibe apenas processos cujo comando contém este texto (ou None).
+        limit (int): Quantidade máxima de linhas (top-N), ou None para todas.
+    """
+
+    def __init__(self, sort_key=None, reverse=False, user=None, state=None, command=None, limit=None):
+        self.sort_key = sort_key
+        self.reverse = reverse
+        self.user = user
+        self.state = state
+        self.command = command
+        self.limit = limit
+
+    def set_filter_text(self, text):
+        """
+        Define o filtro a partir do texto digitado pelo usuário.
+
+        Termos no formato `user:<nome>` e `state:<letra>` filtram por usuário e estado;
+        os demais termos são procurados no nome do comando.
+
+        Parâmetros:
+            text (str): Texto do filtro, p.ex. "user:root state:S python".
+        """
+        self.user = self.state = self.command = None
+        words = []
+        for term in text.split():
+            prefix, _, value = term.partition(":")
+            if prefix == "user" and value:
+                self.user = value
+            elif prefix == "state" and value:
+                self.state = value[0].upper()
+            else:
+                words.append(term)
+        self.command = " ".join(words) or None
+
+    def copy(self):
+        """
+        Retorna uma cópia da consulta (para uso seguro na thread de coleta).
+        """
+        return ProcessQuery(self.sort_key, self.reverse, self.user, self.state, self.command, self.limit)
@@ -0,0 +1,27 @@
+import time
+
+from .process_snapshot_model import ProcessSnapshot
+
+
+class ProcessScan:
+    """
+    Classe que armazena o resultado de uma varredura única do diretório /proc.
+
+    Esta classe é usada para compartilhar, dentro de um mesmo ciclo de atualização,
+    a lista de processos e os totais de processos e threads entre os coletores.
+
+    Atributos:
+        processos (ProcessSnapshot): Processos ativos em formato colunar.
+        total_processos (int): Quantidade total de processos encontrados.
+        total_threads (int): Quantidade total de threads encontradas.
+        timestamp (float): Instante (time.monotonic) em que a varredura foi concluída.
+        io (dict): Contadores de `/proc/[pid]/io` por PID (apenas nas varreduras que os leem;
+            processos sem permissão de leitura ficam de fora).
+    """
+
+    def __init__(self, processos=None, total_processos=0, total_threads=0, io=None):
+        self.processos = processos if processos is not None else ProcessSnapshot()
+        self.total_processos = total_processos
+        self.total_threads = total_threads
+        self.io = io if io is not None else {}
+        self.timestamp = time.monotonic()
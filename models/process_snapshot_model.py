@@ -0,0 +1,121 @@
+import sys
+from array import array
+
+
+class ProcessSnapshot:
+    """
+    Classe que armazena a lista de processos de uma varredura em formato colunar.
+
+    Cada atributo numérico é um `array` tipado (um elemento por processo), e os nomes de
+    usuário e de comando são strings internadas, compartilhadas entre processos iguais.
+    Os valores são guardados brutos (memória em KB, estado como código do caractere);
+    a formatação é feita apenas na exibição das linhas visíveis.
+
+    Atributos:
+        pid (array): IDs dos processos.
+        ppid (array): IDs dos processos pais.
+        state (array): Estado de cada processo, como código do caractere (ex: ord("S")).
+        threads (array): Número de threads de cada processo.
+        vsz (array): Memória virtual (VmSize) de cada processo, em KB.
+        rss (array): Memória residente (VmRSS) de cada processo, em KB.
+        cpu (array): Uso de CPU de cada processo no último intervalo, em % de um núcleo.
+        cpu_time (array): Tempo total de CPU (user + system) de cada processo, em segundos.
+        io_rate (array): Taxa de I/O de disco (read_bytes + write_bytes) de cada processo no
+            último intervalo, em bytes/s; -1 quando não medida (coleta de I/O desativada
+            ou `/proc/[pid]/io` sem permissão de leitura).
+        starttime (array): Instante de início de cada processo (clock ticks desde o boot),
+            que junto com o PID identifica o processo (PIDs são reutilizados); 0 quando
+            desconhecido. Não é exibido nem faz parte de `COLUMNS`.
+        user (list): Nome do usuário dono de cada processo.
+        name (list): Nome do comando de cada processo.
+    """
+
+    __slots__ = ("pid", "ppid", "state", "threads", "vsz", "rss", "cpu", "cpu_time", "io_rate", "starttime", "user",
+                 "name")
+
+    COLUMNS = ("user", "pid", "state", "threads", "vsz", "rss", "name", "cpu", "cpu_time", "io_rate")
+
+    def __init__(self):
+        self.pid = array("i")
+        self.ppid = array("i")
+        self.state = array("B")
+        self.threads = array("I")
+        self.vsz = array("Q")
+        self.rss = array("Q")
+        self.cpu = array("f")
+        self.cpu_time = array("d")
+        self.io_rate = array("d")
+        self.starttime = array("Q")
+        self.user = []
+        self.name = []
+
+    def append(self, pid, ppid, state, threads, vsz, rss, user, name, cpu=0.0, cpu_time=0.0, io_rate=-1.0,
+               starttime=0):
+        """
+        Adiciona um processo ao snapshot.
+
+        Parâmetros:
+            pid (int): ID do processo.
+            ppid (int): ID do processo pai.
+            state (str): Estado do processo (ex: "R", "S").
+            threads (int): Número de threads.
+            vsz (int): Memória virtual em KB.
+            rss (int): Memória residente em KB.
+            user (str): Nome do usuário dono do processo.
+            name (str): Nome do comando.
+            cpu (float): Uso de CPU no último intervalo, em % de um núcleo.
+            cpu_time (float): Tempo total de CPU em segundos.
+            io_rate (float): Taxa de I/O de disco em bytes/s (-1 se não medida).
+            starttime (int): Instante de início do processo (clock ticks desde o boot).
+        """
+        self.pid.append(pid)
+        self.ppid.append(ppid)
+        self.state.append(ord(state[0]) if state else 63)  # 63 == "?"
+        self.threads.append(threads)
+        self.vsz.append(vsz)
+        self.rss.append(rss)
+        self.cpu.append(cpu)
+        self.cpu_time.append(cpu_time)
+        self.io_rate.append(io_rate)
+        self.starttime.append(starttime)
+        self.user.append(sys.intern(user))
+        self.name.append(sys.intern(name))
+
+    def take(self, indices):
+        """
+        Retorna um novo snapshot contendo apenas os processos das posições informadas.
+
+        Parâmetros:
+            indices (list): Posições dos processos, na ordem desejada.
+
+        Retorno:
+            ProcessSnapshot: Snapshot com os processos selecionados.
+        """
+        subset = ProcessSnapshot()
+        for column in self.__slots__:
+            values = getattr(self, column)
+            selected = map(values.__getitem__, indices)
+            setattr(subset, column, array(values.typecode, selected) if isinstance(values, array) else list(selected))
+        return subset
+
+    def columns(self):
+        """
+        Retorna as colunas do snapshot, indexadas pelo nome (ver `COLUMNS`).
+        """
+        return {column: getattr(self, column) for column in self.COLUMNS}
+
+    def row(self, index):
+        """
+        Retorna os valores brutos do processo na posição `index`, na ordem de `COLUMNS`.
+        """
+        return (
+            self.user[index], self.pid[index], chr(self.state[index]), self.threads[index],
+            self.vsz[index], self.rss[index], self.name[index], self.cpu[index], self.cpu_time[index],
+            self.io_rate[index]
+        )
+
+    def __iter__(self):
+        return (self.row(index) for index in range(len(self.pid)))
+
+    def __len__(self):
+        return len(self.pid)
@@ -1,3 +1,6 @@
+from .process_snapshot_model import ProcessSnapshot
+
+
 class SystemInfo:
     """
     Classe que armazena informações sobre o sistema.
@@ -10,6 +13,9 @@ class SystemInfo:
         cpu_ghz (float): Frequência da CPU em GHz.
         cpu_usage (float): Uso da CPU em percentual.
         idle_percent (float): Percentual de tempo ocioso da CPU.
+        cpu_times (dict): Percentual de tempo da CPU por campo do /proc/stat
+            (user, nice, system, idle, iowait, irq, softirq, steal, guest, guest_nice).
+        cpu_per_core (list): Uso de cada núcleo lógico em percentual.
         quantidadeCPU (int): Quantidade total de núcleos/processadores.
         mtotal (int): Memória total disponível (em KB).
         mUsada (int): Memória usada (em KB).
@@ -18,13 +24,17 @@ class SystemInfo:
         total_processos (int): Quantidade total de processos ativos.
         total_threads (int): Quantidade total de threads ativas.
         infoSO (str): Informações sobre o sistema operacional.
-        processosAtivos (list): Lista de processos ativos no sistema.
+        processosAtivos (ProcessSnapshot): Processos ativos no sistema, em formato colunar
+            (apenas os selecionados pela consulta da interface, se houver).
+        processos_listados (int): Quantidade de processos que atendem ao filtro atual.
     """
     def __init__(self):
         self.cpu_name = ""
         self.cpu_ghz = 0.0
         self.cpu_usage = 0.0
         self.idle_percent = 0.0
+        self.cpu_times = {}
+        self.cpu_per_core = []
         self.quantidadeCPU = 0
         self.mtotal = 0
         self.mUsada = 0
@@ -33,4 +43,5 @@ class SystemInfo:
         self.total_processos = 0
         self.total_threads = 0
         self.infoSO = ""
-        self.processosAtivos = []
+        self.processosAtivos = ProcessSnapshot()
+        self.processos_listados = 0
@@ -8,6 +8,41 @@ Este módulo fornece funções para monitoramento de informações do sistema op
 - **Processos**: lista de processos ativos com detalhes e threads associadas a processos.
 - **Informações Gerais**: dados sobre o sistema operacional, como versão do kernel, arquitetura e hostname.
 
+O módulo `collector_daemon` fornece o coletor headless (`CollectorDaemon`) e seu cliente
+(`SnapshotClient`), que publicam e consomem snapshots via socket Unix.
+
+O módulo `history_service` fornece o histórico de métricas (`HistoryStore`), com buffers
+circulares e níveis de agregação de 1 s, 10 s e 1 min.
+
+O módulo `recording_service` grava os snapshots em disco (`MetricsRecorder`) e os reproduz
+via mmap (`RecordingReader`).
+
+O módulo `async_collector` fornece o coletor assíncrono do /proc (`AsyncProcCollector`) e a
+ponte (`AsyncCollectorBridge`) que executa seu event loop em uma thread para o Tk.
+
+O módulo `proc_source` define as fontes do /proc lidas pelos coletores: o /proc do sistema
+(`LiveProcSource`), um diretório qualquer (`DirectoryProcSource`) e um /proc em memória
+(`FakeProcSource`), selecionadas com `set_proc_source`.
+
+O módulo `inotify_service` observa diretórios com o inotify (via `ctypes`), para que a aba
+de sistemas de arquivos consulte apenas as entradas alteradas (`DirectoryWatcher`).
+
+O módulo `fd_service` acompanha os descritores abertos de um processo entre varreduras
+(`FdTracker`), informando apenas os abertos e fechados e a quantidade por tipo.
+
+O módulo `net_service` indexa as tabelas do /proc/net (tcp, tcp6, udp, udp6, unix) pelo
+inode do socket (`NetIndex`), compartilhado entre as views no mesmo ciclo (`get_net_index`).
+
+O módulo `disk_usage_service` calcula em background o uso em disco recursivo dos
+subdiretórios (`DiskUsageEngine`), com cache por diretório validado pelo mtime.
+
+O módulo `profiling_service` instrumenta o pipeline de atualização: histogramas de duração
+por etapa, tempos das últimas atualizações de cada fonte e captura de perfis do cProfile
+(`profiler`).
+
+O módulo `sharded_scan` divide a varredura do /proc entre processos quando há dezenas de
+milhares de PIDs (usado automaticamente por `get_process_scan`).
+
 Exporta:
     - fetch_cpu_info: Coleta informações detalhadas sobre o uso e características da CPU.
     - fetch_memory_info: Coleta dados sobre a memória do sistema, incluindo buffers e swap.
@@ -15,9 +50,17 @@ Exporta:
     - fetch_os_info: Coleta informações gerais sobre o sistema operacional.
     - fetch_process_details: Obtém detalhes sobre um processo específico com base no PID.
     - fetch_process_tasks: Retorna as threads/tasks associadas a um processo.
+    - select_processes: Aplica ordenação, filtro e limite (top-N) a um snapshot de processos.
+    - get_process_scan: Retorna a varredura única do /proc compartilhada no ciclo atual.
+    - set_io_collection: Ativa a leitura do /proc/[pid]/io na varredura (taxa de I/O por processo).
+    - ProcessIoTracker: Converte amostras sucessivas do /proc/[pid]/io em taxas por segundo.
+    - fetch_io_rates: Lê os contadores de I/O de um processo e calcula suas taxas.
     - adjust_path: Ajusta o caminho para compatibilidade com WSL, se necessário.
+    - set_proc_source: Define a fonte do /proc lida por todos os coletores.
+    - get_proc_source: Retorna a fonte do /proc atual.
     - format_memory: Formata valores de memória para MB ou KB.
     - get_username_from_uid: Obtém o nome do usuário com base no UID.
+    - get_groupname_from_gid: Obtém o nome do grupo com base no GID.
 
 """
 
@@ -31,8 +74,27 @@ from .system_info_service import (
     adjust_path,
     format_memory,
     get_username_from_uid,
+    get_groupname_from_gid,
     fetch_filesystem_info,
     fetch_directory_info,
+    fetch_entries_metadata,
     fetch_io_info,
-    fetch_process_resources
+    fetch_io_rates,
+    fetch_process_resources,
+    get_process_scan,
+    set_io_collection,
+    ProcessIoTracker,
+    select_processes,
+    set_proc_source,
+    get_proc_source
 )
+from .proc_source import ProcSource, LiveProcSource, DirectoryProcSource, FakeProcSource
+from .collector_daemon import CollectorDaemon, SnapshotClient
+from .history_service import HistoryStore
+from .recording_service import MetricsRecorder, RecordingReader
+from .async_collector import AsyncProcCollector, AsyncCollectorBridge
+from .profiling_service import Profiler, profiler
+from .inotify_service import DirectoryWatcher
+from .disk_usage_service import DiskUsageEngine
+from .fd_service import FdTracker
+from .net_service import NetIndex, get_net_index
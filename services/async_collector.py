@@ -0,0 +1,248 @@
+"""
+Motor assíncrono de coleta do /proc baseado em asyncio.
+
+A varredura serial (`scan_processes`) lê os arquivos de um processo por vez. Aqui, a
+leitura de cada processo (status, stat e, com a coleta de I/O ativa, io) é uma tarefa
+independente, e um semáforo limita quantas estão em andamento ao mesmo tempo. Como o
+/proc não tem leitura assíncrona no kernel, cada tarefa executa suas leituras em um pool
+de threads (as chamadas `read` liberam o GIL enquanto o kernel gera o conteúdo).
+
+Processos que terminam durante a varredura são simplesmente descartados. Depois das
+leituras, o cálculo de CPU e de I/O é feito em uma única passada sob o mesmo lock da
+varredura serial (`_scan_lock`): os rastreadores são compartilhados entre as duas, que
+podem se alternar ou ocorrer ao mesmo tempo (p.ex. `get_process_scan` em outra thread).
+
+A interface Tk não roda um event loop do asyncio: `AsyncCollectorBridge` mantém o loop
+em uma thread dedicada e permite aguardar uma coleta a partir de qualquer outra thread.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from models.process_scan_model import ProcessScan
+from models.process_snapshot_model import ProcessSnapshot
+from models.system_info_model import SystemInfo
+from services.system_info_service import (
+    _process_cpu_tracker,
+    _scan_lock,
+    _process_io_tracker,
+    disk_io_rate,
+    fetch_active_processes,
+    fetch_cpu_info,
+    fetch_memory_info,
+    fetch_os_info,
+    get_proc_source,
+    get_username_from_uid,
+    io_collection_enabled,
+    parse_io_bytes,
+    parse_stat_times,
+    parse_status_bytes,
+    store_process_scan,
+)
+
+ASYNC_CONCURRENCY = 64  # Quantidade máxima de processos sendo lidos ao mesmo tempo
+ASYNC_READ_THREADS = 8  # Threads que executam as leituras do /proc
+
+
+def read_process_files(source, pid, read_io=True):
+    """
+    Lê os arquivos de um processo usados pela varredura.
+
+    Parâmetros:
+        source (ProcSource): Fonte do /proc.
+        pid (str): ID do processo.
+        read_io (bool): Lê também o `/proc/[pid]/io`.
+
+    Retorno:
+        tuple: (status, stat, io) com os conteúdos brutos; `stat` e `io` são None se não
+            puderem ser lidos (ou, no caso de `io`, sem `read_io`). Retorna None se o
+            processo terminou.
+    """
+    try:
+        status = source.read_bytes(f"{pid}/status")
+    except OSError:
+        return None  # O processo terminou durante a varredura
+    results = [status]
+    for name in ("stat", "io") if read_io else ("stat",):
+        try:
+            results.append(source.read_bytes(f"{pid}/{name}"))
+        except OSError:
+            results.append(None)  # Sem permissão (io de outros usuários) ou processo encerrado
+    if not read_io:
+        results.append(None)
+    return tuple(results)
+
+
+class AsyncProcCollector:
+    """
+    Coletor do /proc com uma tarefa asyncio por processo e concorrência limitada.
+
+    Atributos:
+        concurrency (int): Quantidade máxima de processos lidos ao mesmo tempo.
+        source (ProcSource): Fonte do /proc varrida (padrão: a fonte atual dos coletores).
+    """
+
+    def __init__(self, concurrency=ASYNC_CONCURRENCY, executor=None, tracker=None, source=None, io_tracker=None):
+        """
+        Parâmetros:
+            concurrency (int): Limite do semáforo de leituras.
+            executor (ThreadPoolExecutor, opcional): Pool usado nas leituras.
+            tracker (ProcessCpuTracker, opcional): Rastreador de CPU por processo (padrão:
+                o mesmo da varredura serial, para que as duas possam se alternar; ver `merge`).
+            source (ProcSource, opcional): Fonte do /proc a varrer.
+            io_tracker (ProcessIoTracker, opcional): Rastreador das taxas de I/O por processo
+                (padrão: o mesmo da varredura serial). O `/proc/[pid]/io` só é lido com a
+                coleta de I/O ativa (`set_io_collection`).
+        """
+        self.concurrency = concurrency
+        self.executor = executor or ThreadPoolExecutor(max_workers=ASYNC_READ_THREADS)
+        self.tracker = tracker or _process_cpu_tracker
+        self.io_tracker = io_tracker or _process_io_tracker
+        self.source = source
+
+    def scan_source(self):
+        """
+        Retorna a fonte do /proc varrida (a informada ou a fonte atual dos coletores).
+        """
+        return self.source or get_proc_source()
+
+    async def read_process(self, semaphore, pid, read_io):
+        """
+        Lê os arquivos de um processo respeitando o limite de concorrência.
+        """
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, read_process_files, self.scan_source(), pid, read_io)
+
+    async def scan(self):
+        """
+        Varre o /proc lendo os processos em paralelo.
+
+        Retorno:
+            ProcessScan: Processos, totais e, com a coleta de I/O ativa, os contadores de
+                I/O por PID (quando legíveis).
+        """
+        loop = asyncio.get_running_loop()
+        source = self.scan_source()
+        entries = await loop.run_in_executor(self.executor, source.listdir)
+        pids = [pid for pid in entries if pid.isdigit()]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        read_io = io_collection_enabled()
+        results = await asyncio.gather(*(self.read_process(semaphore, pid, read_io) for pid in pids))
+        return await loop.run_in_executor(self.executor, self.merge, pids, results, read_io)
+
+    def merge(self, pids, results, read_io):
+        """
+        Analisa as leituras de `scan` e calcula o uso de CPU e as taxas de I/O.
+
+        A passada `begin`/`update`/`finish` dos rastreadores é feita sob `_scan_lock`, para
+        não se intercalar com uma varredura serial ou com `set_io_collection`.
+
+        Parâmetros:
+            pids (list): PIDs (str) varridos.
+            results (list): Resultado de `read_process_files` de cada PID.
+            read_io (bool): O `/proc/[pid]/io` foi lido.
+
+        Retorno:
+            ProcessScan: Ver `scan`.
+        """
+        with _scan_lock:
+            # A coleta de I/O pode ter sido desativada (e o rastreador zerado) durante as leituras
+            read_io = read_io and io_collection_enabled()
+            return self._merge(pids, results, read_io)
+
+    def _merge(self, pids, results, read_io):
+        self.tracker.begin()
+        if read_io:
+            self.io_tracker.begin()
+        processos = ProcessSnapshot()
+        io = {}
+        for pid, result in zip(pids, results):
+            if result is None:
+                continue
+            status, stat, io_bytes = result
+            name, uid, state, ppid, threads, vsz, rss = parse_status_bytes(status)
+            try:
+                starttime, ticks = parse_stat_times(stat)
+            except (TypeError, ValueError, IndexError):
+                starttime, ticks = 0, 0
+            pid = int(pid)
+            cpu, cpu_time = self.tracker.update(pid, starttime, ticks)
+            io_rate = -1.0
+            if read_io and io_bytes is not None:
+                io[pid] = parse_io_bytes(io_bytes)
+                io_rate = disk_io_rate(self.io_tracker.update(pid, starttime, io[pid]))
+            processos.append(pid, ppid, state, threads, vsz, rss, get_username_from_uid(uid), name, cpu, cpu_time,
+                             io_rate, starttime)
+        self.tracker.finish()
+        if read_io:
+            self.io_tracker.finish()
+        return ProcessScan(processos, len(processos), sum(processos.threads), io)
+
+    async def collect_snapshot(self, dados=None, query=None):
+        """
+        Coleta um snapshot completo do sistema.
+
+        A varredura assíncrona é publicada como a varredura do ciclo, e os demais coletores
+        (CPU, memória, SO e lista de processos) rodam em paralelo reaproveitando-a.
+
+        Parâmetros:
+            dados (SystemInfo, opcional): Objeto a preencher. Por padrão, cria um novo.
+            query (ProcessQuery, opcional): Consulta aplicada à lista de processos.
+
+        Retorno:
+            SystemInfo: Informações coletadas.
+        """
+        dados = dados if dados is not None else SystemInfo()
+        store_process_scan(await self.scan())
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            loop.run_in_executor(self.executor, fetch_cpu_info, dados),
+            loop.run_in_executor(self.executor, fetch_memory_info, dados),
+            loop.run_in_executor(self.executor, fetch_os_info, dados),
+            loop.run_in_executor(self.executor, fetch_active_processes, dados, query, float("inf")),
+        )
+        return dados
+
+
+class AsyncCollectorBridge:
+    """
+    Mantém um event loop do asyncio em uma thread dedicada para uso a partir do Tk.
+
+    As coletas são disparadas de qualquer thread com `submit` (retorna um
+    `concurrent.futures.Future`) ou `run` (aguarda o resultado).
+    """
+
+    def __init__(self, collector=None):
+        self.collector = collector or AsyncProcCollector()
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="async-collector", daemon=True)
+        self.thread.start()
+
+    def submit(self, coroutine):
+        """
+        Agenda uma corrotina no loop do coletor.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine):
+        """
+        Executa uma corrotina no loop do coletor e aguarda seu resultado.
+        """
+        return self.submit(coroutine).result()
+
+    def collect_snapshot(self, dados=None, query=None):
+        """
+        Executa `AsyncProcCollector.collect_snapshot` e aguarda o resultado.
+        """
+        return self.run(self.collector.collect_snapshot(dados, query))
+
+    def close(self):
+        """
+        Encerra o loop e o pool de leituras do coletor.
+        """
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=1.0)
+        self.collector.executor.shutdown(wait=False)
@@ -0,0 +1,391 @@
+"""
+Coletor headless com API de snapshots via socket Unix.
+
+O daemon executa os coletores do `system_info_service` em intervalos regulares e publica
+o último snapshot em um socket Unix, em um formato binário compacto e versionado. Vários
+dashboards conectados como clientes compartilham a mesma varredura do /proc por ciclo.
+
+Protocolo:
+    - O cliente envia a versão do último snapshot que possui (`REQUEST`, 8 bytes).
+    - O servidor responde com um cabeçalho (`HEADER`) seguido do payload. Se o cliente já
+      possui a versão atual, o payload é vazio (não modificado).
+    - As versões só valem durante uma conexão: ao reconectar, o cliente volta a pedir a
+      versão 0, pois um coletor reiniciado recomeça a numeração.
+"""
+
+import os
+import socket
+import socketserver
+import struct
+import tempfile
+import threading
+import time
+import traceback
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from models.process_snapshot_model import ProcessSnapshot
+from models.system_info_model import SystemInfo
+from services.system_info_service import (
+    CPU_TIME_FIELDS,
+    fetch_active_processes,
+    fetch_cpu_info,
+    fetch_memory_info,
+    fetch_os_info,
+)
+from services.profiling_service import profiler
+
+MAGIC = b"SOD1"
+PROTOCOL_VERSION = 1
+HEADER = struct.Struct("<4sHQI")  # magic, protocolo, versão do snapshot, tamanho do payload
+REQUEST = struct.Struct("<Q")     # versão do último snapshot recebido pelo cliente
+SCALARS = struct.Struct("<dddIQQQQQQQII")
+COUNT = struct.Struct("<I")
+
+# Colunas numéricas do ProcessSnapshot enviadas como bytes brutos dos arrays (a taxa de I/O,
+# opcional, e o starttime não fazem parte do formato: os snapshots recebidos têm a taxa como
+# não medida e o starttime 0)
+NUMERIC_COLUMNS = ("pid", "ppid", "state", "threads", "vsz", "rss", "cpu", "cpu_time")
+
+
+def default_socket_path():
+    """
+    Retorna o caminho padrão do socket do coletor para o usuário atual.
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(base, f"projeto_so-{os.getuid() if hasattr(os, 'getuid') else 0}.sock")
+
+
+def collect_system_info(executor):
+    """
+    Executa todos os coletores do dashboard em paralelo e retorna um novo `SystemInfo`.
+
+    Parâmetros:
+        executor (ThreadPoolExecutor): Executor usado para rodar os coletores.
+    """
+    dados = SystemInfo()
+    tasks = [
+        executor.submit(fetch_cpu_info, dados),
+        executor.submit(fetch_memory_info, dados),
+        executor.submit(fetch_os_info, dados),
+        executor.submit(fetch_active_processes, dados),
+    ]
+    for task in tasks:
+        task.result()
+    return dados
+
+
+def encode_snapshot(dados):
+    """
+    Serializa um `SystemInfo` em um payload binário compacto.
+
+    Os números são gravados com `struct`, as colunas numéricas dos processos como os bytes
+    brutos dos arrays (mesma máquina: ordem de bytes nativa) e os nomes de usuário e de
+    comando como uma tabela de strings únicas mais um array de índices.
+
+    Parâmetros:
+        dados (SystemInfo): Informações coletadas.
+
+    Retorno:
+        bytes: Payload do snapshot.
+    """
+    parts = [SCALARS.pack(
+        dados.cpu_ghz, dados.cpu_usage, dados.idle_percent, dados.quantidadeCPU,
+        dados.mtotal, dados.mUsada, dados.mLivre, dados.mDisponivel,
+        getattr(dados, "buffers", 0), getattr(dados, "swapTotal", 0), getattr(dados, "swapFree", 0),
+        dados.total_processos, dados.total_threads,
+    )]
+    _write_str(parts, dados.cpu_name)
+    _write_str(parts, dados.infoSO)
+    _write_array(parts, array("d", [dados.cpu_times[field] for field in CPU_TIME_FIELDS] if dados.cpu_times else []))
+    _write_array(parts, array("d", dados.cpu_per_core))
+
+    processos = dados.processosAtivos
+    parts.append(COUNT.pack(len(processos)))
+    for column in NUMERIC_COLUMNS:
+        parts.append(getattr(processos, column).tobytes())
+    for column in ("user", "name"):
+        table = {}
+        indices = array("I", [table.setdefault(value, len(table)) for value in getattr(processos, column)])
+        _write_str(parts, "\0".join(table))
+        parts.append(indices.tobytes())
+    return b"".join(parts)
+
+
+def decode_snapshot(payload, dados=None):
+    """
+    Reconstrói um `SystemInfo` a partir de um payload gerado por `encode_snapshot`.
+
+    Parâmetros:
+        payload (bytes): Payload do snapshot.
+        dados (SystemInfo, opcional): Objeto a preencher. Por padrão, cria um novo.
+
+    Retorno:
+        SystemInfo: Informações decodificadas.
+    """
+    dados = dados if dados is not None else SystemInfo()
+    view = memoryview(payload)
+    (dados.cpu_ghz, dados.cpu_usage, dados.idle_percent, dados.quantidadeCPU,
+     dados.mtotal, dados.mUsada, dados.mLivre, dados.mDisponivel,
+     dados.buffers, dados.swapTotal, dados.swapFree,
+     dados.total_processos, dados.total_threads) = SCALARS.unpack_from(view, 0)
+    offset = SCALARS.size
+    dados.cpu_name, offset = _read_str(view, offset)
+    dados.infoSO, offset = _read_str(view, offset)
+    cpu_times, offset = _read_array(view, offset, "d")
+    dados.cpu_times = dict(zip(CPU_TIME_FIELDS, cpu_times)) if cpu_times else {}
+    per_core, offset = _read_array(view, offset, "d")
+    dados.cpu_per_core = per_core.tolist()
+
+    processos = ProcessSnapshot()
+    (count,) = COUNT.unpack_from(view, offset)
+    offset += COUNT.size
+    for column in NUMERIC_COLUMNS:
+        values = array(getattr(processos, column).typecode)
+        size = values.itemsize * count
+        values.frombytes(view[offset:offset + size])
+        setattr(processos, column, values)
+        offset += size
+    for column in ("user", "name"):
+        joined, offset = _read_str(view, offset)
+        table = joined.split("\0") if joined or count else []
+        indices = array("I")
+        indices.frombytes(view[offset:offset + indices.itemsize * count])
+        offset += indices.itemsize * count
+        setattr(processos, column, [table[index] for index in indices])
+    processos.io_rate = array("d", [-1.0]) * count
+    processos.starttime = array("Q", [0]) * count
+    dados.processosAtivos = processos
+    dados.processos_listados = count
+    return dados
+
+
+def _write_str(parts, text):
+    """Grava uma string UTF-8 precedida do seu tamanho."""
+    data = text.encode("utf-8", errors="replace")
+    parts.append(COUNT.pack(len(data)))
+    parts.append(data)
+
+
+def _read_str(view, offset):
+    """Lê uma string gravada por `_write_str`; retorna (texto, novo offset)."""
+    (size,) = COUNT.unpack_from(view, offset)
+    offset += COUNT.size
+    return bytes(view[offset:offset + size]).decode("utf-8"), offset + size
+
+
+def _write_array(parts, values):
+    """Grava um array precedido da quantidade de elementos."""
+    parts.append(COUNT.pack(len(values)))
+    parts.append(values.tobytes())
+
+
+def _read_array(view, offset, typecode):
+    """Lê um array gravado por `_write_array`; retorna (array, novo offset)."""
+    (count,) = COUNT.unpack_from(view, offset)
+    offset += COUNT.size
+    values = array(typecode)
+    size = values.itemsize * count
+    values.frombytes(view[offset:offset + size])
+    return values, offset + size
+
+
+def _recv_exact(sock, size):
+    """
+    Lê exatamente `size` bytes do socket (ou levanta ConnectionError se ele fechar).
+    """
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("Conexão encerrada pelo coletor")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+class CollectorDaemon:
+    """
+    Daemon que coleta as informações do sistema em intervalos regulares e as publica
+    em um socket Unix.
+
+    Atributos:
+        socket_path (str): Caminho do socket Unix.
+        interval (float): Intervalo entre coletas, em segundos.
+        version (int): Versão (sequencial) do último snapshot publicado.
+        recorder (MetricsRecorder): Gravação em disco dos snapshots publicados (ou None).
+    """
+
+    def __init__(self, socket_path, interval=1.0, recorder=None):
+        self.socket_path = socket_path
+        self.interval = interval
+        self.recorder = recorder
+        self.version = 0
+        self.frame = HEADER.pack(MAGIC, PROTOCOL_VERSION, 0, 0)
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.server = None
+
+    def publish(self, dados):
+        """
+        Serializa e publica um novo snapshot, incrementando a versão (e o grava em disco,
+        se houver gravação ativa).
+        """
+        payload = encode_snapshot(dados)
+        if self.recorder is not None:
+            self.recorder.append_payload(payload, dados.cpu_usage, dados.mUsada)
+        with self.lock:
+            self.version += 1
+            self.frame = HEADER.pack(MAGIC, PROTOCOL_VERSION, self.version, len(payload)) + payload
+
+    def current(self, since):
+        """
+        Retorna o frame a enviar a um cliente que possui a versão `since`.
+        """
+        with self.lock:
+            if since == self.version:
+                return HEADER.pack(MAGIC, PROTOCOL_VERSION, self.version, 0)  # Não modificado
+            return self.frame
+
+    def collect_loop(self):
+        """
+        Executa os coletores a cada `interval` segundos até o daemon ser encerrado.
+
+        Cada ciclo é registrado no `profiler` como uma atualização da fonte "daemon".
+        """
+        while not self.stop_event.is_set():
+            started = time.monotonic()
+            try:
+                with profiler.stage("daemon.collect") as collect:
+                    dados = collect_system_info(self.executor)
+                with profiler.stage("daemon.publish") as publish:
+                    self.publish(dados)
+                dropped = int((collect.elapsed + publish.elapsed) // self.interval) if self.interval else 0
+                profiler.record_tick("daemon", collect.elapsed, publish.elapsed, dropped)
+            except Exception:
+                print("CollectorDaemon - collect_loop: Erro ao coletar os dados do sistema")
+                traceback.print_exc()
+            self.stop_event.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def serve_forever(self):
+        """
+        Inicia a coleta em background e atende os clientes até ser interrompido.
+        """
+        remove_stale_socket(self.socket_path)
+        daemon = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                try:
+                    while True:
+                        (since,) = REQUEST.unpack(_recv_exact(self.request, REQUEST.size))
+                        self.request.sendall(daemon.current(since))
+                except (ConnectionError, OSError):
+                    pass  # Cliente desconectou
+
+        self.server = socketserver.ThreadingUnixStreamServer(self.socket_path, Handler)
+        self.server.daemon_threads = True
+        os.chmod(self.socket_path, 0o600)
+        collector = threading.Thread(target=self.collect_loop, daemon=True)
+        collector.start()
+        print(f"Coletor ativo em {self.socket_path} (intervalo de {self.interval}s)")
+        try:
+            self.server.serve_forever()
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        """
+        Encerra a coleta e remove o socket.
+        """
+        self.stop_event.set()
+        if self.server is not None:
+            self.server.server_close()
+        self.executor.shutdown(wait=False)
+        if self.recorder is not None:
+            self.recorder.close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+def remove_stale_socket(path):
+    """
+    Remove um socket deixado por um coletor encerrado; falha se outro coletor estiver ativo.
+    """
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)  # Ninguém escutando: socket antigo
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"Já existe um coletor ativo em {path}")
+
+
+class SnapshotClient:
+    """
+    Cliente do `CollectorDaemon`: obtém os snapshots publicados sem varrer o /proc localmente.
+
+    Atributos:
+        socket_path (str): Caminho do socket Unix do coletor.
+        version (int): Versão do último snapshot recebido.
+        dados (SystemInfo): Último snapshot recebido.
+    """
+
+    def __init__(self, socket_path, timeout=5.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.version = 0
+        self.dados = SystemInfo()
+        self.sock = None
+        self.lock = threading.Lock()
+
+    def fetch(self):
+        """
+        Obtém o snapshot atual do coletor (reconectando uma vez se a conexão caiu).
+
+        Retorno:
+            SystemInfo: Último snapshot publicado (o mesmo objeto se não houve mudança).
+        """
+        with self.lock:
+            try:
+                return self._fetch()
+            except (ConnectionError, OSError):
+                self.close()
+                return self._fetch()
+
+    def _fetch(self):
+        if self.sock is None:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(self.timeout)
+            self.sock.connect(self.socket_path)
+        self.sock.sendall(REQUEST.pack(self.version))
+        magic, protocol, version, size = HEADER.unpack(_recv_exact(self.sock, HEADER.size))
+        if magic != MAGIC or protocol != PROTOCOL_VERSION:
+            raise ConnectionError(f"Protocolo do coletor incompatível ({magic!r} v{protocol})")
+        if size:
+            self.dados = decode_snapshot(_recv_exact(self.sock, size))
+            self.version = version
+        return self.dados
+
+    def close(self):
+        """
+        Fecha a conexão com o coletor.
+
+        A versão recebida é descartada: as versões são sequenciais por processo do coletor,
+        e após um reinício dele a mesma versão identificaria outro snapshot. A próxima
+        conexão sempre recebe o snapshot completo.
+        """
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
+        self.version = 0
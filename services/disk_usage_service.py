@@ -0,0 +1,238 @@
+"""
+Cálculo do uso em disco recursivo dos diretórios (como o `du -x`), em background.
+
+O `DiskUsageEngine` percorre, em uma thread própria, cada subdiretório do diretório
+exibido e informa o uso em disco de cada um assim que termina (e, para subdiretórios
+grandes, o total parcial a cada `PROGRESS_INTERVAL` segundos). O percurso:
+    - usa `os.scandir`, cujo `is_dir` vem do próprio diretório, sem um stat por entrada;
+    - conta cada arquivo com vários hardlinks uma única vez, por (dispositivo, inode);
+    - não atravessa pontos de montagem (fica no sistema de arquivos do diretório exibido);
+    - soma os blocos alocados (`st_blocks`), e não o tamanho aparente.
+
+O resumo de cada diretório (blocos dos arquivos, hardlinks e subdiretórios) fica em um
+cache indexado pelo caminho e validado pelo mtime do diretório: ao voltar a uma árvore já
+percorrida, só os diretórios cujo mtime mudou (entradas criadas, removidas ou renomeadas)
+são listados novamente; os demais custam um `lstat`. Alterações no conteúdo de arquivos
+existentes não mudam o mtime do diretório e só são vistas quando ele é relistado.
+"""
+
+import os
+import stat
+import threading
+import time
+import traceback
+
+from services.profiling_service import profiler
+
+PROGRESS_INTERVAL = 0.5  # Intervalo (s) entre totais parciais de um subdiretório
+DU_CACHE_MAX = 500000  # Diretórios no cache; acima disso o cache é descartado
+
+
+def allocated_size(info):
+    """
+    Retorna o espaço em disco (bytes) ocupado por uma entrada (tamanho aparente se o
+    sistema não informa os blocos alocados, p.ex. no Windows).
+    """
+    blocks = getattr(info, "st_blocks", None)
+    return blocks * 512 if blocks is not None else info.st_size
+
+
+class DirectorySummary:
+    """
+    Resumo do conteúdo imediato de um diretório, guardado no cache.
+
+    Atributos:
+        mtime_ns (int): mtime do diretório quando foi listado.
+        inode (int): Inode do diretório (um diretório recriado no mesmo caminho é relistado).
+        own (int): Bytes do próprio diretório e de seus arquivos com um único link.
+        links (tuple): (dispositivo, inode, bytes) dos arquivos com vários hardlinks.
+        subdirs (tuple): Nomes dos subdiretórios.
+    """
+
+    __slots__ = ("mtime_ns", "inode", "own", "links", "subdirs")
+
+    def __init__(self, mtime_ns, inode, own, links, subdirs):
+        self.mtime_ns = mtime_ns
+        self.inode = inode
+        self.own = own
+        self.links = links
+        self.subdirs = subdirs
+
+
+class DiskUsageCache:
+    """
+    Cache dos resumos dos diretórios, validado pelo mtime (compartilhado entre os frames).
+    """
+
+    def __init__(self, max_entries=DU_CACHE_MAX):
+        self.max_entries = max_entries
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.listed = 0  # Diretórios listados (não encontrados ou inválidos no cache)
+
+    def summary(self, path, info):
+        """
+        Retorna o resumo de um diretório, listando-o apenas se o mtime mudou.
+
+        Parâmetros:
+            path (str): Caminho do diretório.
+            info (os.stat_result): Resultado do `lstat` do diretório.
+        """
+        with self.lock:
+            cached = self.entries.get(path)
+        if cached is not None and cached.mtime_ns == info.st_mtime_ns and cached.inode == info.st_ino:
+            return cached
+
+        own, links, subdirs = allocated_size(info), [], []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                            continue
+                        entry_info = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue  # Entrada removida durante a listagem
+                    if entry_info.st_nlink > 1 and not stat.S_ISDIR(entry_info.st_mode):
+                        links.append((entry_info.st_dev, entry_info.st_ino, allocated_size(entry_info)))
+                    else:
+                        own += allocated_size(entry_info)
+        except OSError:
+            pass  # Sem permissão: conta apenas o próprio diretório
+        summary = DirectorySummary(info.st_mtime_ns, info.st_ino, own, tuple(links), tuple(subdirs))
+        with self.lock:
+            if len(self.entries) >= self.max_entries:
+                self.entries.clear()
+            self.entries[path] = summary
+            self.listed += 1
+        return summary
+
+
+_usage_cache = DiskUsageCache()
+
+
+class DiskUsageEngine:
+    """
+    Calcula em background o uso em disco dos subdiretórios de um diretório.
+
+    Um único cálculo fica em andamento: `start` cancela o anterior. O callback é chamado
+    na thread do engine como `callback(nome, bytes, concluído)`, com `bytes` None para
+    subdiretórios em outro sistema de arquivos, e ao final com `nome` None e o total do
+    diretório.
+    """
+
+    def __init__(self, cache=None):
+        self.cache = cache or _usage_cache
+        self.condition = threading.Condition()
+        self.job = None  # (geração, caminho, callback) aguardando a thread
+        self.generation = 0
+        self.closed = False
+        self.thread = None
+
+    def start(self, path, callback):
+        """
+        Inicia o cálculo do uso em disco dos subdiretórios de `path`.
+        """
+        with self.condition:
+            self.generation += 1
+            self.job = (self.generation, path, callback)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="disk-usage", daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def cancel(self):
+        """
+        Cancela o cálculo em andamento.
+        """
+        with self.condition:
+            self.generation += 1
+            self.job = None
+
+    def close(self):
+        """
+        Cancela o cálculo em andamento e encerra a thread.
+        """
+        with self.condition:
+            self.closed = True
+            self.generation += 1
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.job is None and not self.closed:
+                    self.condition.wait()
+                if self.closed:
+                    return
+                job, self.job = self.job, None
+            try:
+                self.measure(*job)
+            except Exception:
+                print(f"DiskUsageEngine - run: Erro ao calcular o uso em disco de {job[1]}")
+                traceback.print_exc()
+
+    @profiler.timed("collect.disk_usage")
+    def measure(self, generation, path, callback):
+        """
+        Percorre os subdiretórios de `path`, informando o uso de cada um ao callback.
+        """
+        try:
+            root = os.lstat(path)
+        except OSError:
+            return
+        seen = set()  # Arquivos com vários hardlinks já contados, por (dispositivo, inode)
+        summary = self.cache.summary(path, root)
+        total = summary.own + self.count_links(summary, seen)
+        for name in summary.subdirs:
+            size = self.subtree_usage(os.path.join(path, name), root.st_dev, seen, generation,
+                                      lambda partial: callback(name, partial, False))
+            if generation != self.generation:
+                return  # Cancelado (outro diretório exibido)
+            callback(name, size, True)
+            total += size or 0
+        callback(None, total, True)
+
+    def subtree_usage(self, path, device, seen, generation, progress):
+        """
+        Soma o uso em disco de uma subárvore, sem sair do dispositivo `device`.
+
+        Retorno:
+            int: Bytes ocupados, ou None se `path` está em outro sistema de arquivos.
+        """
+        total = 0
+        stack = [path]
+        next_progress = time.monotonic() + PROGRESS_INTERVAL
+        while stack:
+            if generation != self.generation:
+                return total
+            current = stack.pop()
+            try:
+                info = os.lstat(current)
+            except OSError:
+                continue  # Removido durante o percurso
+            if info.st_dev != device:
+                if current == path:
+                    return None
+                continue  # Ponto de montagem: não atravessa
+            summary = self.cache.summary(current, info)
+            total += summary.own + self.count_links(summary, seen)
+            stack.extend(os.path.join(current, name) for name in summary.subdirs)
+            if time.monotonic() >= next_progress:
+                progress(total)
+                next_progress = time.monotonic() + PROGRESS_INTERVAL
+        return total
+
+    @staticmethod
+    def count_links(summary, seen):
+        """
+        Soma os arquivos com vários hardlinks de um diretório ainda não contados.
+        """
+        total = 0
+        for device, inode, size in summary.links:
+            key = (device, inode)
+            if key not in seen:
+                seen.add(key)
+                total += size
+        return total
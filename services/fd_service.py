@@ -0,0 +1,158 @@
+"""
+Varredura incremental dos descritores de arquivo de um processo (`/proc/[pid]/fd`).
+
+O `FdTracker` guarda o destino de cada descritor visto na varredura anterior. A cada
+varredura, o diretório é listado (apenas os números) e `readlink` é chamado somente para
+os descritores novos; o resultado (`FdScan`) contém só os descritores abertos e fechados
+desde então, além da quantidade por tipo (arquivo, socket, pipe, anon_inode, dispositivo),
+mantida incrementalmente.
+
+Um descritor fechado e reaberto com o mesmo número entre duas varreduras não muda a
+listagem; para que um destino desatualizado não permaneça indefinidamente, cada varredura
+também relê o destino de até `FD_REVALIDATE` descritores já conhecidos, em rodízio.
+
+O tamanho, o mtime e o inode do destino real (o `lstat` do link em /proc descreve o
+próprio link) são consultados com `stat_targets`, somente para os descritores exibidos.
+"""
+
+import re
+import traceback
+
+from models.fd_scan_model import FdScan, FD_TYPES
+from services.profiling_service import profiler
+from services.system_info_service import get_proc_source
+
+FD_REVALIDATE = 1024  # Descritores conhecidos cujo destino é relido a cada varredura
+
+_ANON_TARGET = re.compile(r"(socket|pipe):\[(\d+)\]")
+
+
+def classify_fd_target(target):
+    """
+    Classifica um descritor pelo destino do seu link em `/proc/[pid]/fd`.
+
+    Retorno:
+        str: "socket", "pipe", "anon_inode", "device", "file" ou "other" (p.ex. namespaces
+            abertos, "net:[...]", ou destino ilegível).
+    """
+    if target.startswith("socket:"):
+        return "socket"
+    if target.startswith("pipe:"):
+        return "pipe"
+    if target.startswith("anon_inode:"):
+        return "anon_inode"
+    if target.startswith("/dev/") and not target.startswith("/dev/shm/"):
+        return "device"
+    if target.startswith("/"):
+        return "file"
+    return "other"
+
+
+def fd_target_inode(target):
+    """
+    Retorna o inode indicado no próprio destino de sockets e pipes ("socket:[12345]"), ou
+    None para os demais destinos (cujo inode exige um stat).
+    """
+    match = _ANON_TARGET.match(target)
+    return int(match.group(2)) if match else None
+
+
+class FdTracker:
+    """
+    Acompanha os descritores abertos por um processo entre varreduras sucessivas.
+
+    Atributos:
+        pid (int): ID do processo.
+        targets (dict): Descritores abertos na última varredura: fd -> (tipo, destino).
+        counts (dict): Quantidade de descritores por tipo na última varredura.
+    """
+
+    def __init__(self, pid):
+        self.pid = int(pid)
+        self.targets = {}
+        self.counts = dict.fromkeys(FD_TYPES, 0)
+        self.scanned = False
+        self.revalidate_from = 0
+
+    @profiler.timed("collect.fds")
+    def scan(self):
+        """
+        Lista `/proc/[pid]/fd` e retorna as alterações desde a varredura anterior.
+
+        Retorno:
+            FdScan: Descritores abertos e fechados, e a quantidade atual por tipo. Se o
+                diretório não puder ser lido (processo encerrado, sem permissão), todos
+                os descritores conhecidos são informados como fechados e `error` é preenchido.
+        """
+        source = get_proc_source()
+        fd_dir = f"{self.pid}/fd"
+        reset = not self.scanned
+        self.scanned = True
+        try:
+            current = {int(name) for name in source.listdir(fd_dir)}
+        except OSError as e:
+            closed = list(self.targets)
+            self.targets = {}
+            self.counts = dict.fromkeys(FD_TYPES, 0)
+            error = "processo encerrado" if isinstance(e, FileNotFoundError) else e.strerror
+            return FdScan(self.pid, closed=closed, counts=dict(self.counts), reset=reset, error=error)
+
+        targets, counts = self.targets, self.counts
+        closed = [fd for fd in targets if fd not in current]
+        for fd in closed:
+            counts[targets.pop(fd)[0]] -= 1
+
+        to_read = [fd for fd in current if fd not in targets]
+        known = len(targets)
+        if known:
+            start = self.revalidate_from % known
+            to_read.extend(list(targets)[start:start + FD_REVALIDATE])
+            self.revalidate_from = start + FD_REVALIDATE
+
+        opened = {}
+        for fd in to_read:
+            try:
+                target = source.readlink(f"{fd_dir}/{fd}")
+            except FileNotFoundError:
+                # Fechado durante a varredura (p.ex. o descritor da própria listagem)
+                previous = targets.pop(fd, None)
+                if previous is not None:
+                    closed.append(fd)
+                    counts[previous[0]] -= 1
+                continue
+            except OSError:
+                target = "N/A"
+            previous = targets.get(fd)
+            if previous is not None:
+                if previous[1] == target:
+                    continue
+                closed.append(fd)  # Reaberto com outro destino desde a varredura anterior
+                counts[previous[0]] -= 1
+            kind = classify_fd_target(target)
+            targets[fd] = opened[fd] = (kind, target)
+            counts[kind] += 1
+        return FdScan(self.pid, opened, closed, dict(counts), len(targets), reset)
+
+    def stat_targets(self, fds):
+        """
+        Consulta o destino real (seguindo o link) de alguns descritores.
+
+        Parâmetros:
+            fds (iterable): Números dos descritores.
+
+        Retorno:
+            dict: fd -> `os.stat_result`, ou None se o descritor foi fechado ou o destino
+                não pode ser consultado.
+        """
+        source = get_proc_source()
+        stats = {}
+        for fd in fds:
+            try:
+                stats[fd] = source.stat(f"{self.pid}/fd/{fd}")
+            except OSError:
+                stats[fd] = None
+            except Exception:
+                print(f"FdTracker - stat_targets: Erro ao consultar o descritor {fd} do PID {self.pid}")
+                traceback.print_exc()
+                stats[fd] = None
+        return stats
@@ -0,0 +1,358 @@
+"""
+Histórico de métricas em buffers circulares com níveis de agregação (downsampling).
+
+Cada métrica é registrada simultaneamente em vários níveis (p.ex. 1 s, 10 s e 1 min). Em
+cada nível, as amostras de um intervalo são agregadas em (mínimo, média, máximo) e gravadas
+em um buffer circular de capacidade fixa, de modo que a memória usada é limitada
+independentemente do tempo de execução.
+
+Os pontos são indexados pelo timestamp (relógio de parede) da amostra, pois os gráficos e
+as gravações usam esse relógio. Se ele voltar no tempo (ajuste manual, NTP), cada nível
+descarta os pontos posteriores à nova amostra e continua a partir dela, mantendo os
+buffers em ordem cronológica para a busca binária das consultas.
+"""
+
+import heapq
+import threading
+import time
+from array import array
+from collections import OrderedDict
+
+# Níveis (resolução em segundos, capacidade em pontos) de cada tipo de métrica
+SYSTEM_TIERS = ((1, 3600), (10, 8640), (60, 10080))  # 1 h, 24 h e 7 dias
+PROCESS_TIERS = ((1, 300), (10, 360), (60, 240))     # 5 min, 1 h e 4 h
+MOUNT_TIERS = ((10, 360), (60, 1440))                # 1 h e 24 h
+
+MAX_PROCESS_HISTORIES = 64  # Processos com histórico (os de maior RSS e CPU a cada ciclo)
+MAX_MOUNT_HISTORIES = 64
+
+
+class RingBuffer:
+    """
+    Buffer circular de pontos (tempo, mínimo, média, máximo) com capacidade fixa.
+
+    Os arrays crescem até a capacidade e, a partir daí, os pontos mais antigos são
+    sobrescritos.
+
+    Atributos:
+        capacity (int): Quantidade máxima de pontos.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.times = array("d")
+        self.mins = array("d")
+        self.avgs = array("d")
+        self.maxs = array("d")
+        self.start = 0  # Posição física do ponto mais antigo
+
+    def append(self, t, minimum, average, maximum):
+        """
+        Adiciona um ponto, sobrescrevendo o mais antigo se o buffer estiver cheio.
+        """
+        if len(self.times) < self.capacity:
+            self.times.append(t)
+            self.mins.append(minimum)
+            self.avgs.append(average)
+            self.maxs.append(maximum)
+            return
+        i = self.start
+        self.times[i], self.mins[i], self.avgs[i], self.maxs[i] = t, minimum, average, maximum
+        self.start = (i + 1) % self.capacity
+
+    def __len__(self):
+        return len(self.times)
+
+    def oldest(self):
+        """
+        Retorna o tempo do ponto mais antigo (ou None se vazio).
+        """
+        return self.times[self.start] if self.times else None
+
+    def points(self, start, end):
+        """
+        Retorna, em ordem cronológica, os pontos com tempo no intervalo [start, end].
+
+        Retorno:
+            list: Tuplas (tempo, mínimo, média, máximo).
+        """
+        count = len(self.times)
+        physical = lambda logical: (self.start + logical) % count
+        first = self._search(start, count, physical)
+        result = []
+        for logical in range(first, count):
+            i = physical(logical)
+            if self.times[i] > end:
+                break
+            result.append((self.times[i], self.mins[i], self.avgs[i], self.maxs[i]))
+        return result
+
+    def truncate(self, t):
+        """
+        Descarta os pontos com tempo >= t (usado quando o relógio volta no tempo).
+        """
+        count = len(self.times)
+        physical = lambda logical: (self.start + logical) % count
+        keep = self._search(t, count, physical)
+        if keep == count:
+            return
+        order = [physical(logical) for logical in range(keep)]
+        self.times = array("d", (self.times[i] for i in order))
+        self.mins = array("d", (self.mins[i] for i in order))
+        self.avgs = array("d", (self.avgs[i] for i in order))
+        self.maxs = array("d", (self.maxs[i] for i in order))
+        self.start = 0
+
+    def _search(self, t, count, physical):
+        """
+        Busca binária do primeiro ponto (em ordem lógica) com tempo >= t.
+        """
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if self.times[physical(middle)] < t:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+
+class Tier:
+    """
+    Nível de agregação de uma métrica: acumula as amostras do intervalo atual e grava
+    (mínimo, média, máximo) no buffer circular quando o intervalo termina.
+    """
+
+    def __init__(self, resolution, capacity):
+        self.resolution = resolution
+        self.buffer = RingBuffer(capacity)
+        self.bucket = None  # Início do intervalo sendo acumulado
+        self.minimum = self.maximum = self.total = 0.0
+        self.count = 0
+
+    def add(self, t, value):
+        bucket = t - t % self.resolution
+        if self.bucket is not None and bucket < self.bucket:
+            # O relógio voltou: descarta o intervalo em acumulação e os pontos a partir
+            # do novo intervalo, recomeçando o nível nele
+            self.count = 0
+            self.buffer.truncate(bucket)
+        if bucket != self.bucket:
+            self.flush()
+            self.bucket = bucket
+            self.minimum = self.maximum = value
+            self.total = 0.0
+            self.count = 0
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.total += value
+        self.count += 1
+
+    def flush(self):
+        if self.count:
+            self.buffer.append(self.bucket, self.minimum, self.total / self.count, self.maximum)
+            self.count = 0
+
+    def current(self):
+        """
+        Retorna o ponto do intervalo ainda em acumulação (ou None).
+        """
+        if not self.count:
+            return None
+        return (self.bucket, self.minimum, self.total / self.count, self.maximum)
+
+    def coverage(self):
+        """
+        Retorna o tempo mais antigo disponível neste nível (ou None).
+        """
+        oldest = self.buffer.oldest()
+        return oldest if oldest is not None else self.bucket
+
+
+class MetricHistory:
+    """
+    Histórico de uma métrica em vários níveis de resolução.
+    """
+
+    def __init__(self, tiers):
+        self.tiers = [Tier(resolution, capacity) for resolution, capacity in tiers]
+        self.last_update = 0.0
+
+    def add(self, t, value):
+        self.last_update = t
+        for tier in self.tiers:
+            tier.add(t, value)
+
+    def query(self, start, end, points):
+        """
+        Retorna os pontos do intervalo [start, end] no nível mais fino que atenda à
+        quantidade de pontos pedida e que cubra o início do intervalo.
+
+        Parâmetros:
+            start (float): Início do intervalo (timestamp).
+            end (float): Fim do intervalo (timestamp).
+            points (int): Quantidade máxima de pontos desejada (p.ex. largura do gráfico).
+
+        Retorno:
+            list: Tuplas (tempo, mínimo, média, máximo), no máximo `points` itens.
+        """
+        wanted = (end - start) / max(points, 1)
+        chosen = self.tiers[-1]
+        for tier in self.tiers:
+            covered = tier.coverage() is not None and tier.coverage() <= start
+            if tier.resolution >= wanted and covered:
+                chosen = tier
+                break
+        else:
+            # Nenhum nível cobre todo o intervalo: usa o mais fino que tenha resolução suficiente
+            for tier in self.tiers:
+                if tier.resolution >= wanted:
+                    chosen = tier
+                    break
+
+        result = chosen.buffer.points(start, end)
+        current = chosen.current()
+        if current is not None and start <= current[0] <= end:
+            result.append(current)
+        return downsample(result, points)
+
+
+def downsample(points, limit):
+    """
+    Agrupa pontos consecutivos até que restem no máximo `limit` pontos
+    (mínimo dos mínimos, média das médias, máximo dos máximos).
+    """
+    if len(points) <= limit or limit <= 0:
+        return points
+    size = -(-len(points) // limit)
+    result = []
+    for first in range(0, len(points), size):
+        group = points[first:first + size]
+        result.append((
+            group[0][0],
+            min(point[1] for point in group),
+            sum(point[2] for point in group) / len(group),
+            max(point[3] for point in group),
+        ))
+    return result
+
+
+class HistoryStore:
+    """
+    Conjunto de históricos do dashboard: CPU, memória, swap, RSS/CPU por processo e uso
+    por ponto de montagem.
+
+    Os históricos por processo são mantidos apenas para um conjunto limitado de processos
+    (os de maior RSS e maior CPU a cada ciclo); os menos recentes são descartados quando o
+    limite é atingido, assim como os de pontos de montagem.
+    """
+
+    def __init__(self, max_processes=MAX_PROCESS_HISTORIES, max_mounts=MAX_MOUNT_HISTORIES):
+        self.max_processes = max_processes
+        self.max_mounts = max_mounts
+        self.metrics = {}
+        self.processes = OrderedDict()  # pid -> (histórico de RSS, histórico de CPU, starttime)
+        self.mounts = OrderedDict()     # ponto de montagem -> histórico de uso (%)
+        self.lock = threading.Lock()
+
+    def record(self, name, value, t=None, tiers=SYSTEM_TIERS):
+        """
+        Registra uma amostra de uma métrica do sistema.
+
+        Parâmetros:
+            name (str): Nome da métrica (p.ex. "cpu").
+            value (float): Valor da amostra.
+            t (float, opcional): Timestamp da amostra (padrão: agora).
+        """
+        t = time.time() if t is None else t
+        with self.lock:
+            history = self.metrics.get(name)
+            if history is None:
+                history = self.metrics[name] = MetricHistory(tiers)
+            history.add(t, value)
+
+    def record_system(self, dados, processos=None, t=None):
+        """
+        Registra CPU (%), memória usada (KB) e swap usada (KB) de um `SystemInfo`,
+        e o RSS/CPU dos processos de maior consumo.
+
+        Parâmetros:
+            dados (SystemInfo): Dados da coleta atual.
+            processos (ProcessSnapshot, opcional): Varredura completa dos processos
+                (padrão: `dados.processosAtivos`, que pode estar filtrada pela consulta da tabela).
+            t (float, opcional): Timestamp da coleta (padrão: agora).
+        """
+        t = time.time() if t is None else t
+        self.record("cpu", dados.cpu_usage, t)
+        self.record("memory", dados.mUsada, t)
+        self.record("swap", getattr(dados, "swapTotal", 0) - getattr(dados, "swapFree", 0), t)
+        self.record_processes(dados.processosAtivos if processos is None else processos, t)
+
+    def record_processes(self, processos, t=None):
+        """
+        Registra RSS (KB) e CPU (%) dos processos de maior RSS e de maior CPU.
+
+        O histórico de um PID é descartado quando seu `starttime` muda: o PID foi reutilizado
+        por outro processo.
+
+        Parâmetros:
+            processos (ProcessSnapshot): Processos da varredura atual.
+        """
+        t = time.time() if t is None else t
+        count = len(processos)
+        half = self.max_processes // 2
+        by_rss = heapq.nlargest(half, range(count), key=processos.rss.__getitem__)
+        by_cpu = heapq.nlargest(half, range(count), key=processos.cpu.__getitem__)
+        with self.lock:
+            for i in dict.fromkeys(by_rss + by_cpu):
+                pid, starttime = processos.pid[i], processos.starttime[i]
+                histories = self.processes.pop(pid, None)
+                if histories is None or histories[2] != starttime:
+                    histories = (MetricHistory(PROCESS_TIERS), MetricHistory(PROCESS_TIERS), starttime)
+                self.processes[pid] = histories  # Move para o fim (mais recente)
+                histories[0].add(t, processos.rss[i])
+                histories[1].add(t, processos.cpu[i])
+            while len(self.processes) > self.max_processes:
+                self.processes.popitem(last=False)
+
+    def record_partitions(self, partitions, t=None):
+        """
+        Registra o percentual de uso de cada ponto de montagem.
+
+        Parâmetros:
+            partitions (list): Partições retornadas por `fetch_filesystem_info`.
+        """
+        t = time.time() if t is None else t
+        with self.lock:
+            for part in partitions:
+                mountpoint = part["mountpoint"]
+                history = self.mounts.pop(mountpoint, None) or MetricHistory(MOUNT_TIERS)
+                self.mounts[mountpoint] = history
+                history.add(t, part["percent"])
+            while len(self.mounts) > self.max_mounts:
+                self.mounts.popitem(last=False)
+
+    def query(self, name, start, end, points):
+        """
+        Consulta o histórico de uma métrica (ver `MetricHistory.query`).
+
+        Nomes aceitos: "cpu", "memory", "swap", "process:<pid>:rss", "process:<pid>:cpu"
+        e "mount:<ponto de montagem>".
+
+        Retorno:
+            list: Tuplas (tempo, mínimo, média, máximo); vazia se a métrica não existir.
+        """
+        with self.lock:
+            history = self._find(name)
+            return history.query(start, end, points) if history is not None else []
+
+    def _find(self, name):
+        if name.startswith("process:"):
+            _, pid, metric = name.split(":")
+            histories = self.processes.get(int(pid))
+            if histories is None:
+                return None
+            return histories[0] if metric == "rss" else histories[1]
+        if name.startswith("mount:"):
+            return self.mounts.get(name[len("mount:"):])
+        return self.metrics.get(name)
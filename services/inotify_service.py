@@ -0,0 +1,193 @@
+"""
+Observação de diretórios via inotify (Linux), acessado por `ctypes` sem dependências externas.
+
+`DirectoryWatcher` observa um diretório por vez e devolve, a cada leitura não bloqueante,
+os nomes das entradas criadas, removidas ou modificadas desde a leitura anterior. Quando
+o inotify não está disponível (outro sistema operacional, limite de watches esgotado) ou
+o sistema de arquivos não entrega eventos de alterações feitas em outras máquinas (NFS,
+CIFS, FUSE, pseudo-sistemas como /proc), `watch` retorna False e quem chama deve
+continuar listando o diretório periodicamente.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import struct
+import threading
+import traceback
+
+from services.system_info_service import read_mounts
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE |
+              IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+RESCAN_MASK = IN_Q_OVERFLOW | IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF  # Exigem nova listagem
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len (struct inotify_event)
+READ_SIZE = 65536
+
+# Sistemas de arquivos em que o inotify não vê (todas) as alterações: continuam com polling
+POLLING_FSTYPES = {
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "afs", "ceph", "glusterfs", "lustre",
+    "proc", "sysfs", "cgroup", "cgroup2", "debugfs", "tracefs", "securityfs", "configfs",
+}
+
+_libc = None
+_libc_lock = threading.Lock()
+
+
+def load_libc():
+    """
+    Carrega a libc e as funções do inotify.
+
+    Retorno:
+        ctypes.CDLL: A libc, ou None se o inotify não estiver disponível.
+    """
+    global _libc
+    with _libc_lock:
+        if _libc is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+                libc.inotify_init1.argtypes = [ctypes.c_int]
+                libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+                libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+                _libc = libc
+            except (OSError, AttributeError):
+                _libc = False  # Sem libc ou sem inotify (p.ex. Windows, macOS)
+        return _libc or None
+
+
+def filesystem_type(path):
+    """
+    Retorna o tipo do sistema de arquivos que contém `path` (ponto de montagem mais longo
+    de /proc/mounts que é prefixo do caminho), ou None se não for possível determiná-lo.
+    """
+    path = os.path.realpath(path)
+    best, fstype = "", None
+    for _, mountpoint, mount_type in read_mounts():
+        if (path == mountpoint or path.startswith(mountpoint.rstrip("/") + "/")) and len(mountpoint) >= len(best):
+            best, fstype = mountpoint, mount_type
+    return fstype
+
+
+def supports_inotify(path):
+    """
+    Indica se as alterações em `path` podem ser acompanhadas pelo inotify.
+    """
+    if load_libc() is None:
+        return False
+    fstype = filesystem_type(path)
+    return fstype is not None and fstype not in POLLING_FSTYPES and not fstype.startswith("fuse")
+
+
+class DirectoryWatcher:
+    """
+    Observa as entradas de um diretório com o inotify.
+
+    Atributos:
+        path (str): Diretório observado (ou None).
+        fd (int): Descritor do inotify (ou None se indisponível).
+    """
+
+    def __init__(self):
+        self.path = None
+        self.fd = None
+        self.wd = None
+        libc = load_libc()
+        if libc is None:
+            return
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            print(f"inotify_service - DirectoryWatcher: inotify_init1 falhou ({os.strerror(ctypes.get_errno())})")
+            return
+        self.fd = fd
+
+    def watch(self, path):
+        """
+        Passa a observar `path` (deixando de observar o diretório anterior).
+
+        Retorno:
+            bool: True se o diretório está sendo observado; False se o chamador deve usar
+                polling (inotify indisponível ou sistema de arquivos sem suporte).
+        """
+        if path == self.path and self.wd is not None:
+            return True
+        self.unwatch()
+        if self.fd is None or not supports_inotify(path):
+            return False
+        self.read_events()  # Descarta eventos do diretório anterior ainda na fila
+        wd = _libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error not in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                print(f"inotify_service - DirectoryWatcher: Erro ao observar {path} ({os.strerror(error)})")
+            return False
+        self.path, self.wd = path, wd
+        return True
+
+    def unwatch(self):
+        """
+        Deixa de observar o diretório atual.
+        """
+        if self.wd is not None:
+            _libc.inotify_rm_watch(self.fd, self.wd)
+        self.path = self.wd = None
+
+    def read_events(self):
+        """
+        Lê, sem bloquear, os eventos pendentes do diretório observado.
+
+        Retorno:
+            tuple: (nomes, rescan)
+                - nomes (set): Entradas criadas, removidas ou modificadas.
+                - rescan (bool): Os eventos não bastam para atualizar a listagem (fila do
+                  kernel transbordou ou o próprio diretório foi removido/movido); o
+                  diretório deixa de ser observado e deve ser listado novamente.
+        """
+        names, rescan = set(), False
+        if self.fd is None:
+            return names, rescan
+        while True:
+            try:
+                buffer = os.read(self.fd, READ_SIZE)
+            except BlockingIOError:
+                break
+            except OSError:
+                traceback.print_exc()
+                rescan = True
+                break
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(buffer):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+                offset += EVENT_HEADER.size
+                name = buffer[offset:offset + length].split(b"\0", 1)[0]
+                offset += length
+                if mask & IN_Q_OVERFLOW or (wd == self.wd and mask & RESCAN_MASK):
+                    rescan = True
+                elif wd == self.wd and name:
+                    names.add(os.fsdecode(name))
+        if rescan:
+            self.unwatch()  # Se o kernel já removeu o watch (IN_IGNORED), a remoção só falha
+        return names, rescan
+
+    def close(self):
+        """
+        Fecha o descritor do inotify.
+        """
+        self.unwatch()
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
@@ -0,0 +1,211 @@
+"""
+Índice das conexões de rede do sistema, construído a partir das tabelas do /proc/net.
+
+`build_net_index` lê `/proc/net/tcp`, `tcp6`, `udp`, `udp6` e `unix` uma única vez e
+indexa as conexões pelo inode do socket, o mesmo exibido no destino dos descritores
+("socket:[12345]"). Assim, a aba de recursos de um processo encontra a conexão de cada
+socket em O(1), e a lista de conexões do sistema usa o mesmo índice, sem reler as tabelas
+por processo. `get_net_index` compartilha o índice entre as views dentro do mesmo ciclo.
+
+Os endereços são guardados como aparecem no /proc (hexadecimal) e convertidos apenas
+quando exibidos (`format_endpoint`). As tabelas do /proc/net descrevem o namespace de
+rede do próprio monitor: sockets de processos em outros namespaces não são encontrados.
+"""
+
+import functools
+import socket
+import sys
+import threading
+import time
+import traceback
+
+from services.profiling_service import profiler
+from services.system_info_service import get_proc_source, get_username_from_uid
+
+NET_INDEX_MAX_AGE = 1.0  # Idade máxima (s) para reaproveitar o índice no mesmo ciclo
+INET_TABLES = ("tcp", "tcp6", "udp", "udp6")
+
+TCP_STATES = {
+    "01": "ESTABLISHED", "02": "SYN_SENT", "03": "SYN_RECV", "04": "FIN_WAIT1",
+    "05": "FIN_WAIT2", "06": "TIME_WAIT", "07": "CLOSE", "08": "CLOSE_WAIT",
+    "09": "LAST_ACK", "0A": "LISTEN", "0B": "CLOSING", "0C": "NEW_SYN_RECV",
+}
+UDP_STATES = {"01": "ESTABLISHED", "07": "UNCONN"}
+UNIX_TYPES = {"0001": "stream", "0002": "dgram", "0005": "seqpacket"}
+UNIX_STATES = {"01": "UNCONNECTED", "02": "CONNECTING", "03": "CONNECTED", "04": "DISCONNECTING"}
+UNIX_ACCEPTCON = 0x10000  # Flag __SO_ACCEPTCON: socket Unix em escuta
+
+_index_lock = threading.Lock()
+_last_index = None
+
+
+class Connection:
+    """
+    Uma conexão (ou socket em escuta) de uma tabela do /proc/net.
+
+    Atributos:
+        proto (str): "tcp", "tcp6", "udp", "udp6" ou "unix/<tipo>" (p.ex. "unix/stream").
+        local (str): Endereço local como aparece no /proc ("0100007F:0035"), ou o caminho
+            do socket Unix.
+        remote (str): Endereço remoto como aparece no /proc (vazio para sockets Unix).
+        state (str): Estado (p.ex. "ESTABLISHED", "LISTEN").
+        inode (int): Inode do socket (0 para conexões sem socket, como TIME_WAIT).
+        uid (int): UID do dono do socket (None para sockets Unix).
+    """
+
+    __slots__ = ("proto", "local", "remote", "state", "inode", "uid")
+
+    def __init__(self, proto, local, remote, state, inode, uid=None):
+        self.proto = proto
+        self.local = local
+        self.remote = remote
+        self.state = state
+        self.inode = inode
+        self.uid = uid
+
+    def local_endpoint(self):
+        """
+        Endereço local formatado (ver `format_endpoint`).
+        """
+        return format_endpoint(self.proto, self.local)
+
+    def remote_endpoint(self):
+        """
+        Endereço remoto formatado (ver `format_endpoint`).
+        """
+        return format_endpoint(self.proto, self.remote)
+
+    def owner(self):
+        """
+        Nome do usuário dono do socket (vazio para sockets Unix).
+        """
+        return "" if self.uid is None else get_username_from_uid(self.uid)
+
+
+class NetIndex:
+    """
+    Conexões das tabelas do /proc/net, indexadas pelo inode do socket.
+
+    Atributos:
+        connections (list): Todas as conexões, na ordem das tabelas.
+        by_inode (dict): Inode do socket -> Connection.
+        timestamp (float): Instante (time.monotonic) em que o índice foi construído.
+        source (ProcSource): Fonte do /proc lida.
+    """
+
+    def __init__(self, connections, source):
+        self.connections = connections
+        self.by_inode = {connection.inode: connection for connection in connections if connection.inode}
+        self.timestamp = time.monotonic()
+        self.source = source
+
+    def lookup(self, inode):
+        """
+        Retorna a conexão do socket com o inode informado, ou None.
+        """
+        return self.by_inode.get(inode)
+
+    def counts(self):
+        """
+        Retorna a quantidade de conexões por protocolo.
+        """
+        counts = {}
+        for connection in self.connections:
+            counts[connection.proto] = counts.get(connection.proto, 0) + 1
+        return counts
+
+
+@functools.lru_cache(maxsize=65536)
+def format_endpoint(proto, raw):
+    """
+    Converte um endereço das tabelas do /proc/net ("0100007F:0035") em "127.0.0.1:53"
+    (ou "[::1]:53" no IPv6). Caminhos de sockets Unix são retornados sem alteração.
+
+    Os resultados ficam em cache: endereços locais e remotos se repetem entre os ciclos.
+    """
+    if proto.startswith("unix") or not raw:
+        return raw
+    try:
+        address, port = raw.split(":")
+        packed = bytes.fromhex(address)
+        if sys.byteorder == "little":
+            # Cada palavra de 32 bits está na ordem de bytes do host
+            packed = b"".join(packed[i:i + 4][::-1] for i in range(0, len(packed), 4))
+        if len(packed) == 4:
+            return f"{socket.inet_ntop(socket.AF_INET, packed)}:{int(port, 16)}"
+        return f"[{socket.inet_ntop(socket.AF_INET6, packed)}]:{int(port, 16)}"
+    except ValueError:
+        return raw
+
+
+@profiler.timed("collect.net_index")
+def build_net_index(source=None):
+    """
+    Lê as tabelas do /proc/net e constrói o índice das conexões.
+
+    Parâmetros:
+        source (ProcSource, opcional): Fonte do /proc (padrão: a fonte atual).
+
+    Retorno:
+        NetIndex: Conexões indexadas pelo inode. Tabelas ausentes (p.ex. sem IPv6) são
+            ignoradas.
+    """
+    source = source or get_proc_source()
+    connections = []
+    for table in INET_TABLES:
+        states = UDP_STATES if table.startswith("udp") else TCP_STATES
+        for fields in read_table(source, f"net/{table}"):
+            try:
+                connections.append(Connection(
+                    table, fields[1], fields[2], states.get(fields[3], fields[3]), int(fields[9]), int(fields[7])
+                ))
+            except (IndexError, ValueError):
+                continue
+    for fields in read_table(source, "net/unix"):
+        try:
+            flags, kind, state = int(fields[3], 16), fields[4], fields[5]
+            connections.append(Connection(
+                f"unix/{UNIX_TYPES.get(kind, kind)}",
+                fields[7] if len(fields) > 7 else "",
+                "",
+                "LISTEN" if flags & UNIX_ACCEPTCON else UNIX_STATES.get(state, state),
+                int(fields[6]),
+            ))
+        except (IndexError, ValueError):
+            continue
+    return NetIndex(connections, source)
+
+
+def read_table(source, path):
+    """
+    Retorna os campos de cada linha de uma tabela do /proc/net, sem o cabeçalho.
+    """
+    try:
+        lines = source.read_text(path).splitlines()
+    except FileNotFoundError:
+        return []
+    except Exception:
+        print(f"net_service - read_table: Erro ao ler {path}")
+        traceback.print_exc()
+        return []
+    return [line.split() for line in lines[1:]]
+
+
+def get_net_index(max_age=NET_INDEX_MAX_AGE):
+    """
+    Retorna o índice atual das conexões, reaproveitando-o dentro do mesmo ciclo.
+
+    As views atualizadas no mesmo ciclo (detalhes de cada processo, lista de conexões)
+    compartilham um único índice: enquanto ele é construído, as demais chamadas aguardam o
+    lock e recebem o mesmo resultado.
+
+    Parâmetros:
+        max_age (float): Idade máxima (em segundos) de um índice reaproveitável.
+    """
+    global _last_index
+    source = get_proc_source()
+    with _index_lock:
+        if (_last_index is None or _last_index.source is not source
+                or time.monotonic() - _last_index.timestamp > max_age):
+            _last_index = build_net_index(source)
+        return _last_index
@@ -0,0 +1,277 @@
+"""
+Fontes do /proc usadas pelos coletores.
+
+Todos os coletores do `system_info_service` leem o /proc através de uma `ProcSource`,
+com caminhos relativos à raiz do /proc (p.ex. "stat", "1234/status", "1234/fd"):
+    - `LiveProcSource`: o /proc do sistema em execução (no Windows, o do WSL).
+    - `DirectoryProcSource`: um diretório qualquer com a estrutura do /proc (o /proc de um
+      host montado em um contêiner, um chroot, uma captura extraída de um tarball).
+    - `FakeProcSource`: um /proc em memória, para testes e benchmarks determinísticos ou
+      para reproduzir uma captura.
+
+Erros seguem os de `os`: arquivos ausentes levantam `FileNotFoundError` (p.ex. processo
+encerrado durante a varredura).
+"""
+
+import errno
+import os
+import stat as stat_module
+
+WSL_PATH = r"\\wsl.localhost\Ubuntu-20.04"
+PROC_READ_SIZE = 16384  # Tamanho do buffer usado na leitura única dos arquivos do /proc
+
+
+class ProcSource:
+    """
+    Interface das fontes do /proc. Os caminhos são relativos à raiz do /proc.
+    """
+
+    def read_bytes(self, path, size=PROC_READ_SIZE):
+        """
+        Lê até `size` bytes de um arquivo com uma única leitura.
+        """
+        raise NotImplementedError
+
+    def read_text(self, path):
+        """
+        Lê um arquivo inteiro como texto.
+        """
+        raise NotImplementedError
+
+    def listdir(self, path=""):
+        """
+        Lista as entradas de um diretório.
+        """
+        raise NotImplementedError
+
+    def readlink(self, path):
+        """
+        Retorna o destino de um link simbólico (p.ex. "1234/fd/3").
+        """
+        raise NotImplementedError
+
+    def lstat(self, path):
+        """
+        Retorna o `os.stat_result` de uma entrada, sem seguir links simbólicos.
+        """
+        raise NotImplementedError
+
+    def stat(self, path):
+        """
+        Retorna o `os.stat_result` do destino de uma entrada, seguindo links simbólicos
+        (p.ex. o arquivo aberto em "1234/fd/3").
+        """
+        raise NotImplementedError
+
+    def exists(self, path):
+        """
+        Indica se a entrada existe.
+        """
+        try:
+            self.lstat(path)
+            return True
+        except OSError:
+            return False
+
+    def describe(self):
+        """
+        Descrição da fonte, usada em mensagens.
+        """
+        return type(self).__name__
+
+
+class DirectoryProcSource(ProcSource):
+    """
+    Fonte do /proc lida de um diretório do sistema de arquivos.
+
+    Atributos:
+        root (str): Diretório raiz com a estrutura do /proc.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def join(self, path):
+        return os.path.join(self.root, path) if path else self.root
+
+    def read_bytes(self, path, size=PROC_READ_SIZE):
+        fd = os.open(self.join(path), os.O_RDONLY)
+        try:
+            return os.read(fd, size)
+        finally:
+            os.close(fd)
+
+    def read_text(self, path):
+        with open(self.join(path), "r") as f:
+            return f.read()
+
+    def listdir(self, path=""):
+        return os.listdir(self.join(path))
+
+    def readlink(self, path):
+        return os.readlink(self.join(path))
+
+    def lstat(self, path):
+        return os.lstat(self.join(path))
+
+    def stat(self, path):
+        return os.stat(self.join(path))
+
+    def describe(self):
+        return self.root
+
+
+class LiveProcSource(DirectoryProcSource):
+    """
+    Fonte do /proc do sistema em execução (no Windows, o /proc da distribuição do WSL).
+    """
+
+    def __init__(self):
+        super().__init__(os.path.join(WSL_PATH, "proc") if os.name == "nt" else "/proc")
+
+
+class FakeProcSource(ProcSource):
+    """
+    Fonte do /proc em memória.
+
+    Os arquivos e links são registrados por caminho; os diretórios são criados
+    implicitamente. Os metadados (`lstat`) são sintéticos e determinísticos.
+    """
+
+    def __init__(self, files=None, links=None):
+        """
+        Parâmetros:
+            files (dict, opcional): Caminho -> conteúdo (bytes ou str).
+            links (dict, opcional): Caminho -> destino do link simbólico.
+        """
+        self.files = {}
+        self.links = {}
+        self.children = {"": set()}  # Diretório -> nomes das entradas
+        self.inodes = {}
+        for path, content in (files or {}).items():
+            self.add_file(path, content)
+        for path, target in (links or {}).items():
+            self.add_link(path, target)
+
+    def _add_entry(self, path):
+        parent, _, name = path.rpartition("/")
+        if parent not in self.children:
+            self._add_entry(parent)
+            self.children[parent] = set()
+        self.children[parent].add(name)
+        self.inodes.setdefault(path, len(self.inodes) + 1)
+
+    def add_file(self, path, content):
+        """
+        Adiciona (ou substitui) um arquivo.
+        """
+        self.files[path] = content.encode() if isinstance(content, str) else bytes(content)
+        self._add_entry(path)
+
+    def add_link(self, path, target):
+        """
+        Adiciona (ou substitui) um link simbólico.
+        """
+        self.links[path] = target
+        self._add_entry(path)
+
+    def remove(self, path):
+        """
+        Remove uma entrada e tudo abaixo dela (p.ex. "1234" simula o fim do processo).
+        """
+        prefix = path + "/"
+        for table in (self.files, self.links):
+            for key in [key for key in table if key == path or key.startswith(prefix)]:
+                del table[key]
+        for key in [key for key in self.children if key == path or key.startswith(prefix)]:
+            del self.children[key]
+        parent, _, name = path.rpartition("/")
+        self.children.get(parent, set()).discard(name)
+
+    def _missing(self, path):
+        return FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+
+    def read_bytes(self, path, size=PROC_READ_SIZE):
+        try:
+            return self.files[path][:size]
+        except KeyError:
+            raise self._missing(path) from None
+
+    def read_text(self, path):
+        try:
+            return self.files[path].decode()
+        except KeyError:
+            raise self._missing(path) from None
+
+    def listdir(self, path=""):
+        try:
+            return sorted(self.children[path])
+        except KeyError:
+            raise self._missing(path) from None
+
+    def readlink(self, path):
+        try:
+            return self.links[path]
+        except KeyError:
+            raise self._missing(path) from None
+
+    def lstat(self, path):
+        if path in self.links:
+            mode, size = stat_module.S_IFLNK | 0o700, len(self.links[path])
+        elif path in self.files:
+            mode, size = stat_module.S_IFREG | 0o444, len(self.files[path])
+        elif path in self.children:
+            mode, size = stat_module.S_IFDIR | 0o555, 0
+        else:
+            raise self._missing(path)
+        return os.stat_result((mode, self.inodes.get(path, 0), 0, 1, 0, 0, size, 0, 0, 0))
+
+    def stat(self, path):
+        if path in self.links:
+            # O destino dos links não faz parte do /proc em memória
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), self.links[path])
+        return self.lstat(path)
+
+    @classmethod
+    def capture(cls, source, pids=None):
+        """
+        Copia para a memória os arquivos lidos pelos coletores a partir de outra fonte
+        (p.ex. para reproduzir deterministicamente o estado de um host).
+
+        Parâmetros:
+            source (ProcSource): Fonte a capturar.
+            pids (iterable, opcional): PIDs a capturar (padrão: todos).
+
+        Retorno:
+            FakeProcSource: Captura em memória.
+        """
+        fake = cls()
+
+        def copy_file(path):
+            try:
+                fake.add_file(path, source.read_text(path))
+            except (OSError, UnicodeDecodeError):
+                pass  # Arquivo sem permissão de leitura ou processo encerrado
+
+        for path in ("stat", "meminfo", "cpuinfo", "mounts", "version", "sys/kernel/hostname",
+                     "sys/kernel/osrelease"):
+            copy_file(path)
+        if pids is None:
+            pids = [pid for pid in source.listdir() if pid.isdigit()]
+        for pid in map(str, pids):
+            for name in ("status", "stat", "io"):
+                copy_file(f"{pid}/{name}")
+            for directory in ("task", "fd"):
+                try:
+                    entries = source.listdir(f"{pid}/{directory}")
+                except OSError:
+                    continue  # Sem permissão ou processo encerrado
+                for entry in entries:
+                    if directory == "task":
+                        copy_file(f"{pid}/task/{entry}/status")
+                        continue
+                    try:
+                        fake.add_link(f"{pid}/fd/{entry}", source.readlink(f"{pid}/fd/{entry}"))
+                    except OSError:
+                        fake.add_link(f"{pid}/fd/{entry}", "N/A")  # Descritor existe, destino ilegível
+        return fake
@@ -0,0 +1,328 @@
+"""
+Instrumentação do pipeline de atualização (coleta e interface).
+
+Cada etapa instrumentada (coletores, leituras do /proc, resolução de nomes de usuário,
+métodos `update_*` das views) registra sua duração em um histograma próprio, com faixas
+em escala logarítmica: o registro custa uma busca binária e um incremento, sem guardar as
+amostras. O `RefreshScheduler` registra, para cada fonte, o tempo de coleta, o tempo de
+atualização da interface e os ticks perdidos das últimas atualizações.
+
+O `profiler` do módulo também captura um perfil do cProfile durante alguns ticks: cada
+thread que executa uma etapa instrumentada tem seu próprio `cProfile.Profile`, e os perfis
+são combinados em um único arquivo pstats ao final da captura. A partir do Python 3.12, o
+cProfile usa uma ferramenta global do `sys.monitoring` e só um perfil pode estar ligado
+por vez: enquanto uma thread é perfilada, as etapas das demais threads são apenas medidas.
+"""
+
+import bisect
+import cProfile
+import functools
+import pstats
+import threading
+import time
+import traceback
+from collections import deque
+
+# Limites superiores (ms) das faixas dos histogramas; a última faixa não tem limite
+HISTOGRAM_BOUNDS_MS = (
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000,
+)
+TICK_HISTORY = 120  # Atualizações guardadas por fonte do agendador
+
+
+class StageHistogram:
+    """
+    Histograma das durações de uma etapa.
+
+    Atributos:
+        counts (list): Quantidade de amostras em cada faixa de `HISTOGRAM_BOUNDS_MS`
+            (mais uma faixa final para valores acima do último limite).
+        count (int): Total de amostras.
+        total (float): Soma das durações (ms).
+        max (float): Maior duração registrada (ms).
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, ms):
+        self.counts[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, q):
+        """
+        Estima um percentil (0-100) pelo limite superior da faixa que o contém (limitado
+        pela maior duração registrada).
+        """
+        if not self.count:
+            return 0.0
+        target = q / 100 * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return min(HISTOGRAM_BOUNDS_MS[i], self.max) if i < len(HISTOGRAM_BOUNDS_MS) else self.max
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+class TickSample:
+    """
+    Uma atualização de uma fonte do agendador.
+
+    Atributos:
+        collect_ms (float): Tempo da coleta (thread de background).
+        apply_ms (float): Tempo da atualização da interface (thread do Tk).
+        dropped (int): Ticks perdidos desde a atualização anterior.
+    """
+
+    __slots__ = ("collect_ms", "apply_ms", "dropped")
+
+    def __init__(self, collect_ms, apply_ms, dropped):
+        self.collect_ms = collect_ms
+        self.apply_ms = apply_ms
+        self.dropped = dropped
+
+
+class Stage:
+    """
+    Mede uma etapa em um bloco `with`; a duração (s) fica em `elapsed` ao final.
+    """
+
+    __slots__ = ("profiler", "name", "started", "elapsed")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.elapsed = 0.0
+
+    def __enter__(self):
+        self.profiler._enter_capture()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self.started
+        self.profiler.record(self.name, self.elapsed)
+        self.profiler._exit_capture()
+        return False
+
+
+class Profiler:
+    """
+    Histogramas por etapa, amostras por fonte do agendador e captura do cProfile.
+
+    Atributos:
+        enabled (bool): Registra as durações (desligado, `record` não faz nada).
+        stages (dict): Nome da etapa -> `StageHistogram`.
+        ticks (dict): Nome da fonte -> deque das últimas `TickSample`.
+    """
+
+    def __init__(self, history=TICK_HISTORY):
+        self.enabled = True
+        self.history = history
+        self.stages = {}
+        self.ticks = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()  # Perfil do cProfile e profundidade por thread
+        self._capture = None  # Perfis da captura em andamento: Profile -> em uso (bool)
+        self._capture_source = None
+        self._capture_ticks = 0
+        self._capture_path = None
+
+    def record(self, name, seconds):
+        """
+        Registra a duração (s) de uma etapa.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.stages.get(name)
+            if histogram is None:
+                histogram = self.stages[name] = StageHistogram()
+            histogram.record(seconds * 1000)
+
+    def stage(self, name):
+        """
+        Retorna um `Stage` que mede um bloco `with` como a etapa `name`.
+        """
+        return Stage(self, name)
+
+    def timed(self, name):
+        """
+        Decorador que mede cada chamada da função como a etapa `name`.
+        """
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with Stage(self, name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record_tick(self, source, collect, apply, dropped=0):
+        """
+        Registra uma atualização de uma fonte do agendador.
+
+        Parâmetros:
+            source (str): Nome da fonte.
+            collect (float): Tempo da coleta (s).
+            apply (float): Tempo da atualização da interface (s).
+            dropped (int): Ticks perdidos desde a atualização anterior.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            samples = self.ticks.get(source)
+            if samples is None:
+                samples = self.ticks[source] = deque(maxlen=self.history)
+            samples.append(TickSample(collect * 1000, apply * 1000, dropped))
+            finished = self._capture is not None and source == self._capture_source
+            if finished:
+                self._capture_ticks -= 1
+                finished = self._capture_ticks <= 0
+        if finished:
+            self.stop_capture()
+
+    def recent_ticks(self, source, count=None):
+        """
+        Retorna as últimas `count` atualizações de uma fonte (todas, por padrão).
+        """
+        with self._lock:
+            samples = list(self.ticks.get(source, ()))
+        return samples[-count:] if count else samples
+
+    def stage_rows(self):
+        """
+        Retorna (nome, histograma) de todas as etapas, da maior para a menor duração total.
+        """
+        with self._lock:
+            rows = list(self.stages.items())
+        return sorted(rows, key=lambda row: row[1].total, reverse=True)
+
+    def report(self, limit=None):
+        """
+        Formata os histogramas como uma tabela de texto.
+        """
+        lines = [f"{'etapa':<36} {'n':>7} {'p50':>8} {'p90':>8} {'p99':>8} {'máx':>8} {'total':>10}"]
+        for name, histogram in self.stage_rows()[:limit]:
+            lines.append(
+                f"{name:<36} {histogram.count:7d} {histogram.percentile(50):8.2f} "
+                f"{histogram.percentile(90):8.2f} {histogram.percentile(99):8.2f} "
+                f"{histogram.max:8.2f} {histogram.total:10.1f}"
+            )
+        return "\n".join(lines)
+
+    def reset(self):
+        """
+        Descarta os histogramas e as amostras registradas.
+        """
+        with self._lock:
+            self.stages.clear()
+            self.ticks.clear()
+
+    def start_capture(self, path, ticks, source="dashboard"):
+        """
+        Inicia a captura de um perfil do cProfile durante `ticks` atualizações de `source`.
+
+        Parâmetros:
+            path (str): Arquivo pstats gravado ao final da captura.
+            ticks (int): Quantidade de atualizações capturadas.
+            source (str): Fonte do agendador cujas atualizações são contadas.
+        """
+        with self._lock:
+            self._capture = {}
+            self._capture_source = source
+            self._capture_ticks = ticks
+            self._capture_path = path
+
+    def stop_capture(self):
+        """
+        Encerra a captura e grava os perfis combinados no arquivo pstats.
+
+        Perfis de threads que ainda estão dentro de uma etapa são descartados (um
+        `cProfile.Profile` só pode ser desligado pela própria thread).
+        """
+        with self._lock:
+            capture, self._capture = self._capture, None
+            path = self._capture_path
+        if capture is None:
+            return
+        profiles = [profile for profile, active in capture.items() if not active]
+        if not profiles:
+            return
+        try:
+            stats = pstats.Stats(profiles[0])
+            for profile in profiles[1:]:
+                stats.add(profile)
+            stats.dump_stats(path)
+            print(f"Perfil de {len(profiles)} threads gravado em {path}")
+        except Exception:
+            print(f"profiling_service - stop_capture: Erro ao gravar o perfil em {path}")
+            traceback.print_exc()
+
+    def _enter_capture(self):
+        """
+        Liga o perfil da thread atual ao entrar na etapa mais externa de uma captura.
+        """
+        local = self._local
+        depth = getattr(local, "depth", 0)
+        if not depth and self._capture is not None:
+            self._start_profile(local)
+        local.depth = depth + 1
+
+    def _start_profile(self, local):
+        """
+        Liga o perfil da thread atual; se outro perfil já estiver ligado (Python 3.12+),
+        a etapa segue sem perfil.
+        """
+        with self._lock:
+            capture = self._capture
+            if capture is None:
+                return
+            profile = getattr(local, "profile", None)
+            created = profile is None or profile not in capture
+            if created:
+                profile = local.profile = cProfile.Profile()
+            capture[profile] = True
+        try:
+            profile.enable()
+        except ValueError:
+            # "Another profiling tool is already active": o perfil de outra thread está ligado
+            with self._lock:
+                if self._capture is not None and profile in self._capture:
+                    if created:
+                        del self._capture[profile]
+                    else:
+                        self._capture[profile] = False
+            return
+        local.enabled = True
+
+    def _exit_capture(self):
+        """
+        Desliga o perfil da thread atual ao sair da etapa mais externa.
+        """
+        local = self._local
+        local.depth -= 1
+        if local.depth or not getattr(local, "enabled", False):
+            return
+        local.enabled = False
+        profile = local.profile
+        profile.disable()
+        with self._lock:
+            if self._capture is not None and profile in self._capture:
+                self._capture[profile] = False
+            else:
+                local.profile = None  # Captura encerrada: o perfil já foi gravado ou descartado
+
+
+profiler = Profiler()
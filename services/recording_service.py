@@ -0,0 +1,262 @@
+"""
+Gravação em disco dos snapshots coletados e reprodução via mmap.
+
+Uma gravação é composta por dois arquivos somente de acréscimo (append-only):
+    - `<caminho>`: cabeçalho (`FILE_HEADER`) seguido dos registros. Cada registro tem um
+      cabeçalho de tamanho fixo (`RECORD`: timestamp e tamanho) e o payload gerado por
+      `encode_snapshot` (SystemInfo completo e tabela de processos em formato colunar).
+    - `<caminho>.idx`: índice temporal com uma entrada de tamanho fixo (`INDEX_ENTRY`) por
+      registro: timestamp, offset do registro, uso de CPU e memória usada. O índice permite
+      localizar um instante por busca binária e desenhar os gráficos sem decodificar registros.
+
+O leitor mapeia os dois arquivos em memória (`mmap`): os registros são acessados como
+`memoryview` sobre o mapeamento, sem carregar o arquivo inteiro. Registros incompletos no
+final (p.ex. gravação interrompida) são ignorados. Ao retomar uma gravação, o gravador
+descarta esses restos (`repair_recording`) antes de acrescentar novos registros.
+"""
+
+import copy
+import mmap
+import os
+import struct
+import time
+
+from services.collector_daemon import decode_snapshot, encode_snapshot
+
+MAGIC = b"SOR1"
+FORMAT_VERSION = 1
+FILE_HEADER = struct.Struct("<4sHd")   # magic, versão do formato, início da gravação
+RECORD = struct.Struct("<dI")          # timestamp, tamanho do payload
+INDEX_ENTRY = struct.Struct("<dQdQ")   # timestamp, offset do registro, uso de CPU (%), memória usada (KB)
+
+
+def index_path(path):
+    """
+    Retorna o caminho do índice temporal de uma gravação.
+    """
+    return path + ".idx"
+
+
+def repair_recording(path):
+    """
+    Remove o final incompleto de uma gravação interrompida (p.ex. queda do processo).
+
+    O índice é truncado para um múltiplo de `INDEX_ENTRY.size` (uma entrada parcial
+    desalinharia todas as seguintes), as entradas que apontam para além do final dos dados
+    são descartadas e os dados são truncados ao fim do último registro indexado.
+
+    Parâmetros:
+        path (str): Caminho do arquivo de dados.
+
+    Retorno:
+        int: Quantidade de registros mantidos.
+    """
+    idx = index_path(path)
+    data_size = os.path.getsize(path) if os.path.exists(path) else 0
+    index_size = os.path.getsize(idx) if os.path.exists(idx) else 0
+    if data_size < FILE_HEADER.size:
+        # Cabeçalho incompleto: nenhum registro foi gravado
+        for name, size in ((path, data_size), (idx, index_size)):
+            if size:
+                os.truncate(name, 0)
+        return 0
+
+    with open(path, "rb") as data:
+        magic, version, _ = FILE_HEADER.unpack(data.read(FILE_HEADER.size))
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Formato de gravação inválido: {path} ({magic!r} v{version})")
+        count = index_size // INDEX_ENTRY.size
+        end = FILE_HEADER.size
+        if count:
+            with open(idx, "rb") as index:
+                while count:
+                    index.seek((count - 1) * INDEX_ENTRY.size)
+                    offset = INDEX_ENTRY.unpack(index.read(INDEX_ENTRY.size))[1]
+                    if FILE_HEADER.size <= offset and offset + RECORD.size <= data_size:
+                        data.seek(offset)
+                        _, size = RECORD.unpack(data.read(RECORD.size))
+                        if offset + RECORD.size + size <= data_size:
+                            end = offset + RECORD.size + size
+                            break
+                    count -= 1
+
+    if index_size != count * INDEX_ENTRY.size:
+        os.truncate(idx, count * INDEX_ENTRY.size)
+    if data_size != end:
+        os.truncate(path, end)
+    return count
+
+
+class MetricsRecorder:
+    """
+    Grava snapshots do sistema em um arquivo binário somente de acréscimo. Uma gravação
+    existente é retomada após descartar seu final incompleto (ver `repair_recording`).
+
+    Atributos:
+        path (str): Caminho do arquivo de dados.
+        records (int): Quantidade de registros gravados por esta instância.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.records = 0
+        repair_recording(path)
+        self.data = open(path, "ab")
+        self.index = open(index_path(path), "ab")
+        if self.data.tell() == 0:
+            self.data.write(FILE_HEADER.pack(MAGIC, FORMAT_VERSION, time.time()))
+            self.data.flush()
+        self.offset = self.data.tell()
+
+    def append(self, dados, processos=None, t=None):
+        """
+        Grava um snapshot.
+
+        Parâmetros:
+            dados (SystemInfo): Dados da coleta.
+            processos (ProcessSnapshot, opcional): Tabela completa de processos, se
+                `dados.processosAtivos` estiver filtrada pela consulta da interface.
+            t (float, opcional): Timestamp da coleta (padrão: agora).
+        """
+        if processos is not None and processos is not dados.processosAtivos:
+            dados = copy.copy(dados)
+            dados.processosAtivos = processos
+        self.append_payload(encode_snapshot(dados), dados.cpu_usage, dados.mUsada, t)
+
+    def append_payload(self, payload, cpu_usage, memory_used, t=None):
+        """
+        Grava um payload já serializado por `encode_snapshot` (usado pelo coletor headless,
+        que já serializa o snapshot para publicá-lo).
+        """
+        t = time.time() if t is None else t
+        self.data.write(RECORD.pack(t, len(payload)))
+        self.data.write(payload)
+        self.data.flush()
+        # O índice é gravado depois dos dados: uma entrada sempre aponta para um registro completo
+        self.index.write(INDEX_ENTRY.pack(t, self.offset, cpu_usage, int(memory_used)))
+        self.index.flush()
+        self.offset += RECORD.size + len(payload)
+        self.records += 1
+
+    def close(self):
+        self.data.close()
+        self.index.close()
+
+
+class RecordingReader:
+    """
+    Lê uma gravação mapeando os arquivos em memória.
+
+    O leitor pode ser usado enquanto a gravação ainda está em andamento: `refresh` remapeia
+    os arquivos para enxergar os registros acrescentados.
+
+    Atributos:
+        path (str): Caminho do arquivo de dados.
+        started (float): Timestamp do início da gravação.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.started = 0.0
+        self.data = None
+        self.index = None
+        self.count = 0
+        self.refresh()
+
+    def refresh(self):
+        """
+        Remapeia os arquivos se eles cresceram desde o último mapeamento.
+
+        Retorno:
+            bool: True se há novos registros.
+        """
+        previous = self.count
+        data_size = os.path.getsize(self.path)
+        index_size = os.path.getsize(index_path(self.path))
+        if self.data is None or (len(self.data), len(self.index)) != (data_size, index_size):
+            self._close_maps()
+            self.data = _map(self.path, data_size)
+            self.index = _map(index_path(self.path), index_size)
+            magic, version, self.started = FILE_HEADER.unpack_from(self.data, 0)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"Formato de gravação inválido: {self.path} ({magic!r} v{version})")
+
+            # Descarta entradas do índice cujo registro não foi gravado por completo
+            count = len(self.index) // INDEX_ENTRY.size
+            while count and self._record_end(count - 1) > data_size:
+                count -= 1
+            self.count = count
+        return self.count > previous
+
+    def _record_end(self, i):
+        offset = self.offset(i)
+        if offset + RECORD.size > len(self.data):
+            return offset + RECORD.size
+        _, size = RECORD.unpack_from(self.data, offset)
+        return offset + RECORD.size + size
+
+    def __len__(self):
+        return self.count
+
+    def entry(self, i):
+        """
+        Retorna a entrada `i` do índice: (timestamp, offset, uso de CPU, memória usada).
+        """
+        return INDEX_ENTRY.unpack_from(self.index, i * INDEX_ENTRY.size)
+
+    def timestamp(self, i):
+        return self.entry(i)[0]
+
+    def offset(self, i):
+        return self.entry(i)[1]
+
+    def find(self, t):
+        """
+        Retorna o índice do último registro gravado até o instante `t` (ou 0).
+        """
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.timestamp(middle) <= t:
+                low = middle + 1
+            else:
+                high = middle
+        return max(0, low - 1)
+
+    def record(self, i):
+        """
+        Retorna o payload do registro `i` como `memoryview` sobre o mapeamento (sem cópia).
+        """
+        offset = self.offset(i)
+        _, size = RECORD.unpack_from(self.data, offset)
+        start = offset + RECORD.size
+        return memoryview(self.data)[start:start + size]
+
+    def snapshot(self, i):
+        """
+        Decodifica o registro `i` em um `SystemInfo`.
+        """
+        payload = self.record(i)
+        try:
+            return decode_snapshot(payload)
+        finally:
+            payload.release()
+
+    def close(self):
+        self._close_maps()
+
+    def _close_maps(self):
+        for mapped in (self.data, self.index):
+            if mapped is not None and not isinstance(mapped, bytes):
+                mapped.close()
+        self.data = self.index = None
+
+
+def _map(path, size):
+    """
+    Mapeia um arquivo somente para leitura (arquivos vazios não podem ser mapeados).
+    """
+    if size == 0:
+        return b""
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
@@ -0,0 +1,225 @@
+"""
+Varredura do /proc dividida entre processos (para hosts com dezenas de milhares de PIDs).
+
+A lista de PIDs é dividida em fatias (shards); cada fatia é lida e analisada em um
+processo do pool, que devolve os campos como arrays binários empacotados (bytes brutos
+dos arrays mais uma tabela de nomes), e não como tuplas serializadas pelo pickle. O
+processo principal junta as fatias, calcula o uso de CPU e as taxas de I/O (os rastreadores
+guardam estado entre as varreduras) e resolve os nomes de usuário uma vez por UID.
+
+`scan_processes` usa este modo automaticamente acima de `SHARDED_SCAN_THRESHOLD` PIDs
+quando há mais de um núcleo disponível. Se um processo do pool morrer, o pool é descartado
+(recriado na próxima varredura) e a varredura do ciclo é feita de forma serial.
+"""
+
+import multiprocessing
+import os
+import struct
+import sys
+import threading
+import traceback
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from models.process_scan_model import ProcessScan
+from models.process_snapshot_model import ProcessSnapshot
+from services.system_info_service import (
+    IO_FIELDS,
+    disk_io_rate,
+    get_username_from_uid,
+    parse_io_bytes,
+    parse_stat_times,
+    parse_status_bytes,
+    scan_processes,
+)
+
+SHARDED_SCAN_THRESHOLD = 20000  # Quantidade de PIDs a partir da qual a varredura é dividida
+SHARD_SIZE = 4096  # PIDs por fatia
+COUNT = struct.Struct("<I")
+
+# Campos numéricos de cada fatia, na ordem em que são empacotados
+SHARD_COLUMNS = (
+    ("pid", "i"), ("ppid", "i"), ("state", "B"), ("threads", "I"), ("vsz", "Q"), ("rss", "Q"),
+    ("uid", "I"), ("starttime", "Q"), ("ticks", "Q"),
+)
+# Contadores de I/O, empacotados após `SHARD_COLUMNS` quando a coleta de I/O está ativa
+# (io_ok indica se o /proc/[pid]/io pôde ser lido)
+SHARD_IO_COLUMNS = tuple((field, "Q") for field in IO_FIELDS) + (("io_ok", "B"),)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def shard_layout(read_io):
+    """
+    Retorna as colunas numéricas empacotadas em cada fatia.
+    """
+    return SHARD_COLUMNS + SHARD_IO_COLUMNS if read_io else SHARD_COLUMNS
+
+
+def scan_shard(source, pids, read_io=False):
+    """
+    Lê e analisa uma fatia de PIDs (executada em um processo do pool).
+
+    Parâmetros:
+        source (ProcSource): Fonte do /proc (enviada ao processo do pool pelo pickle).
+        pids (list): PIDs (str) da fatia.
+        read_io (bool): Lê também os contadores do `/proc/[pid]/io`.
+
+    Retorno:
+        bytes: Quantidade de processos, colunas de `shard_layout(read_io)` como bytes
+            brutos dos arrays e os nomes dos comandos separados por "\\0" (UTF-8).
+    """
+    layout = shard_layout(read_io)
+    columns = {name: array(typecode) for name, typecode in layout}
+    names = []
+    for pid in pids:
+        try:
+            status = source.read_bytes(f"{pid}/status")
+        except OSError:
+            continue  # O processo terminou durante a varredura
+        name, uid, state, ppid, threads, vsz, rss = parse_status_bytes(status)
+        try:
+            starttime, ticks = parse_stat_times(source.read_bytes(f"{pid}/stat"))
+        except (OSError, ValueError, IndexError):
+            starttime, ticks = 0, 0
+        for column, value in (("pid", int(pid)), ("ppid", ppid), ("state", ord(state[0]) if state else 63),
+                              ("threads", threads), ("vsz", vsz), ("rss", rss), ("uid", int(uid or 0)),
+                              ("starttime", starttime), ("ticks", ticks)):
+            columns[column].append(value)
+        if read_io:
+            try:
+                counters, readable = parse_io_bytes(source.read_bytes(f"{pid}/io")), 1
+            except OSError:
+                counters, readable = (0,) * len(IO_FIELDS), 0
+            for field, value in zip(IO_FIELDS, counters):
+                columns[field].append(value)
+            columns["io_ok"].append(readable)
+        names.append(name)
+    parts = [COUNT.pack(len(names))]
+    parts.extend(columns[name].tobytes() for name, _ in layout)
+    parts.append("\0".join(names).encode("utf-8", errors="replace"))
+    return b"".join(parts)
+
+
+def unpack_shard(payload, read_io=False):
+    """
+    Reconstrói as colunas de uma fatia empacotada por `scan_shard`.
+
+    Retorno:
+        tuple: (colunas, nomes) - dicionário de arrays indexado pelo nome e lista de comandos.
+    """
+    view = memoryview(payload)
+    (count,) = COUNT.unpack_from(view, 0)
+    offset = COUNT.size
+    columns = {}
+    for name, typecode in shard_layout(read_io):
+        values = array(typecode)
+        size = values.itemsize * count
+        values.frombytes(view[offset:offset + size])
+        columns[name] = values
+        offset += size
+    names = bytes(view[offset:]).decode("utf-8").split("\0") if count else []
+    return columns, names
+
+
+def get_pool():
+    """
+    Retorna o pool de processos da varredura, criando-o na primeira chamada.
+
+    Os processos são iniciados por "forkserver" (ou "spawn"), e não por fork: o processo
+    principal tem threads (Tk, agendador) e o fork copiaria locks em estado inconsistente.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            _pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context)
+        return _pool
+
+
+def discard_pool(executor):
+    """
+    Descarta um pool quebrado (um processo morreu), para que `get_pool` crie outro.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is executor:
+            _pool = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def should_shard(pid_count):
+    """
+    Indica se uma varredura com `pid_count` PIDs deve ser dividida entre processos.
+    """
+    return pid_count >= SHARDED_SCAN_THRESHOLD and (os.cpu_count() or 1) > 1
+
+
+def sharded_scan(source, pids, tracker, executor=None, shard_size=SHARD_SIZE, io_tracker=None):
+    """
+    Varre o /proc dividindo os PIDs em fatias processadas em paralelo.
+
+    Parâmetros:
+        source (ProcSource): Fonte do /proc.
+        pids (list): PIDs (str) a varrer.
+        tracker (ProcessCpuTracker): Rastreador de CPU por processo.
+        executor (ProcessPoolExecutor, opcional): Pool a usar (padrão: `get_pool()`).
+        shard_size (int): PIDs por fatia.
+        io_tracker (ProcessIoTracker, opcional): Rastreador de I/O por processo; se
+            informado, as fatias leem também o `/proc/[pid]/io`.
+
+    Retorno:
+        ProcessScan: Lista de processos, total de processos e total de threads (e, com o
+            `io_tracker`, os contadores de I/O por PID). Se o pool quebrar, é o resultado
+            da varredura serial (`scan_processes`).
+    """
+    executor = executor or get_pool()
+    shards = [pids[first:first + shard_size] for first in range(0, len(pids), shard_size)]
+    read_io = io_tracker is not None
+    try:
+        futures = [executor.submit(scan_shard, source, shard, read_io) for shard in shards]
+        # Todas as fatias são recebidas antes de iniciar a amostra dos rastreadores
+        payloads = [future.result() for future in futures]
+    except BrokenProcessPool:
+        print("sharded_scan: Pool de processos interrompido; varredura serial neste ciclo")
+        traceback.print_exc()
+        discard_pool(executor)
+        return scan_processes(tracker, source, sharded=False)
+
+    tracker.begin()
+    if read_io:
+        io_tracker.begin()
+    processos = ProcessSnapshot()
+    users = {}
+    io = {}
+    for payload in payloads:
+        columns, names = unpack_shard(payload, read_io)
+        for column in ("pid", "ppid", "state", "threads", "vsz", "rss", "starttime"):
+            getattr(processos, column).extend(columns[column])
+        for pid, starttime, ticks in zip(columns["pid"], columns["starttime"], columns["ticks"]):
+            cpu, cpu_time = tracker.update(pid, starttime, ticks)
+            processos.cpu.append(cpu)
+            processos.cpu_time.append(cpu_time)
+        if read_io:
+            for position, (pid, starttime) in enumerate(zip(columns["pid"], columns["starttime"])):
+                if not columns["io_ok"][position]:
+                    processos.io_rate.append(-1.0)
+                    continue
+                counters = tuple(columns[field][position] for field in IO_FIELDS)
+                io[pid] = counters
+                processos.io_rate.append(disk_io_rate(io_tracker.update(pid, starttime, counters)))
+        else:
+            processos.io_rate.extend(array("d", [-1.0]) * len(columns["pid"]))
+        for uid in columns["uid"]:
+            user = users.get(uid)
+            if user is None:
+                user = users[uid] = sys.intern(get_username_from_uid(uid))
+            processos.user.append(user)
+        processos.name.extend(map(sys.intern, names))
+    tracker.finish()
+    if read_io:
+        io_tracker.finish()
+    return ProcessScan(processos, len(processos), sum(processos.threads), io)
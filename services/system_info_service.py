@@ -1,12 +1,32 @@
+import heapq
+import operator
 import os
+import threading
 import time
 import traceback
+from array import array
+from stat import S_ISDIR
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele o cálculo por núcleo usa array('Q')
+    np = None
 
 from models.process_details_model import ProcessDetails
+from models.process_scan_model import ProcessScan
+from models.process_snapshot_model import ProcessSnapshot
+from services.proc_source import WSL_PATH, LiveProcSource
+from services.profiling_service import profiler
+
+STAT_READ_SIZE = 262144  # O /proc/stat cresce com o número de núcleos (linhas cpuN e intr)
+SCAN_MAX_AGE = 0.5  # Idade máxima (s) para reaproveitar a varredura do /proc no mesmo ciclo
 
-WSL_PATH = r"\\wsl.localhost\Ubuntu-20.04"
+_scan_lock = threading.Lock()
+_last_scan = None
+_proc_source = LiveProcSource()  # Fonte do /proc lida pelos coletores (ver `set_proc_source`)
 
 
+@profiler.timed("collect.cpu")
 def fetch_cpu_info(dados):
     """
     Coleta informações detalhadas do CPU.
@@ -18,14 +38,15 @@ def fetch_cpu_info(dados):
             - cpu_ghz (float): Frequência do CPU em GHz.
             - cpu_usage (float): Uso da CPU em porcentagem.
             - idle_percent (float): Tempo ocioso da CPU em porcentagem.
+            - cpu_times (dict): Percentual de cada campo de jiffies (user, nice, system, ...).
+            - cpu_per_core (list): Uso de cada núcleo lógico em porcentagem.
             - total_processos (int): Número total de processos ativos.
             - total_threads (int): Número total de threads ativas.
     """
     try:
-        collect_basic_cpu_info(dados)
-        idle_time, total_time = read_initial_cpu_times()
-        time.sleep(0.1)
-        calculate_cpu_usage(dados, idle_time, total_time)
+        stat = _proc_source.read_bytes("stat", STAT_READ_SIZE)
+        _cpu_sampler.sample(dados, stat)
+        _core_sampler.sample(dados, stat)
         count_active_processes_and_threads(dados)
     except Exception:
         dados.cpu_name = "Unknown"
@@ -38,6 +59,7 @@ def fetch_cpu_info(dados):
         traceback.print_exc()
 
 
+@profiler.timed("collect.memory")
 def fetch_memory_info(dados):
     """
     Coleta informações sobre a memória do sistema.
@@ -60,29 +82,46 @@ def fetch_memory_info(dados):
         traceback.print_exc()
 
 
-def fetch_active_processes(dados):
+@profiler.timed("collect.processes")
+def fetch_active_processes(dados, query=None, max_age=SCAN_MAX_AGE):
     """
     Coleta informações sobre os processos ativos no sistema.
 
+    Se uma consulta for informada, a ordenação, o filtro e o limite (top-N) são aplicados
+    aqui, na thread de coleta, e apenas as linhas selecionadas são entregues à interface.
+
     Parâmetros:
         dados (object): Objeto para armazenar as informações coletadas, incluindo:
-            - processosAtivos (list): Lista de tuplas com informações sobre os processos ativos:
+            - processosAtivos (ProcessSnapshot): Processos ativos em formato colunar, com:
                 - usuário (str): Nome do usuário que iniciou o processo.
-                - pid (str): ID do processo.
-                - estado (str): Estado do processo (exemplo: R, S).
-                - memória virtual (str): Tamanho da memória virtual (VSZ).
-                - memória residente (str): Tamanho da memória residente (RSS).
+                - pid (int): ID do processo.
+                - ppid (int): ID do processo pai.
+                - estado (int): Estado do processo como código do caractere (exemplo: R, S).
+                - threads (int): Número de threads.
+                - memória virtual (int): Tamanho da memória virtual (VSZ) em KB.
+                - memória residente (int): Tamanho da memória residente (RSS) em KB.
+                - cpu (float): Uso de CPU no último intervalo, em % de um núcleo.
+                - tempo de CPU (float): Tempo total de CPU, em segundos.
                 - comando (str): Nome do comando do processo.
+            - processos_listados (int): Quantidade de processos que atendem ao filtro.
+        query (ProcessQuery, opcional): Ordenação, filtro e limite a aplicar.
+        max_age (float): Idade máxima (em segundos) de uma varredura reaproveitável.
     """
     try:
-        processos = collect_processes()
+        scan = get_process_scan(max_age)
+        processos = scan.processos
+        dados.processos_listados = len(processos)
+        if query is not None:
+            processos, dados.processos_listados = select_processes(processos, query)
         dados.processosAtivos = processos
     except Exception:
-        dados.processosAtivos = []
+        dados.processosAtivos = ProcessSnapshot()
+        dados.processos_listados = 0
         print(f"system_info_service - fetch_active_processes: Erro ao abrir arquivo /proc")
         traceback.print_exc()
 
 
+@profiler.timed("collect.os")
 def fetch_os_info(dados):
     """
     Coleta informações sobre o sistema operacional.
@@ -95,9 +134,9 @@ def fetch_os_info(dados):
                 - Arquitetura do sistema.
     """
     try:
-        kernel_info = read_file_content(adjust_path("/proc/version"))
-        hostname = read_file_content(adjust_path("/proc/sys/kernel/hostname"))
-        architecture = read_file_content(adjust_path("/proc/sys/kernel/osrelease"))
+        kernel_info = _proc_source.read_text("version")
+        hostname = _proc_source.read_text("sys/kernel/hostname")
+        architecture = _proc_source.read_text("sys/kernel/osrelease")
         dados.infoSO = f"Kernel: {kernel_info.strip()}\nHostname: {hostname.strip()}\nArchitecture: {architecture.strip()}"
     except Exception:
         dados.infoSO = "Unknown OS"
@@ -105,6 +144,7 @@ def fetch_os_info(dados):
         traceback.print_exc()
 
 
+@profiler.timed("collect.process_details")
 def fetch_process_details(pid, process_details):
     """
     Coleta detalhes sobre um processo específico com base no seu PID.
@@ -125,6 +165,7 @@ def fetch_process_details(pid, process_details):
         return {"Error": f"Process {pid} not found."}
     
 
+@profiler.timed("collect.process_tasks")
 def fetch_process_tasks(pid, tasks):
     """
     Coleta detalhes sobre as threads de um processo específico com base no PID.
@@ -154,100 +195,241 @@ def collect_basic_cpu_info(dados):
     Parâmetros:
         dados (object): Objeto para armazenar as informações do CPU.
     """
-    path = adjust_path("/proc/cpuinfo")
     total_cores, cpu_name, cpu_mhz = 0, "", 0.0
-    with open(path, "r") as f:
-        for line in f:
-            if line.startswith("processor"):
-                total_cores += 1
-            elif line.startswith("model name"):
-                cpu_name = line.split(":")[1].strip()
-            elif line.startswith("cpu MHz"):
-                cpu_mhz = float(line.split(":")[1].strip())
+    for line in _proc_source.read_text("cpuinfo").splitlines():
+        if line.startswith("processor"):
+            total_cores += 1
+        elif line.startswith("model name"):
+            cpu_name = line.split(":")[1].strip()
+        elif line.startswith("cpu MHz"):
+            cpu_mhz = float(line.split(":")[1].strip())
     dados.quantidadeCPU = total_cores
     dados.cpu_name = cpu_name
     dados.cpu_ghz = round(cpu_mhz / 1000, 2)
 
 
-def read_initial_cpu_times():
+CPU_TIME_FIELDS = ("user", "nice", "system", "idle", "iowait", "irq", "softirq", "steal", "guest", "guest_nice")
+
+
+def read_cpu_times(stat=None):
     """
-    Lê os tempos iniciais da CPU a partir do arquivo `/proc/stat`.
+    Lê os contadores agregados de tempo da CPU (linha `cpu `) do arquivo `/proc/stat`.
+
+    Parâmetros:
+        stat (bytes, opcional): Conteúdo já lido do `/proc/stat`. Se omitido, o arquivo é lido.
 
     Retorno:
-        tuple: (idle_time, total_time)
-            - idle_time (int): Tempo ocioso inicial.
-            - total_time (int): Tempo total inicial.
+        dict: Jiffies acumulados por campo (user, nice, system, idle, iowait, irq,
+              softirq, steal, guest, guest_nice). Campos ausentes valem 0.
     """
-    stat_path = adjust_path("/proc/stat")
-    with open(stat_path, "r") as f:
-        for line in f:
-            if line.startswith("cpu "):
-                values = list(map(int, line.split()[1:]))
-                return values[3], sum(values)
+    if stat is None:
+        stat = _proc_source.read_bytes("stat", STAT_READ_SIZE)
+    line = stat[:stat.index(b"\n")]
+    values = [int(value) for value in line.split()[1:]]
+    values += [0] * (len(CPU_TIME_FIELDS) - len(values))
+    return dict(zip(CPU_TIME_FIELDS, values))
 
 
-def calculate_cpu_usage(dados, idle_time, total_time):
+class SimpleCpuInfo:
+    """
+    Estrutura auxiliar com as informações estáticas do CPU lidas de `/proc/cpuinfo`.
     """
-    Calcula o uso da CPU e o tempo ocioso após um intervalo.
 
-    Parâmetros:
-        dados (object): Objeto para armazenar as informações calculadas.
-        idle_time (int): Tempo ocioso inicial.
-        total_time (int): Tempo total inicial.
-    """
-    stat_path = adjust_path("/proc/stat")
-    with open(stat_path, "r") as f:
-        for line in f:
-            if line.startswith("cpu "):
-                values = list(map(int, line.split()[1:]))
-                new_idle_time = values[3]
-                new_total_time = sum(values)
-                delta_idle = new_idle_time - idle_time
-                delta_total = new_total_time - total_time
-                cpu_usage = (1 - delta_idle / delta_total) * 100
-                idle_percent = (delta_idle / delta_total) * 100
-                dados.cpu_usage = round(cpu_usage, 2)
-                dados.idle_percent = round(idle_percent, 2)
-                break
+    def __init__(self):
+        self.quantidadeCPU = 0
+        self.cpu_name = ""
+        self.cpu_ghz = 0.0
 
 
-def count_active_processes_and_threads(dados):
+class CpuSampler:
     """
-    Conta o número total de processos e threads ativos no sistema.
+    Amostrador de uso da CPU baseado em snapshots sucessivos do `/proc/stat`.
+
+    Cada chamada a `sample` calcula o uso da CPU pela diferença em relação ao snapshot
+    do ciclo anterior, sem dormir: a janela medida é o próprio intervalo de atualização.
+    As informações estáticas do `/proc/cpuinfo` são lidas apenas na primeira amostra.
+    """
+
+    def __init__(self):
+        self._previous = None
+        self._basic_info = None
+        self._lock = threading.Lock()
+
+    def sample(self, dados, stat=None):
+        """
+        Calcula o uso da CPU desde a amostra anterior e armazena no objeto de dados.
+
+        Na primeira chamada, a diferença é calculada desde o boot do sistema.
+
+        Parâmetros:
+            dados (object): Objeto para armazenar as informações calculadas.
+            stat (bytes, opcional): Conteúdo já lido do `/proc/stat`.
+        """
+        with self._lock:
+            if self._basic_info is None:
+                self._basic_info = SimpleCpuInfo()
+                collect_basic_cpu_info(self._basic_info)
+            dados.quantidadeCPU = self._basic_info.quantidadeCPU
+            dados.cpu_name = self._basic_info.cpu_name
+            dados.cpu_ghz = self._basic_info.cpu_ghz
+
+            current = read_cpu_times(stat)
+            previous = self._previous or dict.fromkeys(CPU_TIME_FIELDS, 0)
+            self._previous = current
+        calculate_cpu_usage(dados, previous, current)
+
+
+def calculate_cpu_usage(dados, previous, current):
+    """
+    Calcula o uso da CPU e o percentual de cada campo entre dois snapshots do `/proc/stat`.
+
+    Os campos guest e guest_nice já estão contabilizados em user e nice pelo kernel,
+    por isso não entram no tempo total.
 
     Parâmetros:
-        dados (object): Objeto para armazenar os contadores:
-            - total_processos (int): Número total de processos.
-            - total_threads (int): Número total de threads.
+        dados (object): Objeto para armazenar as informações calculadas.
+        previous (dict): Snapshot anterior (ver `read_cpu_times`).
+        current (dict): Snapshot atual (ver `read_cpu_times`).
     """
-    total_processos, total_threads = 0, 0
-    proc_path = adjust_path("/proc")
-    for pid in os.listdir(proc_path):
-        if pid.isdigit():
-            total_processos += 1
-            total_threads += count_threads_in_process(pid)
-    dados.total_processos = total_processos
-    dados.total_threads = total_threads
+    deltas = {field: max(current[field] - previous[field], 0) for field in CPU_TIME_FIELDS}
+    delta_total = sum(deltas[field] for field in CPU_TIME_FIELDS[:8])
+    if delta_total <= 0:
+        return  # Nenhum jiffy decorrido: mantém os valores anteriores
+    dados.cpu_times = {
+        field: round(deltas[field] / delta_total * 100, 2) for field in CPU_TIME_FIELDS
+    }
+    idle_percent = (deltas["idle"] / delta_total) * 100
+    dados.cpu_usage = round(100 - idle_percent, 2)
+    dados.idle_percent = round(idle_percent, 2)
+
 
+CORE_FIELDS = 8  # user, nice, system, idle, iowait, irq, softirq, steal
+CORE_IDLE_FIELD = 3
+
+
+class PerCoreCpuSampler:
+    """
+    Amostrador do uso de cada núcleo lógico a partir das linhas `cpuN` do `/proc/stat`.
 
-def count_threads_in_process(pid):
+    Os contadores de todos os núcleos ficam em uma matriz pré-alocada de
+    (núcleos x CORE_FIELDS), em NumPy quando disponível ou em `array('Q')` linearizado.
+    A cada amostra, os percentuais de todos os núcleos são calculados de uma vez
+    pela diferença em relação à matriz da amostra anterior.
     """
-    Conta o número de threads em um processo específico.
+
+    def __init__(self):
+        self.cores = 0
+        self._previous = None
+        self._current = None
+        self._primed = False
+        self._lock = threading.Lock()
+
+    def _allocate(self, cores):
+        """
+        Aloca as matrizes de contadores para a quantidade de núcleos informada.
+        """
+        self.cores = cores
+        self._primed = False
+        if np is not None:
+            self._previous = np.zeros((cores, CORE_FIELDS), dtype=np.int64)
+            self._current = np.zeros((cores, CORE_FIELDS), dtype=np.int64)
+        else:
+            self._previous = array("Q", bytes(8 * cores * CORE_FIELDS))
+            self._current = array("Q", bytes(8 * cores * CORE_FIELDS))
+
+    def sample(self, dados, stat=None):
+        """
+        Calcula o uso de cada núcleo desde a amostra anterior e armazena em `dados.cpu_per_core`.
+
+        Parâmetros:
+            dados (object): Objeto para armazenar as informações calculadas.
+            stat (bytes, opcional): Conteúdo já lido do `/proc/stat`.
+        """
+        if stat is None:
+            stat = _proc_source.read_bytes("stat", STAT_READ_SIZE)
+        with self._lock:
+            values, cores = parse_core_lines(stat)
+            if cores != self.cores:
+                self._allocate(cores)  # Núcleos adicionados/removidos (hotplug)
+            self._previous, self._current = self._current, self._previous
+            if np is not None:
+                self._current.reshape(-1)[:] = values
+                dados.cpu_per_core = self._usage_numpy()
+            else:
+                self._current[:] = array("Q", values)
+                dados.cpu_per_core = self._usage_array()
+            self._primed = True
+
+    def _usage_numpy(self):
+        """
+        Calcula os percentuais por núcleo com uma única operação vetorizada.
+        """
+        previous = self._previous if self._primed else np.zeros_like(self._current)
+        delta = np.maximum(self._current - previous, 0)
+        total = delta.sum(axis=1)
+        busy = total - delta[:, CORE_IDLE_FIELD]
+        usage = np.divide(busy * 100.0, total, out=np.zeros(self.cores), where=total > 0)
+        return np.round(usage, 2).tolist()
+
+    def _usage_array(self):
+        """
+        Calcula os percentuais por núcleo sobre o `array('Q')` linearizado (sem NumPy).
+        """
+        current = self._current
+        previous = self._previous if self._primed else array("Q", bytes(8 * len(current)))
+        deltas = list(map(operator.sub, current, previous))
+        totals = [sum(deltas[base:base + CORE_FIELDS]) for base in range(0, len(deltas), CORE_FIELDS)]
+        idles = deltas[CORE_IDLE_FIELD::CORE_FIELDS]
+        return [
+            min(max(round((total - idle) * 100 / total, 2), 0.0), 100.0) if total > 0 else 0.0
+            for total, idle in zip(totals, idles)
+        ]
+
+
+def parse_core_lines(stat):
+    """
+    Extrai os contadores das linhas `cpuN` do conteúdo do `/proc/stat`.
 
     Parâmetros:
-        pid (str): ID do processo.
+        stat (bytes): Conteúdo do `/proc/stat`.
 
     Retorno:
-        int: Número de threads do processo.
+        tuple: (values, cores)
+            - values (list): Contadores linearizados (núcleos x CORE_FIELDS).
+            - cores (int): Quantidade de núcleos encontrados.
     """
-    try:
-        status_path = os.path.join(adjust_path("/proc"), pid, "status")
-        with open(status_path, "r") as f:
-            for line in f:
-                if line.startswith("Threads:"):
-                    return int(line.split()[1])
-    except (FileNotFoundError, KeyError):
-        return 0
+    values = []
+    cores = 0
+    for line in stat.split(b"\n")[1:]:
+        if not line.startswith(b"cpu"):
+            break  # As linhas cpuN vêm logo após a linha agregada
+        fields = line.split()[1:CORE_FIELDS + 1]
+        if len(fields) < CORE_FIELDS:
+            fields += [b"0"] * (CORE_FIELDS - len(fields))
+        values.extend(map(int, fields))
+        cores += 1
+    return values, cores
+
+
+_cpu_sampler = CpuSampler()
+_core_sampler = PerCoreCpuSampler()
+
+
+def count_active_processes_and_threads(dados):
+    """
+    Conta o número total de processos e threads ativos no sistema.
+
+    Os totais vêm da mesma varredura do /proc usada pela lista de processos,
+    evitando abrir novamente o arquivo `status` de cada processo.
+
+    Parâmetros:
+        dados (object): Objeto para armazenar os contadores:
+            - total_processos (int): Número total de processos.
+            - total_threads (int): Número total de threads.
+    """
+    scan = get_process_scan()
+    dados.total_processos = scan.total_processos
+    dados.total_threads = scan.total_threads
 
 
 def read_memory_info():
@@ -258,15 +440,13 @@ def read_memory_info():
         dict: Dicionário contendo as informações de memória.
     """
     try:
-        path = adjust_path("/proc/meminfo")
         meminfo = {}
-        with open(path, "r") as f:
-            for line in f:
-                key, value = line.split(":")
-                meminfo[key.strip()] = int(value.split()[0])
+        for line in _proc_source.read_text("meminfo").splitlines():
+            key, value = line.split(":")
+            meminfo[key.strip()] = int(value.split()[0])
         return meminfo
     except Exception:
-        print(f"system_info_service - get_username_from_uid: Erro ao abrir arquivo {path}")
+        print(f"system_info_service - read_memory_info: Erro ao ler o meminfo de {_proc_source.describe()}")
         traceback.print_exc()
 
 
@@ -292,63 +472,444 @@ def collect_processes():
     Coleta informações de todos os processos ativos.
 
     Retorno:
-        list: Lista de tuplas com informações sobre os processos ativos.
+        ProcessSnapshot: Processos ativos em formato colunar.
     """
-    path = adjust_path("/proc")
-    processos = []
-    for pid in os.listdir(path):
-        if pid.isdigit():
-            process_data = parse_process_status(pid)
-            if process_data:
-                processos.append(process_data)
-    return processos
+    return get_process_scan().processos
 
 
-def parse_process_status(pid):
+@profiler.timed("collect.select")
+def select_processes(processos, query):
     """
-    Analisa o arquivo de status de um processo específico.
+    Aplica filtro, ordenação e limite de uma consulta a um snapshot de processos.
+
+    Com limite (top-N), a seleção usa `heapq` (seleção parcial, O(n log N)) em vez de
+    ordenar todos os processos.
 
     Parâmetros:
-        pid (str): ID do processo.
+        processos (ProcessSnapshot): Snapshot completo da varredura.
+        query (ProcessQuery): Ordenação, filtro e limite a aplicar.
 
     Retorno:
-        tuple: Informações do processo (usuário, pid, estado, memória virtual, memória residente, comando).
+        tuple: (selecionados, total_filtrado)
+            - selecionados (ProcessSnapshot): Processos a exibir, já na ordem da consulta.
+            - total_filtrado (int): Quantidade de processos que atendem ao filtro.
     """
-    try:
-        status_path = os.path.join(adjust_path("/proc"), pid, "status")
-        user, command, state, threads, vsz, rss = "unknown", "unknown", "S", 0, 0, 0
-        with open(status_path, "r") as f:
-            for line in f:
-                if line.startswith("Name:"):
-                    command = line.split()[1]
-                elif line.startswith("Uid:"):
-                    uid = line.split()[1]
-                    user = get_username_from_uid(uid)
-                elif line.startswith("State"):
-                    state = line.split()[1]
-                elif line.startswith("Threads:"):
-                    threads = line.split()[1]
-                elif line.startswith("VmSize:"): # (Virtual Memory Size)
-                    vsz = int(line.split()[1])
-                elif line.startswith("VmRSS:"): # (Resident Set Size)
-                    rss = int(line.split()[1])
-        return (user, pid, state, threads, format_memory(vsz), format_memory(rss), command)
-    except (FileNotFoundError, KeyError):
-        return None
+    indices = range(len(processos))
+    if query.user is not None:
+        users = processos.user
+        indices = [i for i in indices if users[i] == query.user]
+    if query.state is not None:
+        state = ord(query.state)
+        states = processos.state
+        indices = [i for i in indices if states[i] == state]
+    if query.command is not None:
+        text = query.command.lower()
+        names = processos.name
+        indices = [i for i in indices if text in names[i].lower()]
+    total = len(indices)
+
+    if query.sort_key is not None:
+        key = getattr(processos, query.sort_key).__getitem__
+        if query.limit is not None and query.limit < total:
+            select = heapq.nlargest if query.reverse else heapq.nsmallest
+            indices = select(query.limit, indices, key=key)
+        else:
+            indices = sorted(indices, key=key, reverse=query.reverse)
+    if query.limit is not None:
+        indices = indices[:query.limit]
+
+    if len(indices) == len(processos) and isinstance(indices, range):
+        return processos, total  # Nenhuma seleção: reaproveita o snapshot
+    return processos.take(indices), total
+
+
+def get_process_scan(max_age=SCAN_MAX_AGE):
+    """
+    Retorna a varredura atual do /proc, reaproveitando-a dentro do mesmo ciclo.
+
+    Os coletores executados em paralelo no mesmo ciclo (CPU e processos) compartilham
+    uma única varredura: enquanto uma varredura está em andamento, as demais chamadas
+    aguardam o lock e recebem o mesmo resultado.
+
+    Parâmetros:
+        max_age (float): Idade máxima (em segundos) de uma varredura reaproveitável.
+
+    Retorno:
+        ProcessScan: Resultado da varredura com processos e totais.
+    """
+    global _last_scan
+    with _scan_lock:
+        if _last_scan is None or time.monotonic() - _last_scan.timestamp > max_age:
+            _last_scan = scan_processes()
+        return _last_scan
+
+
+def get_proc_source():
+    """
+    Retorna a fonte do /proc lida pelos coletores.
+    """
+    return _proc_source
+
+
+def set_proc_source(source):
+    """
+    Define a fonte do /proc lida por todos os coletores (ver `services.proc_source`).
+
+    A varredura compartilhada do ciclo é descartada, pois pertence à fonte anterior.
+
+    Parâmetros:
+        source (ProcSource): Nova fonte (ou None para voltar ao /proc do sistema).
+    """
+    global _proc_source, _last_scan
+    with _scan_lock:
+        _proc_source = source if source is not None else LiveProcSource()
+        _last_scan = None
+
+
+def store_process_scan(scan):
+    """
+    Publica uma varredura feita por outro mecanismo (p.ex. o coletor assíncrono) como a
+    varredura atual, reaproveitada pelos coletores do ciclo (ver `get_process_scan`).
+    """
+    global _last_scan
+    with _scan_lock:
+        _last_scan = scan
 
 
-def read_file_content(path):
+@profiler.timed("scan")
+def scan_processes(tracker=None, source=None, sharded=None):
     """
-    Lê o conteúdo de um arquivo e retorna como string.
+    Percorre o diretório /proc uma única vez e coleta processos e totais.
+
+    Cada arquivo `/proc/[pid]/status` é lido com uma única chamada `os.read`, e
+    o mesmo conteúdo alimenta a linha do processo e a contagem de threads. O arquivo
+    `/proc/[pid]/stat` alimenta o cálculo do uso de CPU de cada processo e, com a coleta
+    de I/O ativa (`set_io_collection`), o `/proc/[pid]/io` alimenta a taxa de I/O de disco.
 
     Parâmetros:
-        path (str): Caminho do arquivo a ser lido.
+        tracker (ProcessCpuTracker, opcional): Rastreador de CPU por processo. Por padrão,
+            usa o rastreador compartilhado do módulo.
+        source (ProcSource, opcional): Fonte do /proc a varrer (padrão: a fonte atual).
+        sharded (bool, opcional): Divide a varredura entre processos (ver `sharded_scan`).
+            Por padrão, decide pela quantidade de PIDs e de núcleos.
 
     Retorno:
-        str: Conteúdo do arquivo.
+        ProcessScan: Lista de processos, total de processos e total de threads (e, com a
+            coleta de I/O ativa, os contadores de I/O por PID).
     """
-    with open(path, "r") as f:
-        return f.read()
+    tracker = tracker or _process_cpu_tracker
+    source = source or _proc_source
+    pids = [pid for pid in source.listdir() if pid.isdigit()]
+
+    from services import sharded_scan  # Importado aqui: o módulo depende deste
+    collect_io = _collect_io
+    if sharded if sharded is not None else sharded_scan.should_shard(len(pids)):
+        return sharded_scan.sharded_scan(source, pids, tracker, io_tracker=_process_io_tracker if collect_io else None)
+
+    tracker.begin()
+    if collect_io:
+        _process_io_tracker.begin()
+    processos = ProcessSnapshot()
+    io = {}
+    clock = time.perf_counter
+    read_time = parse_time = user_time = 0.0  # Etapas da varredura, registradas no profiler
+    for pid in pids:
+        started = clock()
+        try:
+            status = source.read_bytes(f"{pid}/status")
+        except OSError:
+            continue  # O processo terminou durante a varredura
+        try:
+            stat = source.read_bytes(f"{pid}/stat")
+        except OSError:
+            stat = b""
+        read = clock()
+        name, uid, state, ppid, threads, vsz, rss = parse_status_bytes(status)
+        try:
+            starttime, ticks = parse_stat_times(stat)
+        except (ValueError, IndexError):
+            starttime, ticks = 0, 0
+        parsed = clock()
+        user = get_username_from_uid(uid)
+        finished = clock()
+        read_time += read - started
+        parse_time += parsed - read
+        user_time += finished - parsed
+        cpu, cpu_time = tracker.update(int(pid), starttime, ticks)
+        io_rate = -1.0  # Sem coleta de I/O (ou sem permissão de leitura)
+        if collect_io:
+            try:
+                counters = parse_io_bytes(source.read_bytes(f"{pid}/io"))
+            except OSError:
+                counters = None
+            if counters is not None:
+                io[int(pid)] = counters
+                io_rate = disk_io_rate(_process_io_tracker.update(int(pid), starttime, counters))
+        processos.append(int(pid), ppid, state, threads, vsz, rss, user, name, cpu, cpu_time, io_rate, starttime)
+    tracker.finish()
+    if collect_io:
+        _process_io_tracker.finish()
+    profiler.record("scan.read", read_time)
+    profiler.record("scan.parse", parse_time)
+    profiler.record("scan.passwd", user_time)
+    return ProcessScan(processos, len(processos), sum(processos.threads), io)
+
+
+def parse_status_bytes(status):
+    """
+    Analisa o conteúdo bruto do arquivo de status de um processo.
+
+    Parâmetros:
+        status (bytes): Conteúdo do arquivo `/proc/[pid]/status`.
+
+    Retorno:
+        tuple: (comando, uid, estado, ppid, threads, memória virtual, memória residente),
+               com as memórias em KB.
+    """
+    command, uid, state, ppid, threads, vsz, rss = "unknown", "", "S", 0, 0, 0, 0
+    for line in status.split(b"\n"):
+        if line.startswith(b"Name:"):
+            command = line[5:].strip().decode(errors="replace")
+        elif line.startswith(b"Uid:"):
+            uid = line.split()[1].decode()
+        elif line.startswith(b"State:"):
+            state = line.split()[1].decode()
+        elif line.startswith(b"PPid:"):
+            ppid = int(line.split()[1])
+        elif line.startswith(b"Threads:"):
+            threads = int(line.split()[1])
+        elif line.startswith(b"VmSize:"): # (Virtual Memory Size)
+            vsz = int(line.split()[1])
+        elif line.startswith(b"VmRSS:"): # (Resident Set Size)
+            rss = int(line.split()[1])
+    return command, uid, state, ppid, threads, vsz, rss
+
+
+def parse_stat_times(stat):
+    """
+    Extrai os tempos de CPU do conteúdo bruto do arquivo `/proc/[pid]/stat`.
+
+    O nome do comando (campo 2) pode conter espaços e parênteses, por isso os campos
+    são contados a partir do último ")".
+
+    Parâmetros:
+        stat (bytes): Conteúdo do arquivo `/proc/[pid]/stat`.
+
+    Retorno:
+        tuple: (starttime, ticks)
+            - starttime (int): Instante de início do processo, em clock ticks desde o boot.
+            - ticks (int): Tempo de CPU consumido (utime + stime), em clock ticks.
+    """
+    fields = stat[stat.rindex(b")") + 2:].split()
+    # fields[0] é o campo 3 (estado): utime=14, stime=15, starttime=22
+    return int(fields[19]), int(fields[11]) + int(fields[12])
+
+
+IO_FIELDS = ("rchar", "wchar", "syscr", "syscw", "read_bytes", "write_bytes")
+
+
+def parse_io_bytes(io):
+    """
+    Extrai os contadores de I/O do conteúdo bruto do arquivo `/proc/[pid]/io`.
+
+    Parâmetros:
+        io (bytes): Conteúdo do arquivo `/proc/[pid]/io`.
+
+    Retorno:
+        tuple: Contadores na ordem de `IO_FIELDS` (0 para campos ausentes).
+    """
+    values = dict.fromkeys(IO_FIELDS, 0)
+    for line in io.split(b"\n"):
+        key, _, value = line.partition(b":")
+        key = key.decode()
+        if key in values:
+            values[key] = int(value)
+    return tuple(values.values())
+
+
+class _PidSampleTable:
+    """
+    Tabela das amostras anteriores por PID, base dos rastreadores de CPU e de I/O.
+
+    Guarda, por PID, o `starttime` e o valor da amostra anterior. Um PID reutilizado por
+    outro processo é detectado pela mudança do `starttime`. As entradas existentes são
+    atualizadas no lugar e marcadas com a geração da amostra; `finish` só percorre a
+    tabela quando algum processo da amostra anterior não reapareceu. As subclasses
+    calculam o resultado de cada processo a partir do valor devolvido por `_sample`.
+    """
+
+    def __init__(self):
+        self._table = {}  # pid -> [starttime, valor, geração]
+        self._generation = 0
+        self._previous = 0  # Entradas da tabela no início da amostra
+        self._updated = 0   # Entradas da amostra anterior encontradas na amostra atual
+        self._elapsed = 0.0
+        self._last_time = None
+
+    def begin(self):
+        """
+        Inicia uma nova amostra, medindo o tempo decorrido desde a anterior.
+        """
+        now = time.monotonic()
+        self._elapsed = now - self._last_time if self._last_time is not None else 0.0
+        self._last_time = now
+        self._generation += 1
+        self._previous = len(self._table)
+        self._updated = 0
+
+    def _sample(self, pid, starttime, value):
+        """
+        Registra o valor atual de um processo.
+
+        Retorno:
+            O valor da amostra anterior do mesmo processo, ou None se não há uma amostra
+            comparável (primeira amostra do processo, PID reutilizado ou primeira amostra
+            do rastreador).
+        """
+        entry = self._table.get(pid)
+        if entry is None:
+            self._table[pid] = [starttime, value, self._generation]
+            return None
+        previous = entry[1] if entry[0] == starttime and self._elapsed > 0 else None
+        if entry[2] != self._generation:
+            entry[2] = self._generation
+            self._updated += 1
+        entry[0] = starttime  # PID reutilizado: recomeça a partir desta amostra
+        entry[1] = value
+        return previous
+
+    def finish(self):
+        """
+        Remove da tabela os processos que não apareceram na amostra atual.
+
+        Se todas as entradas da amostra anterior foram atualizadas, nenhum processo
+        terminou e a tabela não é percorrida.
+
+        Retorno:
+            set: PIDs dos processos encerrados desde a amostra anterior.
+        """
+        if self._updated == self._previous:
+            return set()
+        generation = self._generation
+        exited = {pid for pid, entry in self._table.items() if entry[2] != generation}
+        for pid in exited:
+            del self._table[pid]
+        return exited
+
+    def reset(self):
+        """
+        Descarta todas as amostras (a próxima de cada processo volta a ser a primeira).
+        """
+        self._table.clear()
+        self._last_time = None
+
+
+class ProcessCpuTracker(_PidSampleTable):
+    """
+    Rastreador do uso de CPU por processo a partir de amostras sucessivas do `/proc/[pid]/stat`
+    (ticks de CPU acumulados; ver `_PidSampleTable`).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.clock_ticks = get_clock_ticks()
+
+    def update(self, pid, starttime, ticks):
+        """
+        Registra a amostra de um processo e calcula seu uso de CPU.
+
+        Parâmetros:
+            pid (int): ID do processo.
+            starttime (int): Instante de início do processo (clock ticks desde o boot).
+            ticks (int): Tempo de CPU acumulado (utime + stime), em clock ticks.
+
+        Retorno:
+            tuple: (cpu, cpu_time)
+                - cpu (float): Uso no intervalo, em % de um núcleo (0 na primeira amostra do processo).
+                - cpu_time (float): Tempo total de CPU do processo, em segundos.
+        """
+        previous = self._sample(pid, starttime, ticks)
+        cpu = 0.0
+        if previous is not None:
+            cpu = max(ticks - previous, 0) / self.clock_ticks / self._elapsed * 100
+        return round(cpu, 1), ticks / self.clock_ticks
+
+
+def get_clock_ticks():
+    """
+    Retorna a quantidade de clock ticks por segundo usada nos contadores do /proc.
+    """
+    try:
+        return os.sysconf("SC_CLK_TCK")
+    except (AttributeError, ValueError, OSError):
+        return 100  # Valor padrão do Linux (ex: quando executado fora do Linux via WSL)
+
+
+_process_cpu_tracker = ProcessCpuTracker()
+
+
+class ProcessIoTracker(_PidSampleTable):
+    """
+    Rastreador das taxas de I/O por processo a partir de amostras sucessivas do `/proc/[pid]/io`.
+
+    Converte a diferença entre os contadores (na ordem de `IO_FIELDS`) de duas amostras
+    em taxas por segundo (ver `_PidSampleTable`).
+    """
+
+    def update(self, pid, starttime, counters):
+        """
+        Registra os contadores de I/O de um processo e calcula suas taxas.
+
+        Parâmetros:
+            pid (int): ID do processo.
+            starttime (int): Instante de início do processo (clock ticks desde o boot).
+            counters (tuple): Contadores na ordem de `IO_FIELDS` (ver `parse_io_bytes`).
+
+        Retorno:
+            tuple: Taxas por segundo na ordem de `IO_FIELDS`, ou None na primeira amostra
+                do processo.
+        """
+        previous = self._sample(pid, starttime, counters)
+        if previous is None:
+            return None
+        return tuple(max(current - last, 0) / self._elapsed for current, last in zip(counters, previous))
+
+
+def disk_io_rate(rates):
+    """
+    Retorna a taxa de I/O de disco (read_bytes + write_bytes, em bytes/s) de um processo.
+
+    Parâmetros:
+        rates (tuple): Taxas na ordem de `IO_FIELDS` (ver `ProcessIoTracker.update`), ou
+            None na primeira amostra (taxa 0).
+    """
+    return rates[4] + rates[5] if rates else 0.0
+
+
+_process_io_tracker = ProcessIoTracker()
+_collect_io = False  # Lê /proc/[pid]/io na varredura (coluna de I/O da tabela de processos)
+
+
+def set_io_collection(enabled):
+    """
+    Ativa ou desativa a leitura do `/proc/[pid]/io` na varredura do /proc, que preenche
+    a taxa de I/O de disco (`io_rate`) de cada processo.
+
+    Ao desativar, as amostras anteriores são descartadas: ao reativar, as taxas não são
+    calculadas sobre o intervalo em que a coleta esteve desligada.
+    """
+    global _collect_io
+    with _scan_lock:
+        _collect_io = bool(enabled)
+        if not enabled:
+            _process_io_tracker.reset()
+
+
+def io_collection_enabled():
+    """
+    Indica se a varredura do /proc lê os contadores de I/O (ver `set_io_collection`).
+    """
+    return _collect_io
 
 
 def read_process_status(pid):
@@ -361,9 +922,7 @@ def read_process_status(pid):
     Retorno:
         str: Conteúdo do arquivo de status do processo.
     """
-    status_path = adjust_path(f"/proc/{pid}/status")
-    with open(status_path, "r") as f:
-        return f.read()
+    return _proc_source.read_text(f"{pid}/status")
     
 
 def read_process_tasks(pid):
@@ -379,24 +938,21 @@ def read_process_tasks(pid):
         list: Lista de listas, onde cada sublista contém as linhas do arquivo `status` de uma task específica.
 
     """
-    tasks_path = adjust_path(f"/proc/{pid}/task")
+    tasks_path = f"{pid}/task"
 
     # Verificar se o diretório existe
-    if not os.path.exists(tasks_path):
+    if not _proc_source.exists(tasks_path):
         raise FileNotFoundError(f"Process with PID {pid} not found.")
 
     tasks_data = []
 
     # Iterar sobre cada thread (task) no diretório
-    for tid in os.listdir(tasks_path):
+    for tid in _proc_source.listdir(tasks_path):
         if tid.isdigit():
-            task_path_info = os.path.join(tasks_path, tid)
-
             try:
                 # Ler informações básicas da thread
-                with open(os.path.join(task_path_info, "status"), "r") as f:
-                    status_lines = f.readlines()
-                    tasks_data.append(status_lines)
+                status_lines = _proc_source.read_text(f"{tasks_path}/{tid}/status").splitlines(keepends=True)
+                tasks_data.append(status_lines)
 
             except FileNotFoundError:
                 continue
@@ -441,9 +997,9 @@ def parse_process_details(status, process_details):
     process_details.state = details.get("State")
     process_details.pid = details.get("Pid")
     process_details.ppid = details.get("PPid")
-    process_details.vm_size = format_memory(int(details.get("VmSize", 0).split()[0]))
-    process_details.vm_rss = format_memory(int(details.get("VmRSS", 0).split()[0]))
-    process_details.vm_exe = format_memory(int(details.get("VmExe", 0).split()[0]))
+    process_details.vm_size = format_memory(int(details.get("VmSize", "0").split()[0]))
+    process_details.vm_rss = format_memory(int(details.get("VmRSS", "0").split()[0]))
+    process_details.vm_exe = format_memory(int(details.get("VmExe", "0").split()[0]))
     process_details.threads = details.get("Threads")
 
 
@@ -478,12 +1034,85 @@ def format_memory(size_kb):
     return f"{size_kb / 1024:.2f} MB" if size_kb >= 1024 else f"{size_kb:.2f} KB"
 
 
+class IdNameCache:
+    """
+    Cache de resolução de IDs (UID/GID) para nomes, carregado de um arquivo no formato do /etc/passwd.
+
+    O arquivo é lido e convertido em um dicionário uma única vez e só é recarregado quando
+    seu mtime, inode ou tamanho mudam. A verificação de mudança é feita no máximo uma vez a
+    cada `check_interval` segundos. IDs desconhecidos também ficam em cache (como "unknown")
+    até a próxima recarga do arquivo.
+
+    Atributos:
+        path (str): Caminho do arquivo (ex: /etc/passwd ou /etc/group).
+        check_interval (float): Intervalo mínimo (em segundos) entre verificações do arquivo.
+    """
+
+    def __init__(self, path, check_interval=1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._names = {}
+        self._signature = None
+        self._last_check = None
+        self._lock = threading.Lock()
+
+    def lookup(self, id_):
+        """
+        Obtém o nome associado a um ID.
+
+        Parâmetros:
+            id_ (str ou int): UID ou GID a ser buscado.
+
+        Retorno:
+            str: Nome correspondente ao ID, ou "unknown" se não encontrado.
+        """
+        key = str(id_)
+        with self._lock:
+            self._reload_if_changed()
+            name = self._names.get(key)
+            if name is None:
+                name = "unknown"
+                self._names[key] = name  # Cache negativo para IDs desconhecidos
+            return name
+
+    def _reload_if_changed(self):
+        """
+        Recarrega o dicionário de nomes se o arquivo mudou desde a última leitura.
+        """
+        now = time.monotonic()
+        if self._last_check is not None and now - self._last_check < self.check_interval:
+            return
+        self._last_check = now
+        path = adjust_path(self.path)
+        try:
+            info = os.stat(path)
+            signature = (info.st_mtime_ns, info.st_ino, info.st_size)
+            if signature == self._signature:
+                return
+            names = {}
+            with profiler.stage("passwd.reload"), open(path, "r") as f:
+                for line in f:
+                    parts = line.split(":")
+                    if len(parts) > 2:
+                        names.setdefault(parts[2], parts[0])
+            self._names = names
+            self._signature = signature
+        except Exception:
+            print(f"system_info_service - IdNameCache: Erro ao abrir arquivo {path}")
+            traceback.print_exc()
+
+
+_user_cache = IdNameCache("/etc/passwd")
+_group_cache = IdNameCache("/etc/group")
+
+
 def get_username_from_uid(uid):
     """
-    Obtém o nome do usuário correspondente a um UID lendo o arquivo /etc/passwd.
+    Obtém o nome do usuário correspondente a um UID a partir do arquivo /etc/passwd.
 
     No Linux e sistemas baseados em Unix, o arquivo /etc/passwd contém informações sobre usuários.
-    Esta função busca o nome de usuário associado a um determinado UID.
+    O arquivo é carregado uma única vez em um dicionário compartilhado (ver `IdNameCache`)
+    e só é relido quando muda.
 
     Args:
         uid (str): UID do usuário a ser buscado.
@@ -491,18 +1120,38 @@ def get_username_from_uid(uid):
     Returns:
         str: Nome do usuário correspondente ao UID, ou "unknown" se não encontrado.
     """
-    try:
-        path = adjust_path("/etc/passwd")
-        with open(path, "r") as f:
-            for line in f:
-                parts = line.split(":")
-                if parts[2] == str(uid):
-                    return parts[0]
-    except Exception:
-        print(f"system_info_service - get_username_from_uid: Erro ao abrir arquivo {path}")
-        traceback.print_exc()
-    return "unknown"
+    return _user_cache.lookup(uid)
+
+
+def get_groupname_from_gid(gid):
+    """
+    Obtém o nome do grupo correspondente a um GID a partir do arquivo /etc/group.
+
+    Args:
+        gid (str): GID do grupo a ser buscado.
+
+    Returns:
+        str: Nome do grupo correspondente ao GID, ou "unknown" se não encontrado.
+    """
+    return _group_cache.lookup(gid)
+
+
+def read_mounts():
+    """
+    Lê os sistemas de arquivos montados de /proc/mounts.
+
+    Retorno:
+        list: Tuplas (dispositivo, ponto de montagem, tipo), na ordem de montagem.
+    """
+    mounts = []
+    for line in _proc_source.read_text("mounts").splitlines():
+        parts = line.split()
+        if len(parts) >= 3:
+            mounts.append((parts[0], parts[1], parts[2]))
+    return mounts
 
+
+@profiler.timed("collect.filesystem")
 def fetch_filesystem_info():
     """
     Coleta informações sobre o sistema de arquivos lendo /proc/mounts e utilizando os dados de os.statvfs.
@@ -519,79 +1168,143 @@ def fetch_filesystem_info():
     """
     partitions = []
     try:
-        mounts_path = adjust_path("/proc/mounts")
-        with open(mounts_path, "r") as f:
-            for line in f:
-                parts = line.split()
-                if len(parts) < 3:
-                    continue
-                device, mountpoint, fstype = parts[0], parts[1], parts[2]
-                try:
-                    stats = os.statvfs(mountpoint)
-                    total = (stats.f_blocks * stats.f_frsize) // 1024
-                    free = (stats.f_bfree * stats.f_frsize) // 1024
-                    used = total - free
-                    percent = (used / total) * 100 if total > 0 else 0
-                    partitions.append({
-                        "device": device,
-                        "mountpoint": mountpoint,
-                        "fstype": fstype,
-                        "total": total,
-                        "used": used,
-                        "free": free,
-                        "percent": round(percent, 2)
-                    })
-                except Exception:
-                    continue
+        for device, mountpoint, fstype in read_mounts():
+            try:
+                stats = os.statvfs(mountpoint)
+                total = (stats.f_blocks * stats.f_frsize) // 1024
+                free = (stats.f_bfree * stats.f_frsize) // 1024
+                used = total - free
+                percent = (used / total) * 100 if total > 0 else 0
+                partitions.append({
+                    "device": device,
+                    "mountpoint": mountpoint,
+                    "fstype": fstype,
+                    "total": total,
+                    "used": used,
+                    "free": free,
+                    "percent": round(percent, 2)
+                })
+            except Exception:
+                continue
     except Exception as e:
         print(f"Erro ao ler /proc/mounts: {e}")
         traceback.print_exc()
     return partitions
 
 
+@profiler.timed("collect.directory")
 def fetch_directory_info(path):
     """
-    Lista os arquivos e diretórios contidos no caminho especificado.
-    
+    Lista os arquivos e diretórios contidos no caminho especificado (ver `iter_directory`).
+
     Parâmetros:
         path (str): Caminho do diretório.
-        
+
     Retorno:
-        list: Lista de dicionários com informações de cada entrada:
+        list: Lista de dicionários com o nome ("name") e o tipo ("is_dir") de cada entrada;
+            os demais metadados são obtidos com `fetch_entries_metadata`.
+    """
+    entries_info = []
+    try:
+        entries_info.extend(iter_directory(path))
+    except Exception as e:
+        print(f"Erro ao listar o diretório {path}: {e}")
+        traceback.print_exc()
+    return entries_info
+
+
+def iter_directory(path):
+    """
+    Percorre as entradas de um diretório com `os.scandir`, sem um stat por entrada.
+
+    O tipo vem do `d_type` devolvido pelo próprio diretório; apenas links simbólicos (e
+    entradas em sistemas de arquivos que não informam o tipo) exigem um stat. Como um
+    gerador, permite exibir as primeiras entradas antes do fim da listagem.
+
+    Parâmetros:
+        path (str): Caminho do diretório.
+
+    Retorno:
+        generator: Dicionários com:
             - name: nome do arquivo/diretório.
-            - is_dir: True se for diretório, False caso contrário.
+            - is_dir: True se for diretório (ou link para um diretório), False caso contrário.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            yield {"name": entry.name, "is_dir": is_dir}
+
+
+@profiler.timed("collect.directory_metadata")
+def fetch_entries_metadata(path, names):
+    """
+    Coleta os metadados de um lote de entradas de um diretório (um stat por entrada).
+
+    Parâmetros:
+        path (str): Caminho do diretório.
+        names (iterable): Nomes das entradas.
+
+    Retorno:
+        dict: Nome -> dicionário com:
             - size: tamanho do arquivo (em bytes).
             - permissions: permissões do arquivo (ex: "755").
             - last_modified: timestamp da última modificação.
             - last_accessed: timestamp do último acesso.
             - metadata_change: timestamp da última alteração dos metadados.
             - owner: nome do usuário proprietário do arquivo.
+            - group: nome do grupo proprietário do arquivo.
             - inode: número do inode.
+            Entradas que não existem mais (ou não podem ser lidas) são mapeadas para None.
+    """
+    metadata = {}
+    for name in names:
+        try:
+            metadata[name] = entry_metadata(os.stat(os.path.join(path, name)))
+        except Exception:
+            metadata[name] = None
+    return metadata
+
+
+def entry_metadata(stats):
+    """
+    Converte o resultado de um stat nos metadados exibidos de uma entrada
+    (ver `fetch_entries_metadata`).
+    """
+    return {
+        "size": stats.st_size,
+        "permissions": oct(stats.st_mode)[-3:],
+        "last_modified": stats.st_mtime,
+        "last_accessed": stats.st_atime,
+        "metadata_change": stats.st_ctime,
+        "owner": get_username_from_uid(stats.st_uid),
+        "group": get_groupname_from_gid(stats.st_gid),
+        "inode": stats.st_ino
+    }
+
+
+def fetch_entry_info(path, name):
+    """
+    Coleta o tipo e os metadados de uma entrada de um diretório (ver `iter_directory` e
+    `fetch_entries_metadata`).
+
+    Parâmetros:
+        path (str): Caminho do diretório.
+        name (str): Nome da entrada.
+
+    Retorno:
+        dict: Informações da entrada, ou None se ela não existe mais (ou não pode ser lida).
     """
-    entries_info = []
     try:
-        for entry in os.listdir(path):
-            full_path = os.path.join(path, entry)
-            try:
-                stats = os.stat(full_path)
-                entries_info.append({
-                    "name": entry,
-                    "is_dir": os.path.isdir(full_path),
-                    "size": stats.st_size,
-                    "permissions": oct(stats.st_mode)[-3:],
-                    "last_modified": stats.st_mtime,
-                    "last_accessed": stats.st_atime,
-                    "metadata_change": stats.st_ctime,
-                    "owner": get_username_from_uid(stats.st_uid),
-                    "inode": stats.st_ino
-                })
-            except Exception:
-                continue
-    except Exception as e:
-        print(f"Erro ao listar o diretório {path}: {e}")
-        traceback.print_exc()
-    return entries_info
+        stats = os.stat(os.path.join(path, name))
+        return {"name": name, "is_dir": S_ISDIR(stats.st_mode), **entry_metadata(stats)}
+    except Exception:
+        return None
+
 
+@profiler.timed("collect.io")
 def fetch_io_info(pid):
     """
     Coleta informações de entrada/saída de um processo específico a partir do arquivo /proc/[pid]/io.
@@ -604,21 +1317,44 @@ def fetch_io_info(pid):
     """
     io_info = {}
     try:
-        io_path = adjust_path(f"/proc/{pid}/io")
-        with open(io_path, "r") as f:
-            for line in f:
-                key, value = line.split(":")
-                io_info[key.strip()] = value.strip()
+        for line in _proc_source.read_text(f"{pid}/io").splitlines():
+            key, value = line.split(":")
+            io_info[key.strip()] = value.strip()
     except Exception as e:
         print(f"Erro ao ler I/O do processo {pid}: {e}")
         traceback.print_exc()
     return io_info
 
-import os
-import stat
-import traceback
-from services.system_info_service import adjust_path  # Certifique-se de que adjust_path está disponível
 
+@profiler.timed("collect.io_rates")
+def fetch_io_rates(pid, tracker):
+    """
+    Lê os contadores de I/O de um processo e calcula suas taxas desde a leitura anterior.
+
+    Parâmetros:
+        pid (str ou int): ID do processo.
+        tracker (ProcessIoTracker): Rastreador com a amostra anterior do processo.
+
+    Retorno:
+        tuple: (contadores, taxas), dicionários indexados por `IO_FIELDS`, com as taxas
+            por segundo (None na primeira amostra); ou None se o arquivo não pode ser lido
+            (processo encerrado ou sem permissão).
+    """
+    try:
+        counters = parse_io_bytes(_proc_source.read_bytes(f"{pid}/io"))
+    except OSError:
+        return None
+    try:
+        starttime, _ = parse_stat_times(_proc_source.read_bytes(f"{pid}/stat"))
+    except (OSError, ValueError, IndexError):
+        starttime = 0
+    tracker.begin()
+    rates = tracker.update(int(pid), starttime, counters)
+    tracker.finish()
+    return dict(zip(IO_FIELDS, counters)), (dict(zip(IO_FIELDS, rates)) if rates else None)
+
+
+@profiler.timed("collect.process_resources")
 def fetch_process_resources(pid):
     """
     Coleta informações detalhadas dos recursos abertos/alocados pelo processo.
@@ -628,18 +1364,21 @@ def fetch_process_resources(pid):
       - inode: número do inode do arquivo apontado.
       - size: tamanho do arquivo (em bytes).
       - last_modified: timestamp da última modificação (st_mtime).
+
+    Consulta todos os descritores a cada chamada; para acompanhar um processo ao longo do
+    tempo, `FdTracker` lê apenas os descritores novos e consulta o destino sob demanda.
     """
     resources = []
     try:
-        fd_dir = adjust_path(f"/proc/{pid}/fd")
-        for fd in os.listdir(fd_dir):
-            fd_path = os.path.join(fd_dir, fd)
+        fd_dir = f"{pid}/fd"
+        for fd in _proc_source.listdir(fd_dir):
+            fd_path = f"{fd_dir}/{fd}"
             try:
-                target = os.readlink(fd_path)
+                target = _proc_source.readlink(fd_path)
             except Exception:
                 target = "N/A"
             try:
-                info = os.lstat(fd_path)
+                info = _proc_source.stat(fd_path)  # Destino real (o lstat descreve o link do /proc)
                 inode = info.st_ino
                 size = info.st_size
                 last_modified = info.st_mtime
@@ -10,8 +10,16 @@ Funcionalidades:
 Classes:
 - **DashboardApp**: Implementa a interface gráfica principal do dashboard, permitindo a visualização em tempo real de informações de CPU, memória, e processos.
 - **ProcessDetailsWindow**: Exibe informações detalhadas sobre um processo específico, incluindo threads/tasks associadas.
+- **TreeviewDiffer**: Atualiza uma Treeview de forma incremental, indexando as linhas por uma chave estável.
+- **RefreshScheduler**: Agendador central das atualizações, com no máximo uma coleta em andamento por fonte.
+- **VirtualList**: Lista virtualizada que materializa na Treeview apenas as linhas visíveis.
+- **ConnectionsFrame**: Lista as conexões de rede do sistema a partir do índice das tabelas do /proc/net.
 """
 from .dashboard_view import DashboardApp
 from .process_details_view import ProcessDetailsWindow
 from .filesystem_view import FilesystemFrame
-from .filesystem_view import format_size
\ No newline at end of file
+from .filesystem_view import format_size
+from .connections_view import ConnectionsFrame
+from .treeview_diff import TreeviewDiffer
+from .virtual_list_view import VirtualList
+from .refresh_scheduler import RefreshScheduler
@@ -0,0 +1,125 @@
+import tkinter as tk
+from tkinter import ttk
+import threading
+import traceback
+from services.net_service import get_net_index
+from services.profiling_service import profiler
+from .virtual_list_view import VirtualList
+from .refresh_scheduler import RefreshScheduler
+
+REFRESH_INTERVAL_MS = 2000  # Intervalo entre atualizações da lista de conexões
+PROTOCOL_FILTERS = ("Todos", "tcp", "udp", "unix")
+
+
+class ConnectionsFrame(tk.Frame):
+    """
+    Frame que lista as conexões de rede do sistema (TCP, UDP e sockets Unix).
+
+    A lista é construída a partir do mesmo índice das tabelas do /proc/net usado pela aba
+    de recursos dos processos (`get_net_index`), compartilhado dentro do ciclo.
+    """
+    def __init__(self, parent, scheduler=None):
+        """
+        Parâmetros:
+            parent (tk.Widget): Widget pai.
+            scheduler (RefreshScheduler, opcional): Agendador compartilhado das atualizações.
+        """
+        super().__init__(parent)
+        self.scheduler = scheduler or RefreshScheduler(self)
+        self.source = f"connections:{id(self)}"
+        self.data_lock = threading.Lock()
+        self.index = None            # Último NetIndex coletado
+        self.columns = None          # Colunas formatadas do índice coletado
+        self.displayed_index = None  # NetIndex exibido atualmente
+
+        # Resumo e filtro por protocolo
+        header = ttk.Frame(self)
+        header.pack(fill="x", padx=10, pady=5)
+        ttk.Label(header, text="Protocolo:").pack(side="left")
+        self.protocol = tk.StringVar(value=PROTOCOL_FILTERS[0])
+        protocol_box = ttk.Combobox(header, textvariable=self.protocol, values=PROTOCOL_FILTERS,
+                                    state="readonly", width=8)
+        protocol_box.pack(side="left", padx=5)
+        protocol_box.bind("<<ComboboxSelected>>", lambda e: self.apply_filter())
+        self.summary_label = ttk.Label(header, text="Conexões: ...")
+        self.summary_label.pack(side="left", padx=10)
+
+        columns = ("Proto", "Local", "Remote", "State", "User", "Inode")
+        self.connection_list = VirtualList(self, columns, height=15)
+        self.tree = self.connection_list.tree
+        widths = {"Proto": 90, "Local": 220, "Remote": 220, "State": 110, "User": 100, "Inode": 100}
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=widths[col], anchor="w" if col in ("Local", "Remote") else "center")
+        self.connection_list.pack(fill="both", expand=True, padx=10, pady=5)
+
+        # Registra a fonte de dados no agendador (inicia a atualização)
+        self.scheduler.register(self.source, self.fetch_connections,
+                                lambda result: self.update_connections(), interval=REFRESH_INTERVAL_MS)
+        self.bind("<Destroy>", self.on_destroy)
+
+    def fetch_connections(self):
+        """
+        Obtém o índice das conexões e formata suas colunas em um worker separado.
+        """
+        try:
+            index = get_net_index()
+            if index is self.index:
+                return  # Índice já coletado neste ciclo (p.ex. pela aba de recursos)
+            connections = index.connections
+            columns = {
+                "Proto": [c.proto for c in connections],
+                "Local": [c.local_endpoint() for c in connections],
+                "Remote": [c.remote_endpoint() for c in connections],
+                "State": [c.state for c in connections],
+                "User": [c.owner() for c in connections],
+                "Inode": [c.inode for c in connections],
+            }
+            with self.data_lock:
+                self.index, self.columns = index, columns
+        except Exception:
+            print("ConnectionsFrame - fetch_connections: Erro ao buscar as conexões")
+            traceback.print_exc()
+
+    @profiler.timed("ui.connections.update_connections")
+    def update_connections(self):
+        """
+        Atualiza a lista de conexões e o resumo por protocolo.
+        """
+        try:
+            with self.data_lock:
+                index, columns = self.index, self.columns
+            if index is None or index is self.displayed_index:
+                return
+            self.displayed_index = index
+            keys = [f"{proto} {local} {remote} {inode}" for proto, local, remote, inode in zip(
+                columns["Proto"], columns["Local"], columns["Remote"], columns["Inode"])]
+            self.connection_list.set_columns(keys, columns)
+            counts = ", ".join(f"{proto}: {count}" for proto, count in sorted(index.counts().items()))
+            self.summary_label.config(text=f"Conexões: {len(index.connections)} ({counts})")
+        except Exception:
+            print("ConnectionsFrame - update_connections: Erro ao atualizar as conexões")
+            traceback.print_exc()
+
+    def apply_filter(self):
+        """
+        Exibe apenas as conexões do protocolo selecionado.
+        """
+        protocol = self.protocol.get()
+        if protocol == PROTOCOL_FILTERS[0]:
+            self.connection_list.set_filter(None)
+        else:
+            self.connection_list.set_filter(lambda row: row[0].startswith(protocol))
+
+    def set_visible(self, visible):
+        """
+        Informa ao agendador se o frame está visível (aba selecionada, janela não minimizada).
+        """
+        self.scheduler.set_visible(self.source, visible)
+
+    def on_destroy(self, event):
+        """
+        Remove a fonte de dados do agendador quando o frame é destruído.
+        """
+        if event.widget is self:
+            self.scheduler.unregister(self.source)
@@ -1,12 +1,80 @@
+import copy
+import datetime
+import statistics
 import tkinter as tk
 from tkinter import ttk
 import threading
+import time
 import traceback
 from models.system_info_model import SystemInfo
-from services.system_info_service import fetch_active_processes, fetch_cpu_info, fetch_memory_info, fetch_os_info
+from models.process_query_model import ProcessQuery
+from services.system_info_service import (
+    fetch_active_processes, fetch_cpu_info, fetch_memory_info, fetch_os_info, format_memory, get_process_scan,
+    io_collection_enabled, select_processes, set_io_collection
+)
+from services.history_service import HistoryStore
+from services.profiling_service import profiler
 from .process_details_view import ProcessDetailsWindow
 from concurrent.futures import ThreadPoolExecutor
-from .filesystem_view import FilesystemFrame
+from .filesystem_view import FilesystemFrame, format_size
+from .connections_view import ConnectionsFrame
+from .virtual_list_view import VirtualList
+from .refresh_scheduler import CPU_BUDGET, RefreshScheduler
+
+REFRESH_INTERVAL_MS = 2000  # Intervalo entre atualizações do dashboard
+CORE_CELL_SIZE = 16  # Tamanho (px) de cada célula do heatmap por núcleo
+
+# Coluna da tabela de processos -> coluna do ProcessSnapshot usada na ordenação
+PROCESS_SORT_KEYS = {
+    "user": "user",
+    "pid": "pid",
+    "state": "state",
+    "Threads": "threads",
+    "CPU%": "cpu",
+    "CPU Time": "cpu_time",
+    "I/O": "io_rate",
+    "VmSize": "vsz",
+    "VmRSS": "rss",
+    "command": "name",
+}
+
+# Opções de limite da tabela de processos (top-N)
+PROCESS_LIMITS = {"Todos": None, "Top 50": 50, "Top 100": 100, "Top 500": 500}
+
+# Janelas de tempo dos gráficos de CPU e memória (em segundos)
+GRAPH_WINDOWS = {"1 min": 60, "10 min": 600, "1 h": 3600, "24 h": 86400, "7 dias": 604800}
+GRAPH_POINT_SPACING = 4  # Distância (px) entre pontos dos gráficos
+
+# Painel de desempenho (F12)
+PROFILE_OVERLAY_TICKS = 60  # Atualizações exibidas no gráfico do painel
+PROFILE_OVERLAY_STAGES = 8  # Etapas com maior tempo total listadas no painel
+PROFILE_OVERLAY_SIZE = (240, 60)  # Tamanho (px) do gráfico de barras do painel
+
+
+def heat_color(percent):
+    """
+    Converte um percentual de uso em uma cor do verde (ocioso) ao vermelho (saturado).
+    """
+    level = max(0.0, min(percent, 100.0)) / 100
+    red = int(255 * min(1.0, 2 * level))
+    green = int(255 * min(1.0, 2 * (1 - level)))
+    return f"#{red:02x}{green:02x}00"
+
+
+def format_cpu_time(seconds):
+    """
+    Formata um tempo de CPU em segundos como H:MM:SS.
+    """
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+def format_io_rate(rate):
+    """
+    Formata a taxa de I/O de disco de um processo ("-" quando não medida).
+    """
+    return "-" if rate < 0 else f"{format_size(rate)}/s"
 
 
 class DashboardApp(tk.Tk):
@@ -15,24 +83,56 @@ class DashboardApp(tk.Tk):
 
     Esta aplicação exibe informações sobre o sistema operacional, CPU, memória, e processos ativos.
     """
-    def __init__(self):
+    def __init__(self, client=None, recorder=None, replay=None, bridge=None, profile_overlay=False,
+                 cpu_budget=CPU_BUDGET):
         """
         Inicializa a aplicação de dashboard.
+
+        Parâmetros:
+            client (SnapshotClient, opcional): Cliente de um coletor headless. Se informado,
+                o dashboard não varre o /proc: apenas exibe os snapshots publicados pelo coletor.
+            recorder (MetricsRecorder, opcional): Grava em disco cada snapshot coletado.
+            replay (RecordingReader, opcional): Gravação a reproduzir. Se informada, o dashboard
+                não coleta dados: exibe os registros da gravação, navegáveis por uma barra de tempo.
+            bridge (AsyncCollectorBridge, opcional): Coletor assíncrono usado no lugar dos
+                coletores seriais na coleta local.
+            profile_overlay (bool): Exibe o painel de desempenho ao iniciar (alternado com F12).
+            cpu_budget (float): Fração de um núcleo disponível para as coletas periódicas
+                (ver `RefreshScheduler`).
         """
         super().__init__()
         self.title("Dashboard Sistemas Operacionais CSO30-S71 2024.2 - Mateus e Murilo")
         self.geometry("600x600")  # Ajuste para um tamanho inicial
         self.dados = SystemInfo()
-        self.cpu_usage_history = [0] * 27  # Histórico de uso da CPU
-        # (27 pontos)
-        self.memory_used_history = [0] * 27  # Histórico de uso da memória (27 pontos)
-        self.data_ready = False  # Inicializa a flag de dados prontos
+        self.client = client
+        self.recorder = recorder
+        self.bridge = bridge
+        self.replay = replay
+        self.replay_position = 0  # Registro exibido no modo de reprodução
+        self.replay_loaded = 0  # Registros da gravação já carregados no histórico
+        self.replay_time = 0.0  # Timestamp do registro exibido
+        self.replay_dados = SystemInfo()  # Registro exibido, com a tabela de processos completa
+        self.replay_play = False  # Avança um registro por ciclo
+        self.history = HistoryStore()  # Histórico de CPU, memória, swap, processos e partições
         self.data_lock = threading.Lock()  # Lock para sincronizaçã
         self.executor = ThreadPoolExecutor(max_workers=4) # Executor para gerenciar threads
+        self.scheduler = RefreshScheduler(self, cpu_budget=cpu_budget)  # Agendador compartilhado por todas as views
+        self.process_query = ProcessQuery()  # Ordenação/filtro aplicados pelo coletor
+        self.profile_visible = profile_overlay  # Painel de desempenho visível
 
         try:
             self.create_widgets()
-            self.refresh_data()
+            self.create_profile_overlay()
+            # A coleta do dashboard continua com a aba oculta: ela alimenta o histórico e a gravação
+            self.scheduler.register("dashboard", self.fetch_data, self.on_data_ready, interval=REFRESH_INTERVAL_MS,
+                                    background=True)
+            self.scheduler.register("dashboard.process_query", self.fetch_process_query,
+                                    lambda result: self.update_process_list(), interval=None, start=False)
+            self.protocol("WM_DELETE_WINDOW", self.on_close)
+            self.bind("<Map>", self.on_map_change)
+            self.bind("<Unmap>", self.on_map_change)
+            self.scheduler.track_focus(self)
+            self.update_visibility()
         except Exception:
             print("Dashboard - __init__: Erro ao inicializar a aplicação")
             traceback.print_exc()
@@ -101,13 +201,19 @@ class DashboardApp(tk.Tk):
         """
         # Cria o Notebook e o posiciona no frame rolável
         notebook = ttk.Notebook(self.scrollable_frame)
-        notebook.grid(row=0, column=0, sticky="nsew")
+        notebook.grid(row=1, column=0, sticky="nsew")
+        notebook.bind("<<NotebookTabChanged>>", lambda e: self.update_visibility())
+        self.notebook = notebook
+
+        if self.replay is not None:
+            self.create_replay_bar()
 
         # -----------------------------
         # Aba 1: Dashboard
         # -----------------------------
         dashboard_tab = ttk.Frame(notebook, padding="10")
         notebook.add(dashboard_tab, text="Dashboard")
+        self.dashboard_tab = dashboard_tab
 
         # OS Information
         os_frame = ttk.LabelFrame(dashboard_tab, text="Operating System Information", padding="10")
@@ -120,6 +226,11 @@ class DashboardApp(tk.Tk):
         cpu_frame.grid(row=1, column=0, padx=10, pady=10, sticky="ew")
         self.cpu_info = ttk.Label(cpu_frame, text="", anchor="w", justify="left", padding="5")
         self.cpu_info.grid(row=0, column=0, sticky="w")
+        self.graph_window = tk.StringVar(value="1 min")
+        window_box = ttk.Combobox(cpu_frame, textvariable=self.graph_window, values=list(GRAPH_WINDOWS),
+                                  state="readonly", width=8)
+        window_box.grid(row=0, column=0, sticky="ne")
+        window_box.bind("<<ComboboxSelected>>", lambda e: self.update_graphs())
         self.cpu_canvas = tk.Canvas(cpu_frame, bg="white", height=100)
         self.cpu_canvas.grid(row=1, column=0, pady=5, sticky="ew")
         cpu_frame.columnconfigure(0, weight=1)
@@ -127,6 +238,12 @@ class DashboardApp(tk.Tk):
         self.cpu_label_top.grid(row=1, column=1, padx=5, sticky="n")
         self.cpu_label_bottom = tk.Label(cpu_frame, text="0", anchor="e")
         self.cpu_label_bottom.grid(row=1, column=1, padx=5, sticky="s")
+        self.core_label = ttk.Label(cpu_frame, text="Per-core usage", anchor="w")
+        self.core_label.grid(row=2, column=0, sticky="w")
+        self.core_canvas = tk.Canvas(cpu_frame, bg="white", height=20, highlightthickness=0)
+        self.core_canvas.grid(row=3, column=0, pady=5, sticky="ew")
+        self.core_cells = []  # Retângulos do heatmap, um por núcleo
+        self.core_layout = None  # (núcleos, colunas, largura) usado para desenhar as células
 
         # Memory Information
         memory_frame = ttk.LabelFrame(dashboard_tab, text="Memory Information", padding="10")
@@ -144,18 +261,43 @@ class DashboardApp(tk.Tk):
         # Active Processes
         processes_frame = ttk.LabelFrame(dashboard_tab, text="Active Processes", padding="10")
         processes_frame.grid(row=3, column=0, padx=10, pady=10, sticky="nsew")
-        processes_frame.rowconfigure(0, weight=1)
+        processes_frame.rowconfigure(1, weight=1)
         processes_frame.columnconfigure(0, weight=1)
-        columns = ("user", "pid", "state", "Threads", "VmSize", "VmRSS", "command")
-        self.process_info = ttk.Treeview(processes_frame, columns=columns, show="headings", height=15)
-        self.process_info.grid(row=0, column=0, sticky="nsew")
+
+        # Filtro e limite (aplicados no coletor, em background)
+        filter_frame = ttk.Frame(processes_frame)
+        filter_frame.grid(row=0, column=0, sticky="ew", pady=(0, 5))
+        ttk.Label(filter_frame, text="Filtro (user:<nome> state:<letra> comando):").pack(side="left")
+        self.process_filter = tk.StringVar()
+        self.process_filter.trace_add("write", lambda *args: self.on_process_query_change())
+        ttk.Entry(filter_frame, textvariable=self.process_filter, width=30).pack(side="left", padx=5)
+        self.process_limit = tk.StringVar(value="Todos")
+        limit_box = ttk.Combobox(filter_frame, textvariable=self.process_limit, values=list(PROCESS_LIMITS),
+                                 state="readonly", width=10)
+        limit_box.pack(side="left", padx=5)
+        limit_box.bind("<<ComboboxSelected>>", lambda e: self.on_process_query_change())
+        self.process_io = tk.BooleanVar(value=io_collection_enabled())
+        ttk.Checkbutton(filter_frame, text="Coluna de I/O", variable=self.process_io,
+                        command=self.on_process_io_toggle).pack(side="left", padx=5)
+        self.process_count = ttk.Label(filter_frame, text="")
+        self.process_count.pack(side="left", padx=5)
+
+        columns = ("user", "pid", "state", "Threads", "CPU%", "CPU Time", "I/O", "VmSize", "VmRSS", "command")
+        self.process_list = VirtualList(processes_frame, columns, height=15, sort_command=self.on_process_sort, formatters={
+            "state": chr,
+            "CPU%": "{:.1f}".format,
+            "CPU Time": format_cpu_time,
+            "I/O": format_io_rate,
+            "VmSize": format_memory,
+            "VmRSS": format_memory,
+        })
+        self.process_list.grid(row=1, column=0, sticky="nsew")
+        self.process_info = self.process_list.tree
         for col in columns:
             self.process_info.heading(col, text=col.capitalize(), anchor="center")
             self.process_info.column(col, width=150, anchor="center")
-        scrollbar = ttk.Scrollbar(processes_frame, orient="vertical", command=self.process_info.yview)
-        self.process_info.config(yscrollcommand=scrollbar.set)
-        scrollbar.grid(row=0, column=1, sticky="ns")
         self.process_info.bind("<Double-1>", self.show_process_details)
+        self.update_process_columns()
 
         # Configura o layout da aba Dashboard para expandir
         dashboard_tab.columnconfigure(0, weight=1)
@@ -166,17 +308,117 @@ class DashboardApp(tk.Tk):
         # -----------------------------
         filesystem_tab = ttk.Frame(notebook, padding="10")
         notebook.add(filesystem_tab, text="Sistemas de Arquivos")
+        self.filesystem_tab = filesystem_tab
 
         # Renderiza diretamente a interface do file system na aba
-        fs_frame = FilesystemFrame(filesystem_tab, start_path="/")
-        fs_frame.pack(fill="both", expand=True)
+        self.fs_frame = FilesystemFrame(filesystem_tab, start_path="/", scheduler=self.scheduler, history=self.history)
+        self.fs_frame.pack(fill="both", expand=True)
+
+        # -----------------------------
+        # Aba 3: Conexões
+        # -----------------------------
+        connections_tab = ttk.Frame(notebook, padding="10")
+        notebook.add(connections_tab, text="Conexões")
+        self.connections_tab = connections_tab
+        self.connections_frame = ConnectionsFrame(connections_tab, scheduler=self.scheduler)
+        self.connections_frame.pack(fill="both", expand=True)
 
         # Expande o Notebook no frame rolável
         self.scrollable_frame.columnconfigure(0, weight=1)
-        self.scrollable_frame.rowconfigure(0, weight=1)
+        self.scrollable_frame.rowconfigure(1, weight=1)
 
+    def create_replay_bar(self):
+        """
+        Cria a barra de navegação do modo de reprodução (acima do Notebook).
+        """
+        replay_frame = ttk.LabelFrame(self.scrollable_frame, text="Reprodução", padding="5")
+        replay_frame.grid(row=0, column=0, padx=10, pady=5, sticky="ew")
+        replay_frame.columnconfigure(0, weight=1)
+        self.replay_scale = ttk.Scale(replay_frame, from_=0, to=0, orient="horizontal",
+                                      command=self.on_replay_scrub)
+        self.replay_scale.grid(row=0, column=0, sticky="ew")
+        self.replay_playing = tk.BooleanVar(value=False)
+        ttk.Checkbutton(replay_frame, text="Reproduzir", variable=self.replay_playing,
+                        command=lambda: setattr(self, "replay_play", self.replay_playing.get())
+                        ).grid(row=0, column=1, padx=5)
+        self.replay_label = ttk.Label(replay_frame, text="")
+        self.replay_label.grid(row=1, column=0, columnspan=2, sticky="w")
+
+
+
+    def create_profile_overlay(self):
+        """
+        Cria o painel de desempenho, sobreposto ao canto superior direito da janela.
+
+        O painel mostra, para as últimas atualizações do dashboard, o tempo de coleta (azul),
+        o tempo de atualização da interface (laranja) e os ticks perdidos (marcas vermelhas),
+        além das etapas instrumentadas com maior tempo total. F12 exibe/oculta o painel.
+        """
+        self.profile_panel = tk.Frame(self, bd=1, relief="solid", bg="#f4f4f4", padx=5, pady=5)
+        tk.Label(self.profile_panel, text="Desempenho (F12)", bg="#f4f4f4", anchor="w",
+                 font=("TkDefaultFont", 9, "bold")).pack(fill="x")
+        width, height = PROFILE_OVERLAY_SIZE
+        self.profile_canvas = tk.Canvas(self.profile_panel, width=width, height=height, bg="white",
+                                        highlightthickness=0)
+        self.profile_canvas.pack(fill="x", pady=3)
+        self.profile_summary = tk.Label(self.profile_panel, text="", bg="#f4f4f4", anchor="w",
+                                        justify="left", font=("TkFixedFont", 8))
+        self.profile_summary.pack(fill="x")
+        self.bind("<F12>", lambda e: self.toggle_profile_overlay())
+        if self.profile_visible:
+            self.profile_panel.place(relx=1.0, x=-20, y=5, anchor="ne")
+
+    def toggle_profile_overlay(self):
+        """
+        Exibe ou oculta o painel de desempenho.
+        """
+        self.profile_visible = not self.profile_visible
+        if self.profile_visible:
+            self.profile_panel.place(relx=1.0, x=-20, y=5, anchor="ne")
+            self.profile_panel.lift()
+            self.update_profile_overlay()
+        else:
+            self.profile_panel.place_forget()
+
+    @profiler.timed("ui.dashboard.update_profile_overlay")
+    def update_profile_overlay(self):
+        """
+        Atualiza o painel de desempenho com as últimas atualizações do dashboard.
+        """
+        ticks = profiler.recent_ticks("dashboard", PROFILE_OVERLAY_TICKS)
+        canvas = self.profile_canvas
+        canvas.delete("all")
+        if not ticks:
+            return
 
+        width, height = PROFILE_OVERLAY_SIZE
+        scale = max(tick.collect_ms + tick.apply_ms for tick in ticks) or 1
+        bar = width / PROFILE_OVERLAY_TICKS
+        for i, tick in enumerate(ticks):
+            x = width - (len(ticks) - i) * bar
+            collect = tick.collect_ms / scale * (height - 4)
+            apply = tick.apply_ms / scale * (height - 4)
+            canvas.create_rectangle(x, height - collect, x + bar - 1, height, fill="#4a7bd0", outline="")
+            canvas.create_rectangle(x, height - collect - apply, x + bar - 1, height - collect,
+                                    fill="#e8912d", outline="")
+            if tick.dropped:
+                canvas.create_rectangle(x, 0, x + bar - 1, 3, fill="red", outline="")
+
+        collect = [tick.collect_ms for tick in ticks]
+        apply = [tick.apply_ms for tick in ticks]
+        lines = [
+            f"Coleta:    p50 {statistics.median(collect):7.1f} ms  máx {max(collect):7.1f} ms",
+            f"Interface: p50 {statistics.median(apply):7.1f} ms  máx {max(apply):7.1f} ms",
+            f"Ticks perdidos: {sum(tick.dropped for tick in ticks)} em {len(ticks)} atualizações",
+            f"Intervalo atual: {self.scheduler.effective_interval('dashboard')} ms",
+            "",
+            f"{'etapa':<30} {'p50':>6} {'p99':>7}",
+        ]
+        for name, histogram in profiler.stage_rows()[:PROFILE_OVERLAY_STAGES]:
+            lines.append(f"{name[-30:]:<30} {histogram.percentile(50):6.1f} {histogram.percentile(99):7.1f}")
+        self.profile_summary.config(text="\n".join(lines))
 
+    @profiler.timed("ui.dashboard.update_display")
     def update_display(self):
         """
         Atualiza as informações exibidas na interface.
@@ -190,6 +432,7 @@ class DashboardApp(tk.Tk):
             f"Frequency: {self.dados.cpu_ghz} GHz\n"
             f"Usage: {self.dados.cpu_usage}%\n"
             f"Idle: {self.dados.idle_percent}%\n" 
+            f"{self.format_cpu_times()}\n"
             f"Processes: {self.dados.total_processos}\n" 
             f"Threads: {self.dados.total_threads}" 
         ))
@@ -209,66 +452,216 @@ class DashboardApp(tk.Tk):
         # Atualização do SO
         self.os_info.config(text=self.dados.infoSO)
 
-        # Atualização do Treeview
-        for row in self.process_info.get_children():
-            self.process_info.delete(row)
-        for process in self.dados.processosAtivos:
-            self.process_info.insert("", "end", values=process)
+        # Atualização da lista de processos
+        self.update_process_list()
 
         # Atualização dos gráficos
+        self.update_graphs()
+        self.update_core_heatmap()
+
+        if self.replay is not None:
+            self.update_replay_bar()
+
+    @profiler.timed("ui.dashboard.update_replay_bar")
+    def update_replay_bar(self):
+        """
+        Atualiza a barra de navegação com o registro exibido.
+        """
+        with self.data_lock:
+            position, count, timestamp = self.replay_position, self.replay_loaded, self.replay_time
+        self.replay_scale.configure(to=max(0, count - 1))
+        self.replay_scale.set(position)
+        when = datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S") if count else "-"
+        self.replay_label.config(text=f"Registro {position + 1 if count else 0} de {count} - {when}")
+
+    def on_replay_scrub(self, value):
+        """
+        Exibe o registro selecionado na barra de navegação.
+
+        O `command` da ttk.Scale também é chamado quando `update_replay_bar` move a barra
+        para o registro exibido; nesse caso nada muda e nenhuma coleta é solicitada (senão
+        a reprodução avançaria sem esperar o intervalo de atualização).
+        """
+        position = int(float(value))
+        with self.data_lock:
+            if position == self.replay_position:
+                return
+            self.replay_position = position
+        self.refresh_data()
+
+    @profiler.timed("ui.dashboard.update_process_list")
+    def update_process_list(self):
+        """
+        Atualiza a lista virtualizada de processos com as linhas selecionadas pelo coletor.
+
+        Somente as linhas visíveis são formatadas e chegam à Treeview.
+        """
+        processos = self.dados.processosAtivos
+        self.process_count.config(
+            text=f"Exibindo {len(processos)} de {self.dados.processos_listados} ({self.dados.total_processos} no total)"
+        )
+        self.process_list.set_columns(processos.pid, {
+            "user": processos.user,
+            "pid": processos.pid,
+            "state": processos.state,
+            "Threads": processos.threads,
+            "CPU%": processos.cpu,
+            "CPU Time": processos.cpu_time,
+            "I/O": processos.io_rate,
+            "VmSize": processos.vsz,
+            "VmRSS": processos.rss,
+            "command": processos.name,
+        })
+
+    def update_process_columns(self):
+        """
+        Exibe a coluna de I/O da tabela de processos somente com a coleta de I/O ativa.
+        """
+        columns = self.process_list.store.columns
+        if not self.process_io.get():
+            columns = tuple(column for column in columns if column != "I/O")
+        self.process_info.configure(displaycolumns=columns)
+
+    def on_process_io_toggle(self):
+        """
+        Handler da opção "Coluna de I/O": ativa ou desativa a leitura do `/proc/[pid]/io`
+        na varredura do coletor (a primeira varredura após ativar ainda não tem taxas).
+        """
+        set_io_collection(self.process_io.get())
+        self.update_process_columns()
+        if not self.process_io.get() and self.process_list.sort_state[0] == "I/O":
+            self.process_list.sort_state = (None, False)  # Ordenação pela coluna ocultada
+            self.process_list.update_sort_indicator()
+            with self.data_lock:
+                self.process_query.sort_key = None
+        self.apply_process_query()
+
+    def on_process_sort(self, column, reverse):
+        """
+        Handler do clique no cabeçalho da tabela de processos: ordena no coletor.
+        """
+        with self.data_lock:
+            self.process_query.sort_key = PROCESS_SORT_KEYS[column]
+            self.process_query.reverse = reverse
+        self.apply_process_query()
+
+    def on_process_query_change(self):
+        """
+        Handler das alterações do filtro e do limite da tabela de processos.
+        """
+        with self.data_lock:
+            self.process_query.set_filter_text(self.process_filter.get())
+            self.process_query.limit = PROCESS_LIMITS.get(self.process_limit.get())
+        self.apply_process_query()
+
+    def apply_process_query(self):
+        """
+        Reaplica a consulta à última varredura do /proc em background, sem esperar o próximo ciclo.
+
+        Alterações seguidas (p.ex. digitação no filtro) são agrupadas pelo agendador.
+        """
+        self.scheduler.request("dashboard.process_query")
+
+    @profiler.timed("ui.dashboard.update_graphs")
+    def update_graphs(self):
+        """
+        Redesenha os gráficos de CPU e memória na janela de tempo selecionada.
+        """
         self.update_cpu_graph()
         self.update_memory_graph()
 
+    @profiler.timed("ui.dashboard.update_cpu_graph")
     def update_cpu_graph(self):
         """
         Atualiza o gráfico de uso da CPU.
 
         Este método desenha um gráfico que representa o uso da CPU ao longo do tempo.
         """
-        self.cpu_usage_history.pop(0)
-        self.cpu_usage_history.append(self.dados.cpu_usage)
-        self.cpu_canvas.delete("all")
-        width = self.cpu_canvas.winfo_width()
-        height = self.cpu_canvas.winfo_height()
-        max_value = 100
+        self.draw_history(self.cpu_canvas, "cpu", 100, "blue")
 
-        if width == 1 or height == 1:  # Verifica se o Canvas foi renderizado
+    @profiler.timed("ui.dashboard.update_core_heatmap")
+    def update_core_heatmap(self):
+        """
+        Atualiza o heatmap de uso por núcleo.
+
+        As células são recriadas apenas quando a quantidade de núcleos ou a largura do
+        Canvas mudam; nos demais ciclos, somente a cor de cada célula é alterada.
+        """
+        usage = self.dados.cpu_per_core
+        width = self.core_canvas.winfo_width()
+        if not usage or width == 1:  # Sem dados ou Canvas ainda não renderizado
             return
 
-        step_x = width / len(self.cpu_usage_history)
-        points = [
-            (i * step_x, height - (value / max_value) * height)
-            for i, value in enumerate(self.cpu_usage_history)
-        ]
+        cores = len(usage)
+        columns = min(cores, max(1, width // CORE_CELL_SIZE))
+        if self.core_layout != (cores, columns, width):
+            self.core_layout = (cores, columns, width)
+            rows = -(-cores // columns)
+            cell_w = width / columns
+            self.core_canvas.configure(height=rows * CORE_CELL_SIZE)
+            self.core_canvas.delete("all")
+            self.core_cells = [
+                self.core_canvas.create_rectangle(
+                    (i % columns) * cell_w, (i // columns) * CORE_CELL_SIZE,
+                    (i % columns + 1) * cell_w, (i // columns + 1) * CORE_CELL_SIZE,
+                    outline="white"
+                )
+                for i in range(cores)
+            ]
 
-        for i in range(len(points) - 1):
-            self.cpu_canvas.create_line(points[i], points[i + 1], fill="blue", width=2)
+        for cell, value in zip(self.core_cells, usage):
+            self.core_canvas.itemconfigure(cell, fill=heat_color(value))
 
+        hottest = max(range(cores), key=usage.__getitem__)
+        self.core_label.config(
+            text=f"Per-core usage ({cores} cores) - hottest: cpu{hottest} {usage[hottest]}%"
+        )
+
+    @profiler.timed("ui.dashboard.update_memory_graph")
     def update_memory_graph(self):
         """
         Atualiza o gráfico de uso da memória.
 
         Este método desenha um gráfico que representa o uso da memória ao longo do tempo.
         """
-        self.memory_used_history.pop(0)
-        self.memory_used_history.append(self.dados.mUsada / 1024)  # Convertendo para MB
-        self.memory_canvas.delete("all")
-        width = self.memory_canvas.winfo_width()
-        height = self.memory_canvas.winfo_height()
-        max_value = self.dados.mtotal / 1024 if self.dados.mtotal > 0 else 1
+        self.draw_history(self.memory_canvas, "memory", self.dados.mtotal, "green")
+
+    def draw_history(self, canvas, metric, max_value, color):
+        """
+        Desenha o histórico de uma métrica em um Canvas.
+
+        O histórico é consultado na resolução da largura do Canvas: a linha principal é a
+        média de cada ponto, e a faixa clara ao redor dela vai do mínimo ao máximo (visível
+        nas janelas longas, em que cada ponto agrega vários segundos).
+
+        Parâmetros:
+            canvas (tk.Canvas): Canvas do gráfico.
+            metric (str): Nome da métrica no `HistoryStore`.
+            max_value (float): Valor correspondente ao topo do gráfico.
+            color (str): Cor da linha.
+        """
+        canvas.delete("all")
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
 
         if width == 1 or height == 1:  # Verifica se o Canvas foi renderizado
             return
 
-        step_x = width / len(self.memory_used_history)
-        points = [
-            (i * step_x, height - (value / max_value) * height)
-            for i, value in enumerate(self.memory_used_history)
-        ]
+        window = GRAPH_WINDOWS.get(self.graph_window.get(), 60)
+        end = self.replay_time if self.replay is not None else time.time()
+        points = self.history.query(metric, end - window, end, max(2, width // GRAPH_POINT_SPACING))
+        if len(points) < 2:
+            return
+
+        max_value = max_value if max_value > 0 else 1
+        x = lambda t: (t - (end - window)) / window * width
+        y = lambda value: height - (value / max_value) * height
+
+        band = [(x(t), y(maximum)) for t, _, _, maximum in points]
+        band += [(x(t), y(minimum)) for t, minimum, _, _ in reversed(points)]
+        canvas.create_polygon(band, fill="#dde4f0", outline="")
+        canvas.create_line([(x(t), y(average)) for t, _, average, _ in points], fill=color, width=2)
 
-        for i in range(len(points) - 1):
-            self.memory_canvas.create_line(points[i], points[i + 1], fill="green", width=2)
-        
     def fetch_data(self):
         """
         Busca as informações do sistema.
@@ -276,58 +669,146 @@ class DashboardApp(tk.Tk):
         Este método coleta informações da CPU, memória, sistema operacional e processos ativos.
         """
         try:
-            tasks = [
-                self.executor.submit(fetch_cpu_info, self.dados),
-                self.executor.submit(fetch_memory_info, self.dados),
-                self.executor.submit(fetch_os_info, self.dados),
-                self.executor.submit(fetch_active_processes, self.dados),
-            ]
-
-            # Aguardar todas as threads finalizarem
-            for task in tasks:
-                task.result()
-                        
-            # Atualiza a flag dentro de um lock
-            with self.data_lock:
-                self.data_ready = True
+            if self.replay is not None:
+                self.fetch_replay()
+                return
+
+            if self.client is not None:
+                remote = self.client.fetch()
+                self.apply_remote_query(remote)
+                self.history.record_system(remote)
+                if self.recorder is not None:
+                    self.recorder.append(remote)
+                return
+
+            if self.bridge is not None:
+                self.bridge.collect_snapshot(self.dados, self.get_process_query())
+            else:
+                tasks = [
+                    self.executor.submit(fetch_cpu_info, self.dados),
+                    self.executor.submit(fetch_memory_info, self.dados),
+                    self.executor.submit(fetch_os_info, self.dados),
+                    self.executor.submit(fetch_active_processes, self.dados, self.get_process_query()),
+                ]
+
+                # Aguardar todas as threads finalizarem
+                for task in tasks:
+                    task.result()
+
+            processos = get_process_scan(float("inf")).processos
+            self.history.record_system(self.dados, processos)
+            if self.recorder is not None:
+                self.recorder.append(self.dados, processos)
 
         except Exception:
             print("Dashboard - fetch_data: Erro ao buscar dados do sistema")
             traceback.print_exc()
 
-    def refresh_data(self):
+    def fetch_replay(self):
         """
-        Atualiza os dados periodicamente.
+        Carrega o registro selecionado da gravação (avançando um registro por ciclo se a
+        reprodução estiver ativa).
 
-        Este método inicia uma thread para buscar os dados e verifica regularmente o estado da coleta.
+        Os registros novos do índice (gravação ainda em andamento) são carregados no
+        histórico dos gráficos a partir do próprio índice, sem decodificar os registros.
         """
-        try:
-            # Inicia uma thread para buscar os dados
-            thread = threading.Thread(target=self.fetch_data, daemon=True)
-            thread.start()
+        self.replay.refresh()
+        count = len(self.replay)
+        for i in range(self.replay_loaded, count):
+            t, _, cpu_usage, memory_used = self.replay.entry(i)
+            self.history.record("cpu", cpu_usage, t)
+            self.history.record("memory", memory_used, t)
+        if not count:
+            return
 
-            # Em vez de bloquear com join(), verificamos se a thread terminou
-            self.after(1000, self.check_data_ready)
-        except Exception:
-            print("Dashboard - refresh_data: Erro ao iniciar o refresh de dados")
-            traceback.print_exc()  
+        with self.data_lock:
+            position = self.replay_position
+            if self.replay_play and position < count - 1:
+                position += 1
+            position = min(position, count - 1)
+            self.replay_position, self.replay_loaded = position, count
+            self.replay_time = self.replay.timestamp(position)
+        self.replay_dados = self.replay.snapshot(position)
+        self.apply_remote_query(self.replay_dados)
+
+    def on_data_ready(self, result):
+        """
+        Atualiza a interface ao término de uma coleta (chamado pelo agendador na thread do Tk).
+        """
+        self.update_display()
+        if self.profile_visible:
+            self.update_profile_overlay()
 
-    def check_data_ready(self):
+    def get_process_query(self):
         """
-        Verifica se os dados foram coletados.
+        Retorna uma cópia da consulta atual da tabela de processos.
+        """
+        with self.data_lock:
+            return self.process_query.copy()
 
-        Este método verifica regularmente se os dados estão prontos e, se estiverem, atualiza a interface.
+    def fetch_process_query(self):
         """
-        try:
-            with self.data_lock:
-                if self.data_ready:
-                    self.update_display()  # Atualiza a interface
-                    self.data_ready = False  # Reseta a flag
-            self.after(1000, self.refresh_data)  # Agende a próxima atualização
-        except Exception:
-            print("Dashboard - check_data_ready: Erro ao verificar se os dados estão prontos")
-            traceback.print_exc()
-        
+        Reaplica a consulta atual à última varredura do /proc, sem uma nova varredura.
+        """
+        if self.replay is not None:
+            self.apply_remote_query(self.replay_dados)
+            return
+        if self.client is not None:
+            self.apply_remote_query(self.client.dados)
+            return
+        fetch_active_processes(self.dados, self.get_process_query(), float("inf"))
+
+    def apply_remote_query(self, remote):
+        """
+        Aplica a consulta da tabela de processos a um snapshot recebido do coletor headless.
+
+        Parâmetros:
+            remote (SystemInfo): Snapshot completo publicado pelo coletor.
+        """
+        dados = copy.copy(remote)
+        dados.processosAtivos, dados.processos_listados = select_processes(
+            remote.processosAtivos, self.get_process_query()
+        )
+        self.dados = dados
+
+    def update_visibility(self):
+        """
+        Informa ao agendador quais views estão visíveis: só a aba selecionada, e nenhuma
+        com a janela minimizada.
+        """
+        shown = self.state() not in ("iconic", "withdrawn")
+        selected = self.notebook.select()
+        self.scheduler.set_visible("dashboard", shown and selected == str(self.dashboard_tab))
+        self.fs_frame.set_visible(shown and selected == str(self.filesystem_tab))
+        self.connections_frame.set_visible(shown and selected == str(self.connections_tab))
+
+    def on_map_change(self, event):
+        """
+        Handler da minimização/restauração da janela principal.
+        """
+        if event.widget is self:
+            self.update_visibility()
+
+    def refresh_data(self):
+        """
+        Pede uma atualização imediata dos dados (agrupada com uma coleta já em andamento).
+        """
+        self.scheduler.request("dashboard")
+
+    def on_close(self):
+        """
+        Encerra o agendador de atualizações e fecha a aplicação.
+        """
+        self.scheduler.shutdown()
+        self.executor.shutdown(wait=False)
+        if self.client is not None:
+            self.client.close()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.bridge is not None:
+            self.bridge.close()
+        self.destroy()
+
     def show_process_details(self, event):
         """
         Exibe os detalhes do processo selecionado.
@@ -339,7 +820,7 @@ class DashboardApp(tk.Tk):
             if selection:
                 selected_item = self.process_info.item(selection[0])
                 pid = selected_item['values'][1]
-                ProcessDetailsWindow(self, pid)
+                ProcessDetailsWindow(self, pid, scheduler=self.scheduler)
         except Exception:
             print("Dashboard - show_process_details: Erro ao exibir detalhes do processo")
             traceback.print_exc()
@@ -348,4 +829,4 @@ class DashboardApp(tk.Tk):
         """
         Abre a janela de Sistema de Arquivos.
         """
-        FilesystemFrame(self)
\ No newline at end of file
+        FilesystemFrame(self, scheduler=self.scheduler)
\ No newline at end of file
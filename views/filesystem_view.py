@@ -2,10 +2,26 @@ import tkinter as tk
 from tkinter import ttk
 from datetime import datetime
 import os
+from itertools import islice
 import traceback
 import threading
-from concurrent.futures import ThreadPoolExecutor
-from services.system_info_service import fetch_filesystem_info, fetch_directory_info, adjust_path
+from services.system_info_service import (
+    fetch_filesystem_info,
+    iter_directory,
+    fetch_entries_metadata,
+    fetch_entry_info,
+    adjust_path
+)
+from services.inotify_service import DirectoryWatcher
+from services.disk_usage_service import DiskUsageEngine
+from services.profiling_service import profiler
+from .treeview_diff import TreeviewDiffer
+from .virtual_list_view import VirtualList
+from .refresh_scheduler import RefreshScheduler
+
+REFRESH_INTERVAL_MS = 2000  # Intervalo entre atualizações do diretório e das partições
+WATCH_INTERVAL_MS = 500  # Intervalo de leitura dos eventos do inotify do diretório observado
+FIRST_SCREEN_ENTRIES = 100  # Entradas exibidas (com metadados) antes do restante da listagem
 
 def format_size(size_bytes):
     """
@@ -21,10 +37,37 @@ class FilesystemFrame(tk.Frame):
     """
     Frame para exibir as informações do sistema de arquivos e permitir a navegação
     na árvore de diretórios a partir da raiz, com atualização periódica.
+
+    O diretório atual é observado com o inotify: depois da listagem inicial, cada
+    atualização só lê os eventos pendentes e consulta novamente as entradas criadas,
+    removidas ou modificadas. Em sistemas de arquivos sem suporte ao inotify, o diretório
+    volta a ser listado a cada `REFRESH_INTERVAL_MS`.
+
+    A listagem usa apenas o nome e o tipo de cada entrada (`os.scandir`, sem stat). Ao
+    entrar em um diretório, as primeiras `FIRST_SCREEN_ENTRIES` entradas são exibidas antes
+    do restante da listagem; tamanho, permissões, datas e dono são consultados em lotes
+    somente para as linhas exibidas na lista, à medida que ela é rolada.
+
+    O uso em disco recursivo de cada subdiretório (coluna "Uso em disco") é calculado em
+    background pelo `DiskUsageEngine` ao entrar em um diretório, e os totais parciais são
+    exibidos à medida que chegam (marcados com "+" enquanto o subdiretório é percorrido).
+    O cálculo só é feito com o frame visível (`set_visible`): é cancelado quando a aba é
+    ocultada e retomado quando ela volta a ser exibida.
     """
-    def __init__(self, parent, start_path="/"):
+    def __init__(self, parent, start_path="/", scheduler=None, history=None):
+        """
+        Parâmetros:
+            parent (tk.Widget): Widget pai.
+            start_path (str): Diretório inicial.
+            scheduler (RefreshScheduler, opcional): Agendador compartilhado das atualizações.
+            history (HistoryStore, opcional): Histórico onde o uso de cada partição é registrado.
+        """
         super().__init__(parent)
+        self.history = history
         self.current_path = start_path
+        self.scheduler = scheduler or RefreshScheduler(self)
+        self.directory_source = f"filesystem.directory:{id(self)}"
+        self.partition_source = f"filesystem.partitions:{id(self)}"
 
         # Rótulo com o caminho atual
         self.path_label = ttk.Label(self, text=f"Caminho: {self.current_path}")
@@ -38,34 +81,31 @@ class FilesystemFrame(tk.Frame):
         tree_frame = ttk.Frame(self)
         tree_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
-        # Barra de rolagem vertical para a Treeview de diretórios
-        tree_vsb = ttk.Scrollbar(tree_frame, orient="vertical")
-        tree_vsb.grid(row=0, column=1, sticky="ns")
-
-        # Barra de rolagem horizontal para a Treeview de diretórios
-        tree_hsb = ttk.Scrollbar(tree_frame, orient="horizontal")
-        tree_hsb.grid(row=1, column=0, sticky="ew")
-
-        self.tree = ttk.Treeview(
-            tree_frame, 
-            columns=("Name", "Type", "Size", "Permissions", "Last Modified", "Owner"), 
-            show="headings",
-            yscrollcommand=tree_vsb.set,
-            xscrollcommand=tree_hsb.set
+        # Lista virtualizada: apenas as entradas visíveis são materializadas na Treeview
+        self.dir_list = VirtualList(
+            tree_frame,
+            columns=("Name", "Type", "Size", "Disk Usage", "Permissions", "Last Modified", "Owner", "Group"),
+            height=15,
+            view_command=self.on_view_change
         )
+        self.tree = self.dir_list.tree
         self.tree.heading("Name", text="Nome")
         self.tree.heading("Type", text="Tipo")
         self.tree.heading("Size", text="Tamanho")
+        self.tree.heading("Disk Usage", text="Uso em disco")
         self.tree.heading("Permissions", text="Permissões")
         self.tree.heading("Last Modified", text="Última Modificação")
         self.tree.heading("Owner", text="Dono")
+        self.tree.heading("Group", text="Grupo")
         self.tree.column("Name", width=300)
         self.tree.column("Type", width=100, anchor="center")
         self.tree.column("Size", width=100, anchor="center")
+        self.tree.column("Disk Usage", width=110, anchor="center")
         self.tree.column("Permissions", width=100, anchor="center")
         self.tree.column("Last Modified", width=150, anchor="center")
         self.tree.column("Owner", width=100, anchor="center")
-        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.tree.column("Group", width=100, anchor="center")
+        self.dir_list.grid(row=0, column=0, sticky="nsew")
         self.tree.bind("<Double-1>", self.on_double_click)
 
         # Configura o grid do frame para expandir corretamente
@@ -99,10 +139,9 @@ class FilesystemFrame(tk.Frame):
             self.partition_tree.heading(col, text=col)
             self.partition_tree.column(col, anchor="center", width=100)
         self.partition_tree.grid(row=0, column=0, sticky="nsew")
+        self.partition_rows = TreeviewDiffer(self.partition_tree)  # Linhas indexadas por dispositivo e ponto de montagem
 
         # Configura os scrollbars para responderem à rolagem da Treeview
-        tree_vsb.config(command=self.tree.yview)
-        tree_hsb.config(command=self.tree.xview)
         partition_vsb.config(command=self.partition_tree.yview)
         partition_hsb.config(command=self.partition_tree.xview)
 
@@ -112,51 +151,178 @@ class FilesystemFrame(tk.Frame):
 
         # Atributos para atualização em background
         self.data_lock = threading.Lock()
-        self.executor = ThreadPoolExecutor(max_workers=2)
-        self.dir_entries = []      # Dados do diretório
+        self.watcher = DirectoryWatcher()  # Observa o diretório atual (inotify)
+        self.dir_entries = {}      # Dados do diretório: nome -> informações da entrada
+        self.dir_entries_path = None  # Diretório ao qual dir_entries se refere
+        self.dir_changes = None    # Entradas alteradas ainda não exibidas (None: todas)
+        self.dir_rows = {}         # Linhas formatadas exibidas: nome -> valores
+        self.dir_visible = []      # Entradas exibidas na lista (cujos metadados são consultados)
+        self.listing = None        # Restante da listagem do diretório atual (iter_directory)
+        self.displayed_path = None    # Diretório exibido atualmente na Treeview
         self.partition_data = []   # Dados das partições
-        self.directory_ready = False
-        self.partition_ready = False
+        self.du_engine = DiskUsageEngine()  # Uso em disco recursivo dos subdiretórios
+        self.du_path = None        # Diretório cujo uso em disco está sendo calculado
+        self.du_sizes = {}         # Subdiretório -> (bytes ou None se em outro FS, concluído)
+        self.du_total = None       # (bytes, concluído) do diretório inteiro
+        self.du_visible = False    # O uso em disco só é calculado com o frame visível
 
-        # Inicia a atualização dos dados
-        self.refresh_data()
+        # Registra as fontes de dados no agendador (inicia a atualização)
+        self.scheduler.register(self.directory_source, self.fetch_directory_data,
+                                self.on_directory_data, interval=REFRESH_INTERVAL_MS)
+        self.scheduler.register(self.partition_source, self.fetch_partition_data,
+                                lambda result: self.update_partition_display(), interval=REFRESH_INTERVAL_MS)
+        self.bind("<Destroy>", self.on_destroy)
 
+    @profiler.timed("ui.filesystem.update_directory_display")
     def update_directory_display(self):
         """
         Atualiza a listagem do diretório na Treeview.
+
+        Somente as entradas alteradas desde a última atualização são formatadas novamente.
         """
         try:
-            self.tree.delete(*self.tree.get_children())
-            for entry in self.dir_entries:
-                tipo = "Diretório" if entry["is_dir"] else "Arquivo"
-                tamanho = format_size(entry['size'])
-                mod_time = datetime.fromtimestamp(entry['last_modified']).strftime("%d/%m/%Y %H:%M:%S")
-                owner = entry.get('owner', 'N/A')
-                self.tree.insert("", "end", values=(
-                    entry["name"],
-                    tipo,
-                    tamanho,
-                    entry["permissions"],
-                    mod_time,
-                    owner
-                ))
-            self.path_label.config(text=f"Caminho: {self.current_path}")
+            with self.data_lock:
+                entries, path = self.dir_entries, self.dir_entries_path
+                changes, self.dir_changes = self.dir_changes, set()
+                if changes is None:
+                    entries = dict(entries)
+                else:
+                    entries = {name: entries.get(name) for name in changes}
+            if path != self.displayed_path:
+                self.dir_list.reset_view()  # Outro diretório: volta ao topo e limpa a seleção
+                self.displayed_path = path
+            self.update_path_label(path)
+            if changes is None:
+                self.dir_rows = {name: self.format_entry(entry) for name, entry in entries.items()}
+            elif not changes:
+                return  # Nenhuma alteração no diretório
+            else:
+                for name, entry in entries.items():
+                    if entry is None:
+                        self.dir_rows.pop(name, None)
+                    else:
+                        self.dir_rows[name] = self.format_entry(entry)
+            self.dir_list.set_rows(list(self.dir_rows), list(self.dir_rows.values()))
         except Exception:
             print("FilesystemFrame - update_directory_display: Erro ao atualizar o diretório")
             traceback.print_exc()
 
+    def on_directory_data(self, result):
+        """
+        Exibe o resultado de uma coleta do diretório e, se a listagem ainda não terminou,
+        pede imediatamente a coleta do restante.
+        """
+        self.update_directory_display()
+        if self.listing is not None:
+            self.scheduler.request(self.directory_source)
+
+    def on_view_change(self):
+        """
+        Registra as entradas exibidas na lista e pede os metadados das que ainda não os têm
+        (chamado a cada renderização da lista, p.ex. ao rolar).
+        """
+        names = self.dir_list.visible_keys()
+        with self.data_lock:
+            self.dir_visible = names
+            entries = self.dir_entries
+            missing = any(name in entries and "size" not in entries[name] for name in names)
+        if missing:
+            self.scheduler.request(self.directory_source)
+
+    def update_path_label(self, path):
+        """
+        Exibe o caminho atual e, quando disponível, seu uso em disco total.
+        """
+        text = f"Caminho: {path}"
+        total = self.du_total if self.du_path == path else None
+        if total is not None:
+            text += f"  (uso em disco: {format_size(total[0])}{'' if total[1] else '+'})"
+        if self.path_label.cget("text") != text:
+            self.path_label.config(text=text)
+
+    def format_entry(self, entry):
+        """
+        Formata as informações de uma entrada do diretório como uma linha da Treeview
+        (com "..." no lugar dos metadados ainda não consultados).
+        """
+        if "size" not in entry:
+            return (
+                entry["name"],
+                "Diretório" if entry["is_dir"] else "Arquivo",
+                "...",
+                self.format_disk_usage(entry),
+                "...",
+                "...",
+                "...",
+                "..."
+            )
+        return (
+            entry["name"],
+            "Diretório" if entry["is_dir"] else "Arquivo",
+            format_size(entry['size']),
+            self.format_disk_usage(entry),
+            entry["permissions"],
+            datetime.fromtimestamp(entry['last_modified']).strftime("%d/%m/%Y %H:%M:%S"),
+            entry.get('owner', 'N/A'),
+            entry.get('group', 'N/A')
+        )
+
+    def format_disk_usage(self, entry):
+        """
+        Formata o uso em disco recursivo de um subdiretório (vazio para arquivos).
+        """
+        if not entry["is_dir"]:
+            return ""
+        usage = self.du_sizes.get(entry["name"])
+        if usage is None:
+            # Links simbólicos para diretórios não são percorridos
+            return "" if self.du_total is not None and self.du_total[1] else "calculando..."
+        size, done = usage
+        if size is None:
+            return "outro sistema de arquivos"
+        return format_size(size) + ("" if done else "+")
+
+    def on_disk_usage(self, path, name, size, done):
+        """
+        Recebe um resultado (parcial ou final) do `DiskUsageEngine` (thread do engine).
+        """
+        with self.data_lock:
+            if path != self.du_path:
+                return  # Resultado de um diretório que não é mais exibido
+            if name is None:
+                self.du_total = (size, done)
+                return
+            self.du_sizes[name] = (size, done)
+            if self.dir_changes is not None:
+                self.dir_changes.add(name)
+
+    def start_disk_usage(self, path):
+        """
+        Inicia o cálculo do uso em disco dos subdiretórios de `path`.
+
+        Com o frame oculto, nada é feito: o cálculo é iniciado por `set_visible`.
+        """
+        with self.data_lock:
+            if not self.du_visible:
+                return
+            if path != self.du_path:
+                self.du_path, self.du_sizes = path, {}
+            self.du_total = None
+        self.du_engine.start(path, lambda name, size, done: self.on_disk_usage(path, name, size, done))
+
+    @profiler.timed("ui.filesystem.update_partition_display")
     def update_partition_display(self):
         """
         Atualiza a listagem das partições na Treeview, formatando os tamanhos com format_size.
         """
         try:
-            self.partition_tree.delete(*self.partition_tree.get_children())
+            rows = []
             for part in self.partition_data:
                 # Converte os valores de KB para bytes e formata-os
                 total_str = format_size(part['total'] * 1024)
                 used_str = format_size(part['used'] * 1024)
                 free_str = format_size(part['free'] * 1024)
-                self.partition_tree.insert("", "end", values=(
+                rows.append((f"{part['device']}@{part['mountpoint']}", (
                     part["device"],
                     part["mountpoint"],
                     part["fstype"],
@@ -164,7 +330,8 @@ class FilesystemFrame(tk.Frame):
                     used_str,
                     free_str,
                     f"{part['percent']}%"
-                ))
+                )))
+            self.partition_rows.update(rows)
         except Exception:
             print("FilesystemFrame - update_partition_display: Erro ao atualizar as partições")
             traceback.print_exc()
@@ -172,17 +339,125 @@ class FilesystemFrame(tk.Frame):
     def fetch_directory_data(self):
         """
         Busca os dados do diretório atual em um worker separado.
+
+        Se o diretório já está sendo observado, apenas as entradas indicadas pelos eventos
+        do inotify são consultadas; caso contrário (outro diretório, eventos perdidos ou
+        sistema de arquivos sem inotify), o diretório é listado novamente. Em seguida, são
+        consultados os metadados das entradas exibidas que ainda não os têm.
         """
         try:
-            directory_entries = fetch_directory_info(self.current_path)
-            with self.data_lock:
-                self.dir_entries = directory_entries
-                self.directory_ready = True
+            path = self.current_path
+            if self.listing is not None and self.dir_entries_path != path:
+                self.listing.close()  # Listagem de um diretório que não é mais exibido
+                self.listing = None
+            if self.listing is not None:
+                self.continue_listing(path)
+            elif self.watcher.path != path or not self.apply_directory_events(path):
+                self.start_listing(path)
+            self.fetch_visible_metadata(path)
         except Exception:
             print("FilesystemFrame - fetch_directory_data: Erro ao buscar dados do diretório")
             traceback.print_exc()
-            with self.data_lock:
-                self.directory_ready = True
+
+    def start_listing(self, path):
+        """
+        Lista o diretório `path` (nome e tipo das entradas).
+
+        Ao entrar em um diretório, apenas as primeiras `FIRST_SCREEN_ENTRIES` entradas são
+        lidas, já com seus metadados, para que sejam exibidas imediatamente; o restante
+        é lido na coleta seguinte (`continue_listing`). Ao listar novamente o mesmo
+        diretório (polling), a listagem é lida por completo.
+        """
+        watching = self.watcher.watch(path)  # Antes da listagem: nenhuma alteração é perdida
+        listing = iter_directory(path)
+        streaming = path != self.dir_entries_path
+        try:
+            first = list(islice(listing, FIRST_SCREEN_ENTRIES) if streaming else listing)
+        except OSError as e:
+            print(f"Erro ao listar o diretório {path}: {e}")
+            first, streaming = [], False
+        entries = {entry["name"]: entry for entry in first}
+        if streaming:
+            for name, metadata in fetch_entries_metadata(path, list(entries)).items():
+                if metadata is None:
+                    del entries[name]  # Removida (ou ilegível) desde a listagem
+                else:
+                    entries[name].update(metadata)
+        with self.data_lock:
+            self.dir_entries = entries
+            self.dir_entries_path = path
+            self.dir_changes = None
+            self.listing = listing if streaming and len(first) == FIRST_SCREEN_ENTRIES else None
+        if path != self.du_path:
+            self.start_disk_usage(path)
+        self.scheduler.set_interval(self.directory_source, WATCH_INTERVAL_MS if watching else REFRESH_INTERVAL_MS)
+
+    def continue_listing(self, path):
+        """
+        Lê o restante da listagem iniciada por `start_listing`.
+        """
+        try:
+            rest = list(self.listing)
+        except OSError as e:
+            print(f"Erro ao listar o diretório {path}: {e}")
+            rest = []
+        with self.data_lock:
+            for entry in rest:
+                self.dir_entries.setdefault(entry["name"], entry)
+            if self.dir_changes is not None:
+                self.dir_changes.update(entry["name"] for entry in rest)
+            self.listing = None
+
+    def apply_directory_events(self, path):
+        """
+        Aplica ao diretório observado os eventos pendentes do inotify.
+
+        Retorno:
+            bool: False se os eventos não bastam e o diretório deve ser listado novamente.
+        """
+        names, rescan = self.watcher.read_events()
+        if rescan:
+            return False
+        changed = {name: fetch_entry_info(path, name) for name in names}
+        with self.data_lock:
+            for name, info in changed.items():
+                if info is None:
+                    self.dir_entries.pop(name, None)
+                else:
+                    self.dir_entries[name] = info
+            if self.dir_changes is not None:
+                self.dir_changes.update(names)
+            new_subdirs = any(info is not None and info["is_dir"] and name not in self.du_sizes
+                              for name, info in changed.items())
+        if new_subdirs:
+            self.start_disk_usage(path)  # Só os diretórios alterados são relistados
+        return True
+
+    def fetch_visible_metadata(self, path):
+        """
+        Consulta, em um lote, os metadados das entradas exibidas que ainda não os têm.
+        """
+        with self.data_lock:
+            if path != self.dir_entries_path:
+                return
+            entries = self.dir_entries
+            names = [name for name in self.dir_visible if name in entries and "size" not in entries[name]]
+        if not names:
+            return
+        metadata = fetch_entries_metadata(path, names)
+        with self.data_lock:
+            if path != self.dir_entries_path:
+                return
+            for name, info in metadata.items():
+                entry = self.dir_entries.get(name)
+                if entry is None:
+                    continue
+                if info is None:
+                    del self.dir_entries[name]  # Removida (ou ilegível) desde a listagem
+                else:
+                    self.dir_entries[name] = {**entry, **info}
+                if self.dir_changes is not None:
+                    self.dir_changes.add(name)
 
     def fetch_partition_data(self):
         """
@@ -192,42 +467,53 @@ class FilesystemFrame(tk.Frame):
             partitions = fetch_filesystem_info()
             with self.data_lock:
                 self.partition_data = partitions
-                self.partition_ready = True
+            if self.history is not None:
+                self.history.record_partitions(partitions)
         except Exception:
             print("FilesystemFrame - fetch_partition_data: Erro ao buscar dados das partições")
             traceback.print_exc()
-            with self.data_lock:
-                self.partition_ready = True
+
+    def set_visible(self, visible):
+        """
+        Informa ao agendador se o frame está visível (aba selecionada, janela não minimizada).
+
+        Ao ocultar o frame, o cálculo do uso em disco é cancelado; ao exibi-lo, é retomado
+        se o diretório atual ainda não foi percorrido por completo.
+        """
+        self.scheduler.set_visible(self.directory_source, visible)
+        self.scheduler.set_visible(self.partition_source, visible)
+        with self.data_lock:
+            if visible == self.du_visible:
+                return
+            self.du_visible = visible
+            path = self.dir_entries_path
+            pending = path is not None and (
+                path != self.du_path or self.du_total is None or not self.du_total[1]
+                or any(entry["is_dir"] and name not in self.du_sizes for name, entry in self.dir_entries.items())
+            )
+        if not visible:
+            self.du_engine.cancel()
+        elif pending:
+            self.start_disk_usage(path)
 
     def refresh_data(self):
         """
-        Inicia a busca dos dados (diretório e partições) em workers separados e agenda
-        a verificação periódica.
+        Pede a atualização imediata da listagem do diretório atual.
+
+        Pedidos feitos durante uma coleta em andamento são agrupados pelo agendador,
+        de modo que a navegação nunca inicia coletas concorrentes.
         """
-        try:
-            self.executor.submit(self.fetch_directory_data)
-            self.executor.submit(self.fetch_partition_data)
-            self.after(1000, self.check_data_ready)
-        except Exception:
-            print("FilesystemFrame - refresh_data: Erro ao iniciar o refresh de dados")
-            traceback.print_exc()
+        self.scheduler.request(self.directory_source)
 
-    def check_data_ready(self):
+    def on_destroy(self, event):
         """
-        Verifica se os dados foram atualizados e, se sim, agenda a atualização da interface.
+        Remove as fontes de dados do agendador quando o frame é destruído.
         """
-        try:
-            with self.data_lock:
-                if self.directory_ready:
-                    self.directory_ready = False
-                    self.after_idle(self.update_directory_display)
-                if self.partition_ready:
-                    self.partition_ready = False
-                    self.after_idle(self.update_partition_display)
-            self.after(1000, self.refresh_data)
-        except Exception:
-            print("FilesystemFrame - check_data_ready: Erro na verificação dos dados")
-            traceback.print_exc()
+        if event.widget is self:
+            self.scheduler.unregister(self.directory_source)
+            self.scheduler.unregister(self.partition_source)
+            self.watcher.close()
+            self.du_engine.close()
 
     def on_double_click(self, event):
         """
@@ -5,32 +5,58 @@ import threading
 import traceback
 from models import ProcessDetails
 from services.system_info_service import (
+    IO_FIELDS,
+    ProcessIoTracker,
     fetch_process_details,
     fetch_process_tasks,
-    fetch_io_info,
-    fetch_process_resources
+    fetch_io_rates
 )
+from services.fd_service import FdTracker, fd_target_inode
+from services.net_service import Connection, get_net_index
+from services.profiling_service import profiler
 from concurrent.futures import ThreadPoolExecutor
 
 from views.filesystem_view import format_size
+from views.virtual_list_view import VirtualList
+from views.refresh_scheduler import RefreshScheduler
+
+REFRESH_INTERVAL_MS = 2000  # Intervalo entre atualizações dos detalhes do processo
 
 class ProcessDetailsWindow(tk.Toplevel):
     """
     Janela que exibe detalhes de um processo específico, incluindo informações de I/O
     e recursos abertos (arquivos, sockets, etc.), organizados em abas.
+
+    Os descritores abertos são acompanhados por um `FdTracker`: cada atualização recebe
+    apenas os descritores abertos e fechados desde a anterior, e o destino real (tamanho,
+    data, inode) é consultado somente para os arquivos e dispositivos exibidos na lista, e
+    os sockets exibidos são resolvidos (endereços e estado) pelo índice compartilhado das
+    tabelas do /proc/net (`get_net_index`).
+
+    Os contadores de I/O são lidos no worker junto com os demais detalhes, e um
+    `ProcessIoTracker` converte a diferença entre duas atualizações em taxas por segundo.
     """
-    def __init__(self, parent, pid):
+    def __init__(self, parent, pid, scheduler=None):
         super().__init__(parent)
         self.title(f"Detalhes do Processo PID {pid}")
         self.geometry("800x600")
         self.pid = pid
-        self.data_ready = False
-        self.resources_ready = False
+        self.scheduler = scheduler or RefreshScheduler(self)
+        self.source = f"process_details:{pid}:{id(self)}"
         self.data_lock = threading.Lock()
-        self.executor = ThreadPoolExecutor(max_workers=3)
+        self.executor = ThreadPoolExecutor(max_workers=4)
         self.details = ProcessDetails()
         self.tasks = []
-        self.resources = []  # para armazenar os recursos abertos
+        self.io_tracker = ProcessIoTracker()
+        self.io_sample = None  # Última amostra de I/O: (contadores, taxas), ou None se ilegível
+        self.fd_tracker = FdTracker(pid)
+        self.fd_entries = {}   # Descritores abertos: fd -> (tipo, destino)
+        self.fd_details = {}   # Descritores exibidos: fd -> os.stat_result do destino real ou
+                               # Connection do socket (None se indisponível)
+        self.fd_changes = None  # Descritores alterados ainda não exibidos (None: todos)
+        self.fd_rows = {}      # Linhas formatadas exibidas: fd -> valores
+        self.fd_visible = []   # Descritores exibidos na lista (cujo destino é consultado)
+        self.fd_summary = None  # Última FdScan (quantidades por tipo)
 
         # Cria um Notebook com duas abas: "Detalhes" e "Recursos"
         self.notebook = ttk.Notebook(self)
@@ -55,49 +81,57 @@ class ProcessDetailsWindow(tk.Toplevel):
         self.tasks_frame = ttk.LabelFrame(self.details_frame, text="Tasks", padding="10")
         self.tasks_frame.pack(fill="both", expand=True, padx=10, pady=5)
         columns = ("Pid", "Name", "State", "VmSize", "VmRSS", "VmExe")
-        self.tasks_table = ttk.Treeview(self.tasks_frame, columns=columns, show="headings", height=10)
+        self.tasks_list = VirtualList(self.tasks_frame, columns, height=10)
+        self.tasks_table = self.tasks_list.tree
         for col in columns:
             self.tasks_table.heading(col, text=col.capitalize(), anchor="center")
             self.tasks_table.column(col, width=150, anchor="center")
-        tasks_scroll_v = ttk.Scrollbar(self.tasks_frame, orient="vertical", command=self.tasks_table.yview)
-        tasks_scroll_h = ttk.Scrollbar(self.tasks_frame, orient="horizontal", command=self.tasks_table.xview)
-        self.tasks_table.configure(yscrollcommand=tasks_scroll_v.set, xscrollcommand=tasks_scroll_h.set)
-        tasks_scroll_v.pack(side="right", fill="y")
-        tasks_scroll_h.pack(side="bottom", fill="x")
-        self.tasks_table.pack(fill="both", expand=True)
+        self.tasks_list.pack(fill="both", expand=True)
 
         # Conteúdo da aba "Recursos"
+        # Quantidade de descritores por tipo
+        self.resources_summary = ttk.Label(self.resources_frame, text="Descritores: ...")
+        self.resources_summary.pack(fill="x", padx=10, pady=5)
+
         # Treeview para exibir os recursos abertos pelo processo
-        columns_res = ("FD", "Target", "Inode", "Size", "Last Modified")
-        self.resources_table = ttk.Treeview(self.resources_frame, columns=columns_res, show="headings", height=15)
+        columns_res = ("FD", "Type", "Target", "Inode", "Size", "Last Modified", "Local", "Remote", "State")
+        self.resources_list = VirtualList(self.resources_frame, columns_res, height=15,
+                                          view_command=self.on_resources_view_change)
+        self.resources_table = self.resources_list.tree
 
         # Configura os cabeçalhos de cada coluna
         self.resources_table.heading("FD", text="FD")
+        self.resources_table.heading("Type", text="Type")
         self.resources_table.heading("Target", text="Target")
         self.resources_table.heading("Inode", text="Inode")
         self.resources_table.heading("Size", text="Size")
         self.resources_table.heading("Last Modified", text="Last Modified")
+        self.resources_table.heading("Local", text="Local")
+        self.resources_table.heading("Remote", text="Remote")
+        self.resources_table.heading("State", text="State")
 
         # Define as larguras e alinhamentos de cada coluna
         self.resources_table.column("FD", width=50, anchor="center")
+        self.resources_table.column("Type", width=90, anchor="center")
         self.resources_table.column("Target", width=300, anchor="w")
         self.resources_table.column("Inode", width=100, anchor="center")
         self.resources_table.column("Size", width=100, anchor="center")
         self.resources_table.column("Last Modified", width=150, anchor="center")
+        self.resources_table.column("Local", width=160, anchor="w")
+        self.resources_table.column("Remote", width=160, anchor="w")
+        self.resources_table.column("State", width=100, anchor="center")
 
-        # Cria as barras de rolagem e configura o Treeview
-        res_scroll_v = ttk.Scrollbar(self.resources_frame, orient="vertical", command=self.resources_table.yview)
-        res_scroll_h = ttk.Scrollbar(self.resources_frame, orient="horizontal", command=self.resources_table.xview)
-        self.resources_table.configure(yscrollcommand=res_scroll_v.set, xscrollcommand=res_scroll_h.set)
+        self.resources_list.pack(fill="both", expand=True, padx=10, pady=5)
 
-        # Posiciona as barras de rolagem e o Treeview
-        res_scroll_v.pack(side="right", fill="y")
-        res_scroll_h.pack(side="bottom", fill="x")
-        self.resources_table.pack(fill="both", expand=True, padx=10, pady=5)
-
-        # Inicia a atualização dos dados
-        self.refresh_data()
+        # Registra a fonte de dados no agendador (inicia a atualização)
+        self.scheduler.register(self.source, self.fetch_details, self.on_data_ready, interval=REFRESH_INTERVAL_MS)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.bind("<Destroy>", self.on_destroy)
+        self.bind("<Map>", self.on_map_change)
+        self.bind("<Unmap>", self.on_map_change)
+        self.scheduler.track_focus(self)
 
+    @profiler.timed("ui.process_details.update_display")
     def update_display(self):
         """
         Atualiza os detalhes do processo e a tabela de tasks na aba "Detalhes".
@@ -106,6 +140,7 @@ class ProcessDetailsWindow(tk.Toplevel):
             with self.data_lock:
                 if not self.details:
                     return
+                io_sample = self.io_sample
 
             self.details_text.config(state="normal")
             self.details_text.delete("1.0", tk.END)
@@ -121,50 +156,103 @@ class ProcessDetailsWindow(tk.Toplevel):
                 f"VmExe: {self.details.vm_exe}\n",
                 f"Threads: {self.details.threads}\n",
             ])
-            # Adiciona informações de I/O
-            io_info = fetch_io_info(self.pid)
-            if io_info:
-                details_str += "\n--- I/O Info ---\n"
-                for key, value in io_info.items():
-                    details_str += f"{key}: {value}\n"
+            # Adiciona informações de I/O (coletadas em `fetch_io`)
+            details_str += "\n--- I/O Info ---\n" + format_io_sample(io_sample)
 
             self.details_text.insert(tk.END, details_str)
             self.details_text.config(state="disabled")
 
             # Atualiza a tabela de tasks (threads)
-            self.tasks_table.delete(*self.tasks_table.get_children())
-            for task in self.tasks:
-                self.tasks_table.insert("", "end", values=(
-                    task.pid,
-                    task.name,
-                    task.state,
-                    task.vm_size,
-                    task.vm_rss,
-                    task.vm_exe,
-                ))
+            self.tasks_list.set_rows([task.pid for task in self.tasks], [(
+                task.pid,
+                task.name,
+                task.state,
+                task.vm_size,
+                task.vm_rss,
+                task.vm_exe,
+            ) for task in self.tasks])
         except Exception:
             print(f"ProcessDetailsWindow - update_display: Erro ao atualizar os detalhes do processo PID {self.pid}")
             traceback.print_exc()
 
+    @profiler.timed("ui.process_details.update_resources")
     def update_resources(self):
         """
         Atualiza a tabela de recursos abertos na aba "Recursos".
+
+        Somente os descritores alterados desde a última atualização são formatados novamente.
         """
         try:
-            self.resources_table.delete(*self.resources_table.get_children())
-            for res in self.resources:
-                self.resources_table.insert("", "end", values=(
-                    res["fd"],
-                    res["target"],
-                    res["inode"],
-                    format_size(res["size"]),
-                    datetime.fromtimestamp(res["last_modified"]).strftime("%d/%m/%Y %H:%M:%S"),
-                    res["target"]
-                ))
+            with self.data_lock:
+                changes, self.fd_changes = self.fd_changes, set()
+                summary = self.fd_summary
+                if changes is None:
+                    entries = dict(self.fd_entries)
+                else:
+                    entries = {fd: self.fd_entries.get(fd) for fd in changes}
+            if summary is not None:
+                self.update_resources_summary(summary)
+            if changes is None:
+                self.fd_rows = {fd: self.format_resource(fd, entry) for fd, entry in entries.items()}
+            elif not changes:
+                return  # Nenhum descritor aberto, fechado ou consultado
+            else:
+                for fd, entry in entries.items():
+                    if entry is None:
+                        self.fd_rows.pop(fd, None)
+                    else:
+                        self.fd_rows[fd] = self.format_resource(fd, entry)
+            self.resources_list.set_rows(list(self.fd_rows), list(self.fd_rows.values()))
         except Exception:
             print(f"ProcessDetailsWindow - update_resources: Erro ao atualizar recursos para PID {self.pid}")
             traceback.print_exc()
 
+    def update_resources_summary(self, summary):
+        """
+        Exibe a quantidade de descritores abertos, total e por tipo.
+        """
+        if summary.error:
+            text = f"Descritores: indisponíveis ({summary.error})"
+        else:
+            counts = ", ".join(f"{kind}: {count}" for kind, count in summary.counts.items() if count)
+            text = f"Descritores: {summary.total}" + (f" ({counts})" if counts else "")
+        if self.resources_summary.cget("text") != text:
+            self.resources_summary.config(text=text)
+
+    def format_resource(self, fd, entry):
+        """
+        Formata um descritor como uma linha da tabela de recursos.
+
+        Sockets exibem os endereços e o estado da conexão; arquivos e dispositivos, os
+        dados do destino real; ambos com "..." enquanto não foram consultados.
+        """
+        kind, target = entry
+        if not needs_lookup(kind):
+            inode = fd_target_inode(target)
+            return (fd, kind, target, "" if inode is None else inode, "", "", "", "", "")
+        if fd not in self.fd_details:
+            return (fd, kind, target, "...", "...", "...", "...", "...", "...")
+        detail = self.fd_details[fd]
+        if isinstance(detail, Connection):
+            return (fd, detail.proto, target, detail.inode, "", "",
+                    detail.local_endpoint(), detail.remote_endpoint(), detail.state)
+        if kind == "socket":
+            # Socket fora das tabelas do /proc/net (p.ex. netlink, outro namespace)
+            return (fd, kind, target, fd_target_inode(target), "", "", "", "", "")
+        if detail is None:
+            return (fd, kind, target, "N/A", "N/A", "N/A", "", "", "")
+        return (
+            fd,
+            kind,
+            target,
+            detail.st_ino,
+            format_size(detail.st_size),
+            datetime.fromtimestamp(detail.st_mtime).strftime("%d/%m/%Y %H:%M:%S"),
+            "",
+            "",
+            "",
+        )
+
     def fetch_details(self):
         """
         Busca os detalhes do processo, tasks e recursos em threads separadas.
@@ -173,47 +261,148 @@ class ProcessDetailsWindow(tk.Toplevel):
             tasks_list = [
                 self.executor.submit(fetch_process_details, self.pid, self.details),
                 self.executor.submit(fetch_process_tasks, self.pid, self.tasks),
-                self.executor.submit(fetch_process_resources, self.pid)
+                self.executor.submit(self.fetch_resources),
+                self.executor.submit(self.fetch_io)
             ]
-            # Aguarda os resultados; se a tarefa de recursos retornar um valor, atualiza self.resources
             for task in tasks_list:
-                result = task.result()
-                if result is not None and isinstance(result, list):
-                    self.resources = result
-            with self.data_lock:
-                self.data_ready = True
-                self.resources_ready = True
+                task.result()
         except Exception:
             print(f"ProcessDetailsWindow - fetch_details: Erro ao buscar detalhes do processo PID {self.pid}")
             traceback.print_exc()
-            with self.data_lock:
-                self.data_ready = True
-                self.resources_ready = True
+
+    def fetch_io(self):
+        """
+        Lê os contadores de I/O do processo e calcula as taxas desde a atualização anterior.
+        """
+        sample = fetch_io_rates(self.pid, self.io_tracker)
+        with self.data_lock:
+            self.io_sample = sample
+
+    def fetch_resources(self):
+        """
+        Aplica as alterações dos descritores desde a última varredura e consulta o destino
+        real dos arquivos e dispositivos e a conexão dos sockets exibidos.
+        """
+        scan = self.fd_tracker.scan()
+        with self.data_lock:
+            for fd in scan.closed:
+                self.fd_entries.pop(fd, None)
+                self.fd_details.pop(fd, None)
+            for fd, entry in scan.opened.items():
+                self.fd_entries[fd] = entry
+                self.fd_details.pop(fd, None)
+            if scan.reset:
+                self.fd_changes = None
+            elif self.fd_changes is not None:
+                self.fd_changes.update(scan.closed)
+                self.fd_changes.update(scan.opened)
+            self.fd_summary = scan
+            visible = [(fd, self.fd_entries[fd]) for fd in self.fd_visible
+                       if fd in self.fd_entries and needs_lookup(self.fd_entries[fd][0])]
+        if not visible:
+            return
+        details = self.fd_tracker.stat_targets([fd for fd, (kind, _) in visible if kind != "socket"])
+        sockets = [(fd, fd_target_inode(target)) for fd, (kind, target) in visible if kind == "socket"]
+        if sockets:
+            index = get_net_index()
+            details.update((fd, index.lookup(inode)) for fd, inode in sockets)
+        with self.data_lock:
+            for fd, detail in details.items():
+                if fd not in self.fd_entries:
+                    continue  # Fechado durante a consulta
+                previous = self.fd_details.get(fd, False)
+                self.fd_details[fd] = detail
+                if self.fd_changes is not None and detail_key(previous) != detail_key(detail):
+                    self.fd_changes.add(fd)
+
+    def on_resources_view_change(self):
+        """
+        Registra os descritores exibidos na lista e pede a consulta dos destinos que ainda
+        não foram consultados (chamado a cada renderização da lista, p.ex. ao rolar).
+        """
+        fds = self.resources_list.visible_keys()
+        with self.data_lock:
+            self.fd_visible = fds
+            missing = any(fd in self.fd_entries and fd not in self.fd_details and needs_lookup(self.fd_entries[fd][0])
+                          for fd in fds)
+        if missing:
+            self.scheduler.request(self.source)
+
+    def on_data_ready(self, result):
+        """
+        Atualiza as abas ao término de uma coleta (chamado pelo agendador na thread do Tk).
+        """
+        self.update_display()
+        self.update_resources()
+
+    def on_map_change(self, event):
+        """
+        Suspende a atualização enquanto a janela está minimizada.
+        """
+        if event.widget is self:
+            self.scheduler.set_visible(self.source, self.state() not in ("iconic", "withdrawn"))
 
     def refresh_data(self):
         """
-        Inicia a busca dos dados e agenda a verificação periódica.
+        Pede uma atualização imediata (agrupada com uma coleta já em andamento).
         """
-        try:
-            self.executor.submit(self.fetch_details)
-            self.after(1000, self.check_data_ready)
-        except Exception:
-            print(f"ProcessDetailsWindow - refresh_data: Erro ao iniciar o refresh de dados para PID {self.pid}")
-            traceback.print_exc()
+        self.scheduler.request(self.source)
 
-    def check_data_ready(self):
+    def on_close(self):
         """
-        Verifica se os dados foram atualizados e, se sim, atualiza a interface.
+        Remove a fonte de dados do agendador e fecha a janela.
         """
-        try:
-            with self.data_lock:
-                if self.data_ready:
-                    self.data_ready = False
-                    self.after_idle(self.update_display)
-                if self.resources_ready:
-                    self.resources_ready = False
-                    self.after_idle(self.update_resources)
-            self.after(1000, self.refresh_data)
-        except Exception:
-            print(f"ProcessDetailsWindow - check_data_ready: Erro na verificação dos dados para PID {self.pid}")
-            traceback.print_exc()
+        self.scheduler.unregister(self.source)
+        self.executor.shutdown(wait=False)
+        self.destroy()
+
+    def on_destroy(self, event):
+        """
+        Garante a remoção da fonte de dados quando a janela é destruída por outro caminho.
+        """
+        if event.widget is self:
+            self.scheduler.unregister(self.source)
+
+
+def format_io_sample(sample):
+    """
+    Formata os contadores de I/O de um processo, com as taxas por segundo.
+
+    Parâmetros:
+        sample (tuple): (contadores, taxas) retornado por `fetch_io_rates`, ou None.
+
+    Retorno:
+        str: Uma linha por contador; syscr/syscw são quantidades de chamadas, os demais bytes.
+    """
+    if sample is None:
+        return "Indisponível (sem permissão ou processo encerrado)\n"
+    counters, rates = sample
+    lines = []
+    for field in IO_FIELDS:
+        if field.startswith("sys"):
+            total = str(counters[field])
+            rate = f"{rates[field]:.1f}/s" if rates else "..."
+        else:
+            total = format_size(counters[field])
+            rate = f"{format_size(rates[field])}/s" if rates else "..."
+        lines.append(f"{field}: {total} ({rate})\n")
+    return "".join(lines)
+
+
+def needs_lookup(kind):
+    """
+    Indica se a linha de um descritor depende de uma consulta sob demanda: o destino real
+    (arquivos e dispositivos) ou a conexão no /proc/net (sockets). Pipes e demais
+    descritores trazem o inode no próprio destino.
+    """
+    return kind in ("file", "device", "socket")
+
+
+def detail_key(detail):
+    """
+    Campos exibidos de um stat ou de uma conexão (para detectar alterações), ou o próprio
+    valor se ausente.
+    """
+    if isinstance(detail, Connection):
+        return (detail.proto, detail.local, detail.remote, detail.state)
+    return (detail.st_ino, detail.st_size, detail.st_mtime) if detail else detail
@@ -0,0 +1,306 @@
+import tkinter as tk
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from services.profiling_service import profiler
+
+POLL_INTERVAL_MS = 50  # Intervalo de verificação do término de uma coleta em andamento
+CPU_BUDGET = 0.05  # Fração de um núcleo que as coletas periódicas podem usar, somadas
+COST_SMOOTHING = 0.3  # Peso de cada nova medição na média móvel do custo das coletas
+UNFOCUSED_INTERVAL_FACTOR = 2  # Multiplicador dos intervalos enquanto a janela está sem foco
+MAX_INTERVAL_MS = 30000  # Maior intervalo a que uma fonte é atrasada pelo orçamento de CPU
+
+
+class RefreshSource:
+    """
+    Estado de uma fonte de dados registrada no `RefreshScheduler`.
+
+    Atributos:
+        name (str): Nome único da fonte.
+        collect (callable): Função de coleta, executada em uma thread de background.
+        apply (callable): Função que recebe o resultado da coleta e atualiza a interface (thread do Tk).
+        interval (int): Intervalo (ms) entre o fim de uma atualização e o início da próxima,
+            ou None para atualizar apenas sob demanda.
+        future (Future): Coleta em andamento (ou None).
+        pending (bool): Indica que uma atualização foi pedida durante a coleta em andamento.
+        timer (str): Handle do `after` agendado para esta fonte (ou None).
+        stage (str): Nome da fonte no profiler, sem o sufixo que identifica a instância
+            (p.ex. "process_details" para "process_details:1234:...").
+        dropped (int): Ticks perdidos desde a última atualização aplicada.
+        cost (float): Média móvel da duração das coletas (s), ou None antes da primeira.
+        visible (bool): A view da fonte está visível (aba selecionada, janela não minimizada).
+        background (bool): Continua coletando enquanto oculta (só a atualização da interface
+            é adiada).
+        stale (bool): Uma coleta terminou enquanto a fonte estava oculta e não foi aplicada.
+    """
+
+    def __init__(self, name, collect, apply, interval, background=False):
+        self.name = name
+        self.collect = collect
+        self.apply = apply
+        self.interval = interval
+        self.future = None
+        self.pending = False
+        self.timer = None
+        self.stage = name.split(":")[0]
+        self.dropped = 0
+        self.cost = None
+        self.visible = True
+        self.background = background
+        self.stale = False
+
+    @property
+    def paused(self):
+        """
+        Indica se as coletas periódicas da fonte estão suspensas (view oculta).
+        """
+        return not self.visible and not self.background
+
+
+class RefreshScheduler:
+    """
+    Agendador central das atualizações periódicas das views.
+
+    Garante no máximo uma coleta em andamento por fonte de dados: pedidos de atualização
+    feitos durante uma coleta são agrupados em uma única nova coleta ao final dela. Cada
+    fonte tem seu próprio intervalo, e os handles do `after` de uma fonte são cancelados
+    quando ela é removida (p.ex. quando a janela que a registrou é fechada).
+
+    Os tempos de coleta e de atualização da interface de cada fonte são registrados no
+    `profiler` (etapas "<fonte>.collect" e "<fonte>.apply"), junto com os ticks perdidos:
+    pedidos descartados por já haver uma atualização pendente e, nas fontes periódicas,
+    intervalos inteiros consumidos pela própria atualização.
+
+    O intervalo efetivo de cada fonte periódica se adapta ao custo medido das coletas:
+        - o orçamento de CPU (`cpu_budget`, fração de um núcleo) é dividido entre as fontes
+          periódicas ativas, e o intervalo de uma fonte cresce até que custo/intervalo caiba
+          na sua parte (limitado a `MAX_INTERVAL_MS`);
+        - fontes ocultas (aba não selecionada, janela minimizada) não são coletadas, exceto
+          as registradas com `background=True`;
+        - sem foco na aplicação, os intervalos são multiplicados por
+          `UNFOCUSED_INTERVAL_FACTOR`; ao recuperar o foco, as fontes visíveis são
+          atualizadas imediatamente.
+    """
+
+    def __init__(self, widget, max_workers=4, cpu_budget=CPU_BUDGET):
+        """
+        Parâmetros:
+            widget (tk.Misc): Widget usado para agendar callbacks na thread do Tk.
+            max_workers (int): Quantidade de threads de coleta.
+            cpu_budget (float): Fração de um núcleo disponível para as coletas periódicas.
+        """
+        self.widget = widget
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.sources = {}
+        self.cpu_budget = cpu_budget
+        self.focused = True
+
+    def register(self, name, collect, apply, interval=1000, start=True, background=False):
+        """
+        Registra uma fonte de dados e, opcionalmente, inicia sua primeira coleta.
+
+        Parâmetros:
+            name (str): Nome único da fonte.
+            collect (callable): Função de coleta (sem argumentos), executada em background.
+            apply (callable): Função chamada na thread do Tk com o resultado da coleta.
+            interval (int): Intervalo (ms) entre atualizações, ou None para atualizar só sob demanda.
+            start (bool): Inicia a primeira coleta imediatamente.
+            background (bool): Continua coletando enquanto a view está oculta.
+        """
+        self.unregister(name)
+        self.sources[name] = RefreshSource(name, collect, apply, interval, background)
+        if start:
+            self.request(name)
+
+    def unregister(self, name):
+        """
+        Remove uma fonte de dados, cancelando os callbacks agendados para ela.
+
+        Uma coleta já em andamento termina em background, mas seu resultado é descartado.
+        """
+        source = self.sources.pop(name, None)
+        if source is not None:
+            self._cancel_timer(source)
+
+    def unregister_all(self, prefix):
+        """
+        Remove todas as fontes cujo nome começa com `prefix`.
+        """
+        for name in [name for name in self.sources if name.startswith(prefix)]:
+            self.unregister(name)
+
+    def set_interval(self, name, interval):
+        """
+        Altera o intervalo base de atualização de uma fonte (vale a partir do próximo
+        agendamento; o intervalo efetivo ainda se adapta ao custo e ao foco).
+        """
+        source = self.sources.get(name)
+        if source is not None:
+            source.interval = interval
+
+    def effective_interval(self, name):
+        """
+        Retorna o intervalo (ms) usado no próximo agendamento de uma fonte periódica.
+
+        O intervalo base é multiplicado sem foco e aumentado até que a coleta, com o custo
+        médio medido, use no máximo a parte da fonte no orçamento de CPU.
+        """
+        source = self.sources.get(name)
+        if source is None or source.interval is None:
+            return None
+        interval = source.interval
+        if not self.focused:
+            interval *= UNFOCUSED_INTERVAL_FACTOR
+        if source.cost and self.cpu_budget:
+            active = sum(1 for other in self.sources.values() if other.interval is not None and not other.paused)
+            budget = self.cpu_budget / max(1, active)
+            interval = max(interval, min(source.cost * 1000 / budget, MAX_INTERVAL_MS))
+        return int(interval)
+
+    def set_visible(self, name, visible):
+        """
+        Informa se a view de uma fonte está visível.
+
+        Ao ocultar, as coletas periódicas são suspensas (exceto em fontes `background`);
+        ao exibir novamente, a fonte é atualizada imediatamente.
+        """
+        source = self.sources.get(name)
+        if source is None or source.visible == visible:
+            return
+        source.visible = visible
+        if not visible:
+            if source.paused and source.future is None:
+                self._cancel_timer(source)  # Com uma coleta em andamento, o timer é o do `_poll`
+        elif source.stale or not source.background:
+            source.stale = False
+            self.request(name)
+
+    def set_visible_all(self, prefix, visible):
+        """
+        Aplica `set_visible` a todas as fontes cujo nome começa com `prefix`.
+        """
+        for name in [name for name in self.sources if name.startswith(prefix)]:
+            self.set_visible(name, visible)
+
+    def track_focus(self, window):
+        """
+        Acompanha o foco de uma janela (Tk ou Toplevel) da aplicação com `set_focused`.
+
+        A verificação é adiada para quando o Tk estiver ocioso: a troca de foco entre dois
+        widgets da aplicação gera um FocusOut seguido de um FocusIn.
+        """
+        def check(event):
+            try:
+                focused = window.focus_displayof() is not None
+            except (KeyError, tk.TclError):
+                focused = True  # Widget com foco sem nome Tk (p.ex. lista do Combobox)
+            self.set_focused(focused)
+
+        for sequence in ("<FocusIn>", "<FocusOut>"):
+            window.bind(sequence, lambda event: window.after_idle(check, event), add="+")
+
+    def set_focused(self, focused):
+        """
+        Informa se a aplicação tem o foco do teclado.
+
+        Sem foco, os intervalos são multiplicados por `UNFOCUSED_INTERVAL_FACTOR`; ao
+        recuperar o foco, as fontes periódicas visíveis são atualizadas imediatamente.
+        """
+        if focused == self.focused:
+            return
+        self.focused = focused
+        if focused:
+            for source in list(self.sources.values()):
+                if source.interval is not None and source.visible:
+                    self.request(source.name)
+
+    def request(self, name):
+        """
+        Pede uma atualização imediata de uma fonte.
+
+        Se já houver uma coleta em andamento, o pedido é agrupado: uma única nova coleta
+        é iniciada quando a atual terminar, independentemente de quantos pedidos chegarem.
+        Pode ser chamado pela própria função `apply` da fonte (p.ex. para continuar uma
+        listagem exibida em partes).
+        """
+        source = self.sources.get(name)
+        if source is None:
+            return
+        if source.future is not None:
+            if source.pending:
+                source.dropped += 1  # Já há uma atualização pendente: este pedido é descartado
+            source.pending = True
+            return
+        self._cancel_timer(source)
+        try:
+            source.future = self.executor.submit(self._collect, source)
+        except RuntimeError:
+            return  # Executor encerrado (aplicação finalizando)
+        source.timer = self.widget.after(POLL_INTERVAL_MS, self._poll, source)
+
+    def shutdown(self):
+        """
+        Remove todas as fontes e encerra as threads de coleta.
+        """
+        for name in list(self.sources):
+            self.unregister(name)
+        self.executor.shutdown(wait=False)
+
+    def _poll(self, source):
+        """
+        Verifica o término da coleta de uma fonte e aplica seu resultado na interface.
+        """
+        source.timer = None
+        if self.sources.get(source.name) is not source:
+            return  # Fonte removida enquanto a coleta estava em andamento
+        if not source.future.done():
+            source.timer = self.widget.after(POLL_INTERVAL_MS, self._poll, source)
+            return
+
+        future, source.future = source.future, None
+        try:
+            result, collect_time = future.result()
+            source.cost = collect_time if source.cost is None else \
+                source.cost + COST_SMOOTHING * (collect_time - source.cost)
+            if source.visible:
+                with profiler.stage(f"{source.stage}.apply") as stage:
+                    source.apply(result)
+                if source.interval:
+                    source.dropped += int((collect_time + stage.elapsed) * 1000 // source.interval)
+                profiler.record_tick(source.stage, collect_time, stage.elapsed, source.dropped)
+                source.dropped = 0
+            else:
+                source.stale = True  # Aplicada quando a view voltar a ser exibida
+        except Exception:
+            print(f"RefreshScheduler - {source.name}: Erro ao atualizar os dados")
+            traceback.print_exc()
+
+        if source.future is not None:
+            source.pending = False  # A atualização já pediu uma nova coleta (ver `request`)
+        elif source.pending:
+            source.pending = False
+            self.request(source.name)
+        elif source.interval is not None and not source.paused:
+            source.timer = self.widget.after(self.effective_interval(source.name), self.request, source.name)
+
+    def _collect(self, source):
+        """
+        Executa a coleta de uma fonte (thread de background), medindo sua duração.
+
+        Retorno:
+            tuple: (resultado da coleta, duração em segundos)
+        """
+        with profiler.stage(f"{source.stage}.collect") as stage:
+            result = source.collect()
+        return result, stage.elapsed
+
+    def _cancel_timer(self, source):
+        """
+        Cancela o callback do `after` agendado para a fonte, se houver.
+        """
+        if source.timer is not None:
+            try:
+                self.widget.after_cancel(source.timer)
+            except Exception:
+                pass  # Widget já destruído
+            source.timer = None
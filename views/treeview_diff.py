@@ -0,0 +1,68 @@
+from services.profiling_service import profiler
+
+
+class TreeviewDiffer:
+    """
+    Atualiza uma Treeview de forma incremental, usando uma chave estável como iid de cada linha.
+
+    A cada atualização, apenas as linhas novas são inseridas, as linhas cujos valores mudaram
+    são alteradas e as linhas que deixaram de existir são removidas. Como os itens existentes
+    são preservados, a seleção e a posição de rolagem do usuário são mantidas.
+
+    Atributos:
+        tree (ttk.Treeview): Treeview controlada.
+        rows (dict): Valores atualmente exibidos, indexados pelo iid da linha.
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.rows = {}
+        self.order = []
+
+    @profiler.timed("ui.treeview_diff.update")
+    def update(self, rows):
+        """
+        Aplica um novo conjunto de linhas à Treeview.
+
+        Parâmetros:
+            rows (iterable): Pares (chave, valores) na ordem em que devem ser exibidos.
+                Chaves repetidas são ignoradas após a primeira ocorrência.
+        """
+        tree = self.tree
+        old_rows = self.rows
+        new_rows = {}
+        inserted = []
+        for key, values in rows:
+            iid = str(key)
+            if iid in new_rows:
+                continue
+            values = tuple(values)
+            new_rows[iid] = values
+            previous = old_rows.get(iid)
+            if previous is None:
+                tree.insert("", "end", iid=iid, values=values)
+                inserted.append(iid)
+            elif previous != values:
+                tree.item(iid, values=values)
+
+        removed = [iid for iid in old_rows if iid not in new_rows]
+        if removed:
+            tree.delete(*removed)
+
+        # Reordena com uma única chamada apenas se a ordem desejada mudou
+        order = list(new_rows)
+        current_order = [iid for iid in self.order if iid in new_rows] + inserted
+        if current_order != order:
+            tree.set_children("", *order)
+
+        self.rows = new_rows
+        self.order = order
+
+    def clear(self):
+        """
+        Remove todas as linhas da Treeview.
+        """
+        if self.rows:
+            self.tree.delete(*self.rows)
+        self.rows = {}
+        self.order = []
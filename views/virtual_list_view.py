@@ -0,0 +1,254 @@
+from tkinter import ttk
+from models.columnar_store_model import ColumnarStore
+from services.profiling_service import profiler
+from .treeview_diff import TreeviewDiffer
+
+
+class VirtualList(ttk.Frame):
+    """
+    Lista virtualizada baseada em uma Treeview que materializa apenas as linhas visíveis.
+
+    O conjunto completo de dados fica em um `ColumnarStore`; a Treeview contém somente as
+    linhas da janela visível mais uma pequena margem (overscan). A barra de rolagem vertical
+    mapeia sua posição para um deslocamento no conjunto de dados, e a ordenação (clique no
+    cabeçalho) e a filtragem são feitas no store, não nos itens do widget.
+
+    Atributos:
+        tree (ttk.Treeview): Treeview interna (para configurar cabeçalhos e colunas).
+        store (ColumnarStore): Dados completos da lista.
+        offset (int): Posição, na visão do store, da primeira linha exibida.
+    """
+
+    def __init__(self, parent, columns, height=15, overscan=10, formatters=None, sort_command=None,
+                 view_command=None, **kwargs):
+        """
+        Parâmetros:
+            parent (tk.Widget): Widget pai.
+            columns (tuple): Nomes das colunas.
+            height (int): Quantidade inicial de linhas visíveis.
+            overscan (int): Linhas extras materializadas abaixo da janela visível.
+            formatters (dict): Funções de formatação por coluna, aplicadas somente às linhas exibidas.
+            sort_command (callable): Se informado, o clique no cabeçalho chama
+                `sort_command(coluna, decrescente)` em vez de ordenar localmente (p.ex. para
+                ordenar no coletor); os dados recebidos são exibidos na ordem em que chegam.
+            view_command (callable): Chamado sem argumentos após cada renderização, para que
+                o dono da lista carregue sob demanda os dados das linhas exibidas (ver
+                `visible_keys`).
+        """
+        super().__init__(parent, **kwargs)
+        self.store = ColumnarStore(columns)
+        self.offset = 0
+        self.visible = height
+        self.overscan = overscan
+        self.formatters = formatters or {}
+        self.sort_command = sort_command
+        self.view_command = view_command
+        self.sort_state = (None, False)  # (coluna, decrescente) exibido nos cabeçalhos
+        self.selected = None  # Chave da linha selecionada, mesmo fora da janela visível
+
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=height)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        scrollbar_x = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
+        scrollbar_x.grid(row=1, column=0, sticky="ew")
+        self.tree.configure(xscrollcommand=scrollbar_x.set)
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        for column in columns:
+            self.tree.heading(column, text=column, command=lambda c=column: self.toggle_sort(c))
+
+        self.rows = TreeviewDiffer(self.tree)
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", self.on_mousewheel)
+        self.tree.bind("<Button-5>", self.on_mousewheel)
+        self.tree.bind("<Up>", lambda e: self.move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self.move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self.move_selection(-self.visible))
+        self.tree.bind("<Next>", lambda e: self.move_selection(self.visible))
+
+    def set_rows(self, keys, rows):
+        """
+        Substitui os dados da lista, mantendo ordenação, filtro, rolagem e seleção.
+
+        Parâmetros:
+            keys (list): Chave única de cada linha.
+            rows (list): Tuplas com os valores brutos de cada linha.
+        """
+        self.store.load(keys, rows)
+        self.render()
+
+    def set_columns(self, keys, data):
+        """
+        Substitui os dados da lista a partir de colunas já prontas (ver `ColumnarStore.load_columns`).
+
+        Parâmetros:
+            keys (sequence): Chave única de cada linha.
+            data (dict): Sequência de valores brutos de cada coluna, indexada pelo nome.
+        """
+        self.store.load_columns(keys, data)
+        self.render()
+
+    def sort_by(self, column, reverse=False):
+        """
+        Ordena a lista pela coluna informada.
+        """
+        self.store.set_sort(column, reverse)
+        self.render()
+
+    def toggle_sort(self, column):
+        """
+        Ordena pela coluna clicada; um novo clique na mesma coluna inverte a ordem.
+        """
+        current, current_reverse = self.sort_state
+        reverse = current == column and not current_reverse
+        self.sort_state = (column, reverse)
+        self.update_sort_indicator()
+        if self.sort_command is not None:
+            self.sort_command(column, reverse)
+        else:
+            self.sort_by(column, reverse)
+
+    @profiler.timed("ui.virtual_list.update_sort_indicator")
+    def update_sort_indicator(self):
+        """
+        Marca no cabeçalho a coluna e o sentido da ordenação atual.
+        """
+        column, reverse = self.sort_state
+        for name in self.store.columns:
+            text = self.tree.heading(name, "text").rstrip(" ▲▼")
+            if name == column:
+                text += " ▼" if reverse else " ▲"
+            self.tree.heading(name, text=text)
+
+    def set_filter(self, predicate):
+        """
+        Filtra as linhas exibidas (ver `ColumnarStore.set_filter`).
+        """
+        self.store.set_filter(predicate)
+        self.offset = 0
+        self.render()
+
+    def reset_view(self):
+        """
+        Volta a janela visível para o início e limpa a seleção (ex: ao trocar de diretório).
+        """
+        self.offset = 0
+        self.selected = None
+        self.rows.clear()
+
+    def visible_keys(self):
+        """
+        Retorna as chaves das linhas materializadas (janela visível mais o overscan).
+        """
+        end = min(len(self.store), self.offset + self.visible + self.overscan)
+        return [self.store.key(position) for position in range(self.offset, end)]
+
+    def selected_key(self):
+        """
+        Retorna a chave da linha selecionada, ou None.
+        """
+        return self.selected
+
+    @profiler.timed("ui.virtual_list.render")
+    def render(self):
+        """
+        Materializa na Treeview apenas as linhas da janela visível (mais o overscan).
+        """
+        total = len(self.store)
+        self.offset = max(0, min(self.offset, total - self.visible))
+        end = min(total, self.offset + self.visible + self.overscan)
+        store, formatters = self.store, self.formatters
+        columns = store.columns
+        rows = []
+        for position in range(self.offset, end):
+            values = store.row(position)
+            if formatters:
+                values = tuple(
+                    formatters[column](value) if column in formatters else value
+                    for column, value in zip(columns, values)
+                )
+            rows.append((store.key(position), values))
+        self.rows.update(rows)
+
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+        if self.selected is not None and str(self.selected) in self.rows.rows:
+            iid = str(self.selected)
+            if self.tree.selection() != (iid,):
+                self.tree.selection_set(iid)
+
+        if self.view_command is not None:
+            self.view_command()
+
+    def scroll_to(self, offset):
+        """
+        Move a janela visível para o deslocamento informado.
+        """
+        offset = max(0, min(int(offset), len(self.store) - self.visible))
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def on_scrollbar(self, *args):
+        """
+        Converte os comandos da barra de rolagem em deslocamentos no conjunto de dados.
+        """
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * len(self.store))
+        elif args[0] == "scroll":
+            step = self.visible if args[2] == "pages" else 1
+            self.scroll_to(self.offset + int(args[1]) * step)
+
+    def on_mousewheel(self, event):
+        """Handler para rolagem com o mouse sobre a lista."""
+        if event.num == 4:  # Sistemas Unix (Scroll para cima)
+            self.scroll_to(self.offset - 3)
+        elif event.num == 5:  # Sistemas Unix (Scroll para baixo)
+            self.scroll_to(self.offset + 3)
+        else:  # Sistemas Windows/Mac (MouseWheel)
+            self.scroll_to(self.offset - 3 * int(event.delta / 120))
+        return "break"  # Impede que a rolagem também mova o Canvas da janela
+
+    def on_resize(self, event):
+        """
+        Recalcula a quantidade de linhas visíveis quando a Treeview muda de altura.
+        """
+        row_height = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+        visible = max(1, (event.height - row_height) // row_height)  # Desconta o cabeçalho
+        if visible != self.visible:
+            self.visible = visible
+            self.render()
+
+    def on_select(self, event):
+        """
+        Guarda a chave da linha selecionada para preservá-la durante a rolagem.
+        """
+        selection = self.tree.selection()
+        if selection:
+            self.selected = selection[0]
+
+    def move_selection(self, step):
+        """
+        Move a seleção pelo teclado, rolando a janela quando necessário.
+        """
+        total = len(self.store)
+        if not total:
+            return "break"
+        position = self.store.position_of(self.selected) if self.selected is not None else None
+        position = 0 if position is None else max(0, min(position + step, total - 1))
+        if position < self.offset:
+            self.offset = position
+        elif position >= self.offset + self.visible:
+            self.offset = position - self.visible + 1
+        self.selected = str(self.store.key(position))
+        self.render()
+        self.tree.focus(self.selected)
+        self.tree.see(self.selected)
+        return "break"